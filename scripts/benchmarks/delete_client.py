@@ -0,0 +1,116 @@
+"""Benchmark deleting a client that owns a large number of tickets.
+
+Runs against the database configured in `.env`. Every run creates its own
+client and tickets and hard-deletes them afterwards, so it is safe on a dev
+database.
+
+    python scripts/benchmarks/delete_client.py --tickets 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import selectinload
+
+from src.clients.models import Client
+from src.clients.service import ClientService
+from src.database.session import async_session, engine
+from src.tickets.models import Ticket, TicketStatus
+from src.users.models import User  # noqa: F401
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.count += 1
+
+
+async def create_client_with_tickets(ticket_count: int) -> int:
+    async with async_session() as session:
+        client = Client(
+            full_name="Benchmark Client",
+            email="benchmark.delete@example.com",
+            phone="+10000000000",
+        )
+        session.add(client)
+        await session.flush()
+
+        await session.execute(
+            insert(Ticket),
+            [
+                {
+                    "title": f"Benchmark ticket {i}",
+                    "description": "Generated by delete_client benchmark",
+                    "status": TicketStatus.NEW,
+                    "client_id": client.id,
+                }
+                for i in range(ticket_count)
+            ],
+        )
+        await session.commit()
+        return client.id
+
+
+async def delete_with_service(client_id: int) -> None:
+    async with async_session() as session:
+        await ClientService(session).delete_client(client_id)
+
+
+async def delete_with_loaded_tickets(client_id: int) -> None:
+    """Previous behaviour: the tickets collection is loaded and deleted row by row."""
+    async with async_session() as session:
+        client = await session.scalar(
+            select(Client).where(Client.id == client_id).options(selectinload(Client.tickets))
+        )
+        await session.delete(client)
+        await session.commit()
+
+
+async def run(label: str, delete_client, ticket_count: int) -> None:
+    client_id = await create_client_with_tickets(ticket_count)
+
+    counter = StatementCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    try:
+        start = time.perf_counter()
+        await delete_client(client_id)
+        elapsed = time.perf_counter() - start
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+    async with async_session() as session:
+        remaining = await session.scalar(select(func.count()).select_from(Ticket).where(Ticket.client_id == client_id))
+        await session.execute(delete(Client).where(Client.id == client_id).execution_options(include_deleted=True))
+        await session.commit()
+
+    print(f"{label:<22} {elapsed * 1000:>10.1f} ms {counter.count:>8} statements {remaining:>6} tickets left")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickets", type=int, default=10_000, help="Tickets owned by the deleted client")
+    parser.add_argument("--compare", action="store_true", help="Also time the ORM-loaded cascade delete")
+    args = parser.parse_args()
+
+    engine.echo = False
+
+    print(f"🗑️  Deleting a client with {args.tickets} tickets")
+    print("=" * 64)
+    await run("ClientService", delete_with_service, args.tickets)
+    if args.compare:
+        await run("ORM-loaded cascade", delete_with_loaded_tickets, args.tickets)
+    print("=" * 64)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Load test direct Postgres connections against PgBouncer transaction pooling.
+
+Starts many worker processes, like uvicorn workers, each running concurrent
+ticket-list queries through the app's engine for a fixed time. Each target
+is run at every worker count; direct targets use the regular engine
+settings, PgBouncer targets use DATABASE_PGBOUNCER_MODE.
+
+    python scripts/benchmarks/pgbouncer_load.py \\
+        --direct-url postgresql+psycopg://postgres@localhost:5432/repair_crm_db \\
+        --pgbouncer-url postgresql+psycopg://postgres@localhost:6432/repair_crm_db \\
+        --workers 4 16 64
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def run_worker(url: str, pgbouncer: bool, concurrency: int, duration: float, results) -> None:
+    os.environ["DATABASE_PGBOUNCER_MODE"] = "true" if pgbouncer else "false"
+    os.environ["ENVIRONMENT"] = "prod"
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from src.clients.models import Client  # noqa: F401
+    from src.database.session import build_engine
+    from src.tickets.repository import TicketRepository
+    from src.users.models import User  # noqa: F401
+
+    async def main() -> tuple[int, int]:
+        engine = build_engine(url)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        deadline = time.perf_counter() + duration
+        completed = errors = 0
+
+        async def client() -> None:
+            nonlocal completed, errors
+            while time.perf_counter() < deadline:
+                try:
+                    async with session_factory() as session:
+                        await TicketRepository(session).get_all(limit=10)
+                    completed += 1
+                except Exception:
+                    errors += 1
+                    await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        await engine.dispose()
+        return completed, errors
+
+    results.put(asyncio.run(main()))
+
+
+def run(label: str, url: str, pgbouncer: bool, workers: int, concurrency: int, duration: float) -> None:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=run_worker, args=(url, pgbouncer, concurrency, duration, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    completed = errors = 0
+    for _ in processes:
+        worker_completed, worker_errors = results.get()
+        completed += worker_completed
+        errors += worker_errors
+    for process in processes:
+        process.join()
+
+    print(f"{label:<10} {workers:>4} workers {completed / duration:>10.0f} req/s {errors:>8} errors")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--direct-url", required=True, help="Database URL connecting straight to Postgres")
+    parser.add_argument("--pgbouncer-url", help="Database URL connecting through PgBouncer")
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 16, 64], help="Worker process counts")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests per worker")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    args = parser.parse_args()
+
+    targets = [("direct", args.direct_url, False)]
+    if args.pgbouncer_url:
+        targets.append(("pgbouncer", args.pgbouncer_url, True))
+
+    print(f"🔌 Ticket list throughput, {args.concurrency} concurrent requests per worker")
+    print("=" * 64)
+    for workers in args.workers:
+        for label, url, pgbouncer in targets:
+            run(label, url, pgbouncer, workers, args.concurrency, args.duration)
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark the request logging middleware on `GET /health`.
+
+Calls a FastAPI app with the `/health` route straight through ASGI, so the
+numbers are framework and middleware overhead only, with no network or
+server in between. Compares no middleware, the previous
+`BaseHTTPMiddleware` version and the pure ASGI `LoggingMiddleware`, with
+INFO logging enabled (to a queue drained by a null handler, every request
+or a sample of them) and disabled.
+
+    python scripts/benchmarks/request_logging.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message
+
+from src.core.logging import DropOldestQueue, LogQueueListener, RequestSampler, StructuredQueueHandler
+from src.middleware.logging import LoggingMiddleware, logger
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """The middleware before the rewrite, for comparison."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        start_time = time.time()
+
+        logger.info(
+            f"Request started: {request.method} {request.url.path}",
+            extra={
+                "method": request.method,
+                "path": request.url.path,
+                "query_params": str(request.query_params),
+                "client_host": request.client.host if request.client else None,
+            },
+        )
+
+        response = await call_next(request)
+
+        process_time = time.time() - start_time
+
+        logger.info(
+            f"Request completed: {response.status_code} in {process_time:.4f}s",
+            extra={
+                "status_code": response.status_code,
+                "process_time": process_time,
+                "path": request.url.path,
+            },
+        )
+
+        response.headers["X-Process-Time"] = f"{process_time:.4f}"
+
+        return response
+
+
+def build_app(middleware: type | None, **options) -> ASGIApp:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check() -> dict[str, str]:
+        return {"status": "healthy", "environment": "benchmark", "version": "1.0.0"}
+
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/health",
+    "raw_path": b"/health",
+    "query_string": b"",
+    "headers": [(b"host", b"localhost")],
+    "client": ("127.0.0.1", 50000),
+    "server": ("localhost", 80),
+}
+
+
+async def request(app: ASGIApp) -> None:
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    await app(dict(SCOPE), receive, send)
+
+
+async def measure(label: str, app: ASGIApp, requests: int) -> None:
+    for _ in range(min(requests, 1_000)):
+        await request(app)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {requests / elapsed:>10,.0f} req/s {elapsed / requests * 1e6:>8.1f} µs/request")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests per measurement")
+    args = parser.parse_args()
+
+    log_queue = DropOldestQueue(10_000)
+    listener = LogQueueListener(log_queue, logging.NullHandler())
+    listener.start()
+    logger.addHandler(StructuredQueueHandler(log_queue))
+    logger.propagate = False
+    every_request = RequestSampler(success_rate=1, slow_seconds=60)
+    sampled = RequestSampler(success_rate=0.1, slow_seconds=60)
+
+    print(f"🩺 GET /health, {args.requests} requests per run")
+    print("=" * 64)
+    await measure("no middleware", build_app(None), args.requests)
+    for level, label in ((logging.INFO, "INFO on"), (logging.WARNING, "INFO off")):
+        logger.setLevel(level)
+        await measure(f"BaseHTTPMiddleware, {label}", build_app(BaseHTTPLoggingMiddleware), args.requests)
+        await measure(f"pure ASGI, {label}", build_app(LoggingMiddleware, sampler=every_request), args.requests)
+    logger.setLevel(logging.INFO)
+    await measure("pure ASGI, INFO on, 10%", build_app(LoggingMiddleware, sampler=sampled), args.requests)
+    listener.stop()
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
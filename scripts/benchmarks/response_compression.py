@@ -0,0 +1,70 @@
+"""Benchmark the CPU cost of compressing 100-item list pages against the bytes it saves.
+
+Pages are rendered the way the API renders them (see
+`response_serialization.py`) and compressed with gzip at levels 1, 6 and 9
+and, when the `brotli` package is installed, brotli at qualities 1, 4, 6
+and 11. Levels at or above the middleware's thread levels are marked:
+`CompressionMiddleware` runs those in a worker thread.
+
+    python scripts/benchmarks/response_compression.py --rounds 200
+"""
+
+import argparse
+import asyncio
+import gzip
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from response_serialization import CASES
+
+from src.middleware.compression import BROTLI_THREAD_QUALITY, GZIP_THREAD_LEVEL, brotli
+
+COMPRESSORS: dict[str, tuple[Callable[[bytes], bytes], bool]] = {
+    f"gzip {level}": (partial(gzip.compress, compresslevel=level, mtime=0), level >= GZIP_THREAD_LEVEL)
+    for level in (1, 6, 9)
+}
+if brotli is not None:
+    COMPRESSORS |= {
+        f"br {quality}": (partial(brotli.compress, quality=quality), quality >= BROTLI_THREAD_QUALITY)
+        for quality in (1, 4, 6, 11)
+    }
+
+
+def measure(compress: Callable[[bytes], bytes], body: bytes, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        compress(body)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200, help="Compressions per measurement")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("brotli is not installed, measuring gzip only (pip install brotli)")
+
+    for name, (_, render) in CASES.items():
+        body = await render()
+        print(f"\n📦 {name}: {len(body):,} bytes")
+        print("=" * 64)
+        print(f"{'':<10} {'bytes':>10} {'saved':>8} {'time':>12} {'MB/s':>8}")
+        for label, (compress, in_thread) in COMPRESSORS.items():
+            size = len(compress(body))
+            elapsed = measure(compress, body, args.rounds)
+            marker = " (thread)" if in_thread else ""
+            print(
+                f"{label:<10} {size:>10,} {1 - size / len(body):>7.1%} {elapsed:>9.0f} µs "
+                f"{len(body) / elapsed:>8.0f}{marker}"
+            )
+        print("=" * 64)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,199 @@
+"""Benchmark building and serializing 100-item pages of tickets, clients and users.
+
+Compares, per item:
+
+- `validated`: output models built with validation (`model_validate`, or the
+  constructor for tickets), then checked and serialized again by FastAPI's
+  `response_model` handling and rendered by `JSONResponse`, as before;
+- `trusted`: models built with `model_construct` (`src.core.responses.construct`)
+  and rendered by `ModelResponse`, pydantic-core's JSON serializer, with no
+  `response_model` pass.
+
+Rows are in-memory ORM objects, so no database is involved.
+
+    python scripts/benchmarks/response_serialization.py --pages 200
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from src.clients.models import Client
+from src.clients.schemas import ClientListResponse, ClientResponse
+from src.core.responses import ModelResponse, construct
+from src.tickets.models import Ticket, TicketPriority, TicketStatus
+from src.tickets.schemas import ClientInfo, TicketListItem, TicketListResponse, TicketResponse, WorkerInfo
+from src.users.models import User, UserRole
+from src.users.schemas import UserListResponse, UserResponse
+
+PAGE_SIZE = 100
+NOW = datetime(2026, 3, 1, 12, 0)
+
+clients = [
+    Client(
+        id=i,
+        full_name=f"Client Number {i}",
+        email=f"client.{i}@example.com",
+        phone="+380501234567",
+        address=f"{i} Repair Street, Kyiv",
+    )
+    for i in range(PAGE_SIZE)
+]
+users = [
+    User(id=i, email=f"worker.{i}@example.com", full_name=f"Worker Number {i}", role=UserRole.WORKER, is_active=True)
+    for i in range(PAGE_SIZE)
+]
+tickets = [
+    Ticket(
+        id=i,
+        title=f"Boiler {i} does not heat water",
+        description="The boiler turns on but the water stays cold after an hour. " * 3,
+        status=TicketStatus.IN_PROGRESS,
+        priority=TicketPriority.HIGH,
+        due_at=NOW + timedelta(days=2),
+        tags=["device:boiler", "urgency:high"],
+        custom_fields={"serial_number": f"SN-{i:06}", "visit_count": 2},
+        created_at=NOW,
+        updated_at=NOW,
+        client_id=i,
+        assigned_worker_id=i,
+    )
+    for i in range(PAGE_SIZE)
+]
+
+
+def page(key: str, items: list) -> dict:
+    return {key: items, "total_count": 10_000, "page": 1, "per_page": PAGE_SIZE, "total_pages": 100}
+
+
+async def render_validated(envelope: type[BaseModel], content: BaseModel) -> bytes:
+    field = create_response_field(name=f"Response_{envelope.__name__}", type_=envelope, mode="serialization")
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+def ticket_detail_validated(ticket: Ticket) -> TicketResponse:
+    return TicketResponse(
+        **{
+            name: getattr(ticket, name)
+            for name in TicketResponse.model_fields
+            if name not in ("client", "assigned_worker")
+        },
+        client=ClientInfo.model_validate(clients[ticket.client_id]),
+        assigned_worker=WorkerInfo.model_validate(users[ticket.assigned_worker_id]),
+    )
+
+
+def ticket_detail_trusted(ticket: Ticket) -> TicketResponse:
+    return construct(
+        TicketResponse,
+        ticket,
+        client=construct(ClientInfo, clients[ticket.client_id]),
+        assigned_worker=construct(WorkerInfo, users[ticket.assigned_worker_id]),
+    )
+
+
+def ticket_item(ticket: Ticket, trusted: bool) -> TicketListItem:
+    build = TicketListItem.model_construct if trusted else TicketListItem
+    return build(
+        **{name: getattr(ticket, name) for name in TicketListItem.model_fields if not name.endswith("full_name")},
+        client_full_name=clients[ticket.client_id].full_name,
+        assigned_worker_full_name=users[ticket.assigned_worker_id].full_name,
+    )
+
+
+class TicketDetailPage(BaseModel):
+    tickets: list[TicketResponse]
+    total_count: int
+    page: int
+    per_page: int
+    total_pages: int
+
+
+async def ticket_details_validated() -> bytes:
+    content = TicketDetailPage(**page("tickets", [ticket_detail_validated(t) for t in tickets]))
+    return await render_validated(TicketDetailPage, content)
+
+
+async def ticket_details_trusted() -> bytes:
+    items = [ticket_detail_trusted(ticket) for ticket in tickets]
+    return ModelResponse(TicketDetailPage.model_construct(**page("tickets", items))).body
+
+
+async def ticket_list_validated() -> bytes:
+    items = [ticket_item(ticket, trusted=False) for ticket in tickets]
+    return await render_validated(TicketListResponse, TicketListResponse(**page("tickets", items)))
+
+
+async def ticket_list_trusted() -> bytes:
+    items = [ticket_item(ticket, trusted=True) for ticket in tickets]
+    return ModelResponse(TicketListResponse.model_construct(**page("tickets", items))).body
+
+
+async def client_list_validated() -> bytes:
+    items = [ClientResponse.model_validate(client) for client in clients]
+    return await render_validated(ClientListResponse, ClientListResponse(**page("clients", items)))
+
+
+async def client_list_trusted() -> bytes:
+    items = [construct(ClientResponse, client) for client in clients]
+    return ModelResponse(ClientListResponse.model_construct(**page("clients", items))).body
+
+
+async def user_list_validated() -> bytes:
+    items = [UserResponse.model_validate(user) for user in users]
+    return await render_validated(UserListResponse, UserListResponse(**page("users", items)))
+
+
+async def user_list_trusted() -> bytes:
+    items = [construct(UserResponse, user) for user in users]
+    return ModelResponse(UserListResponse.model_construct(**page("users", items))).body
+
+
+Render = Callable[[], Awaitable[bytes]]
+
+CASES: dict[str, tuple[Render, Render]] = {
+    "tickets (list)": (ticket_list_validated, ticket_list_trusted),
+    "tickets (detail)": (ticket_details_validated, ticket_details_trusted),
+    "clients": (client_list_validated, client_list_trusted),
+    "users": (user_list_validated, user_list_trusted),
+}
+
+
+async def measure(render: Render, pages: int) -> float:
+    for _ in range(min(pages, 20)):
+        await render()
+    start = time.perf_counter()
+    for _ in range(pages):
+        await render()
+    return (time.perf_counter() - start) / (pages * PAGE_SIZE) * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200, help="Pages rendered per measurement")
+    args = parser.parse_args()
+
+    print(f"📦 {PAGE_SIZE}-item pages, {args.pages} pages per measurement")
+    print("=" * 64)
+    print(f"{'':<18} {'validated':>12} {'trusted':>12} {'speedup':>10}")
+    for name, (validated, trusted) in CASES.items():
+        assert await validated() == await trusted(), f"{name}: outputs differ"
+        before = await measure(validated, args.pages)
+        after = await measure(trusted, args.pages)
+        print(f"{name:<18} {before:>9.1f} µs {after:>9.1f} µs {before / after:>9.1f}x")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
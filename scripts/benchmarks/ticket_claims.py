@@ -0,0 +1,196 @@
+"""Benchmark many workers claiming unassigned tickets at the same time.
+
+Runs against the database configured in `.env`. Every run creates its own
+client, workers and urgent tickets due in the past (so they are first in
+the queue) and hard-deletes them afterwards. Runs are meant for a dev
+database: each claimer stops once all benchmark tickets are taken, but
+other unassigned new tickets at the head of the queue could be claimed
+too.
+
+Strategies:
+
+- `skip-locked`: `TicketRepository.claim_next`, one UPDATE whose candidate
+  subquery uses FOR UPDATE SKIP LOCKED;
+- `for-update`: the same statement with a plain FOR UPDATE, so claimers
+  queue behind each other's row locks;
+- `list-assign`: read the first candidate, then assign it with a
+  conditional UPDATE and retry when another worker got there first, like
+  `GET /tickets` followed by `POST /tickets/{id}/assign`.
+
+    python scripts/benchmarks/ticket_claims.py --workers 100 --tickets 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.clients.models import Client
+from src.core.config import settings
+from src.tickets.models import Ticket, TicketPriority, TicketStatus
+from src.tickets.repository import QUEUE_ORDER, TicketRepository
+from src.users.models import User, UserRole
+
+DUE_AT = datetime(1970, 1, 1)
+
+Claim = Callable[[AsyncSession, int], Awaitable[int | None]]
+SessionFactory = async_sessionmaker[AsyncSession]
+
+
+async def claim_skip_locked(session: AsyncSession, worker_id: int) -> int | None:
+    ticket = await TicketRepository(session).claim_next(worker_id)
+    return ticket.id if ticket else None
+
+
+def _candidate():
+    return (
+        select(Ticket.id)
+        .where(Ticket.assigned_worker_id.is_(None), Ticket.status == TicketStatus.NEW)
+        .order_by(*QUEUE_ORDER)
+        .limit(1)
+    )
+
+
+async def claim_for_update(session: AsyncSession, worker_id: int) -> int | None:
+    claimed_id = await session.scalar(
+        update(Ticket)
+        .where(Ticket.id == _candidate().with_for_update().scalar_subquery())
+        .values(assigned_worker_id=worker_id, status=TicketStatus.IN_PROGRESS)
+        .returning(Ticket.id)
+    )
+    await session.commit()
+    return claimed_id
+
+
+async def claim_list_assign(session: AsyncSession, worker_id: int) -> int | None:
+    candidate_id = await session.scalar(_candidate())
+    if candidate_id is None:
+        return None
+
+    claimed_id = await session.scalar(
+        update(Ticket)
+        .where(Ticket.id == candidate_id, Ticket.assigned_worker_id.is_(None))
+        .values(assigned_worker_id=worker_id, status=TicketStatus.IN_PROGRESS)
+        .returning(Ticket.id)
+    )
+    await session.commit()
+    return claimed_id
+
+
+STRATEGIES: dict[str, Claim] = {
+    "skip-locked": claim_skip_locked,
+    "for-update": claim_for_update,
+    "list-assign": claim_list_assign,
+}
+
+
+async def create_fixtures(
+    session_factory: SessionFactory, worker_count: int, ticket_count: int
+) -> tuple[int, list[int], set[int]]:
+    async with session_factory() as session:
+        client = Client(full_name="Benchmark Client", email="benchmark.claims@example.com", phone="+10000000000")
+        workers = [
+            User(
+                email=f"benchmark.claims.{i}@example.com",
+                password="!",
+                full_name=f"Benchmark Worker {i}",
+                role=UserRole.WORKER,
+            )
+            for i in range(worker_count)
+        ]
+        session.add_all([client, *workers])
+        await session.flush()
+
+        ticket_ids = await session.scalars(
+            insert(Ticket).returning(Ticket.id),
+            [
+                {
+                    "title": f"Benchmark ticket {i}",
+                    "description": "Generated by ticket_claims benchmark",
+                    "status": TicketStatus.NEW,
+                    "priority": TicketPriority.URGENT,
+                    "due_at": DUE_AT + timedelta(seconds=i),
+                    "client_id": client.id,
+                }
+                for i in range(ticket_count)
+            ],
+        )
+        ticket_ids = set(ticket_ids)
+        await session.commit()
+        return client.id, [worker.id for worker in workers], ticket_ids
+
+
+async def drop_fixtures(session_factory: SessionFactory, client_id: int, worker_ids: list[int]) -> None:
+    async with session_factory() as session:
+        await session.execute(delete(Ticket).where(Ticket.client_id == client_id))
+        await session.execute(delete(Client).where(Client.id == client_id).execution_options(include_deleted=True))
+        await session.execute(delete(User).where(User.id.in_(worker_ids)))
+        await session.commit()
+
+
+async def run(session_factory: SessionFactory, label: str, claim: Claim, worker_count: int, ticket_count: int) -> None:
+    client_id, worker_ids, ticket_ids = await create_fixtures(session_factory, worker_count, ticket_count)
+    remaining = ticket_count
+    claims: Counter[int] = Counter()
+    misses = 0
+
+    async def worker(worker_id: int) -> None:
+        nonlocal remaining, misses
+        while remaining > 0:
+            # A session per claim, like one API request each.
+            async with session_factory() as session:
+                claimed_id = await claim(session, worker_id)
+            if claimed_id is None:
+                misses += 1
+                continue
+            claims[claimed_id] += 1
+            remaining -= 1
+
+    try:
+        start = time.perf_counter()
+        async with asyncio.TaskGroup() as group:
+            for worker_id in worker_ids:
+                group.create_task(worker(worker_id))
+        elapsed = time.perf_counter() - start
+    finally:
+        await drop_fixtures(session_factory, client_id, worker_ids)
+
+    duplicates = sum(count - 1 for count in claims.values() if count > 1)
+    foreign = len(set(claims) - ticket_ids)
+    print(
+        f"{label:<12} {sum(claims.values()) / elapsed:>9.0f} claims/s {misses:>8} retries "
+        f"{duplicates:>5} duplicates {foreign:>5} other tickets"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=100, help="Concurrent claiming workers")
+    parser.add_argument("--tickets", type=int, default=5_000, help="Tickets to claim per run")
+    parser.add_argument("--connections", type=int, default=50, help="Database connections shared by the workers")
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.database_url, pool_size=args.connections, max_overflow=0)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print(f"🎟️  {args.workers} workers claiming {args.tickets} tickets over {args.connections} connections")
+    print("=" * 76)
+    for name in args.strategies:
+        await run(session_factory, name, STRATEGIES[name], args.workers, args.tickets)
+    print("=" * 76)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""Benchmark date-range ticket filters with BRIN, btree and no index.
+
+Builds a scratch table shaped like `tickets` (rows inserted in creation
+order, `updated_at` trailing `created_at`), then for every index variant
+reports the index size and the median time of range counts over typical
+widths. The scratch table is dropped at the end.
+
+    python scripts/benchmarks/ticket_date_ranges.py --rows 2000000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.database.session import engine
+
+TABLE = "benchmark_ticket_ranges"
+START = datetime(2020, 1, 1)
+ROW_INTERVAL = timedelta(seconds=30)
+
+VARIANTS = {
+    "none": [],
+    "btree": [
+        f"CREATE INDEX {TABLE}_created_at ON {TABLE} (created_at)",
+        f"CREATE INDEX {TABLE}_updated_at ON {TABLE} (updated_at)",
+    ],
+    "brin": [
+        f"CREATE INDEX {TABLE}_created_at ON {TABLE} USING brin (created_at)",
+        f"CREATE INDEX {TABLE}_updated_at ON {TABLE} USING brin (updated_at)",
+    ],
+}
+
+WIDTHS = {
+    "1 hour": timedelta(hours=1),
+    "1 day": timedelta(days=1),
+    "1 week": timedelta(weeks=1),
+    "1 month": timedelta(days=30),
+}
+
+
+async def create_table(conn: AsyncConnection, rows: int) -> None:
+    await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+    await conn.execute(
+        text(
+            f"""
+            CREATE UNLOGGED TABLE {TABLE} AS
+            SELECT
+                i AS id,
+                :start + i * :step AS created_at,
+                :start + i * :step + random() * interval '2 days' AS updated_at,
+                repeat('x', 200) AS description
+            FROM generate_series(1, :rows) AS i
+            """
+        ),
+        {"start": START, "step": ROW_INTERVAL, "rows": rows},
+    )
+
+
+async def use_variant(conn: AsyncConnection, name: str) -> int:
+    await conn.execute(text(f"DROP INDEX IF EXISTS {TABLE}_created_at, {TABLE}_updated_at"))
+    for statement in VARIANTS[name]:
+        await conn.execute(text(statement))
+    await conn.execute(text(f"VACUUM ANALYZE {TABLE}"))
+
+    size = await conn.scalar(
+        text(
+            "SELECT coalesce(sum(pg_relation_size(indexrelid)), 0) FROM pg_index "
+            f"WHERE indrelid = '{TABLE}'::regclass"
+        )
+    )
+    return size or 0
+
+
+async def time_query(conn: AsyncConnection, query: str, params: Callable[[], dict], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await conn.execute(text(query), params())
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Rows in the scratch table")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query, the median is reported")
+    args = parser.parse_args()
+
+    engine.echo = False
+    end = START + ROW_INTERVAL * args.rows
+
+    def random_range(width: timedelta):
+        def params() -> dict:
+            start = START + (end - START - width) * random.random()
+            return {"start": start, "end": start + width}
+
+        return params
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        print(f"📅 Date-range filters over {args.rows} rows")
+        await create_table(conn, args.rows)
+
+        try:
+            for variant in VARIANTS:
+                size = await use_variant(conn, variant)
+                print("=" * 64)
+                print(f"{variant:<6} index size {size / 1024 / 1024:>8.2f} MB")
+
+                for label, width in WIDTHS.items():
+                    created = await time_query(
+                        conn,
+                        f"SELECT count(*) FROM {TABLE} WHERE created_at >= :start AND created_at < :end",
+                        random_range(width),
+                        args.repeat,
+                    )
+                    updated = await time_query(
+                        conn,
+                        f"SELECT count(*) FROM {TABLE} WHERE updated_at >= :start",
+                        lambda width=width: {"start": end - width},
+                        args.repeat,
+                    )
+                    print(f"  {label:<8} created range {created:>9.2f} ms   updated since {updated:>9.2f} ms")
+        finally:
+            await conn.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+    print("=" * 64)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Create the clients and tickets tables on every database in SHARD_DATABASE_URLS.
+
+Run once per new set of shards, before the API starts using them. Shard
+databases must be empty: id sequences are reset so that every id allocated
+on shard N satisfies `id % shard_count == N`.
+
+    python scripts/create_shards.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.session import engine, shard_engines
+from src.database.sharding import create_shard_schema
+
+from src.users.models import User  # noqa: F401
+from src.clients.models import Client  # noqa: F401
+from src.tickets.models import Ticket  # noqa: F401
+
+
+async def main() -> None:
+    if not shard_engines:
+        print("⚠️  SHARD_DATABASE_URLS is not set, nothing to do")
+        return
+
+    for index, shard_engine in enumerate(shard_engines):
+        await create_shard_schema(shard_engine, index, len(shard_engines))
+        print(f"✅ Created shard {index}: {shard_engine.url.render_as_string(hide_password=True)}")
+
+    await engine.dispose()
+    for shard_engine in shard_engines:
+        await shard_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
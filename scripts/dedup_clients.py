@@ -0,0 +1,64 @@
+"""Find duplicate clients and merge the confirmed ones.
+
+Runs as a dry run by default and only prints what it found:
+
+    python scripts/dedup_clients.py
+    python scripts/dedup_clients.py --apply
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.clients.dedup import DedupReport, deduplicate_clients
+from src.database.session import async_session, engine, shard_engines, shard_router
+
+from src.users.models import User  # noqa: F401
+from src.clients.models import Client  # noqa: F401
+from src.tickets.models import Ticket  # noqa: F401
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="Merge confirmed duplicates")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Clients read per query")
+    args = parser.parse_args()
+
+    engine.echo = False
+
+    print("🔍 Looking for duplicate clients...")
+    # With sharding enabled each shard is deduplicated on its own; duplicates on different shards are not merged.
+    session_factories = shard_router.shard_session_factories if shard_router else [async_session]
+    report = DedupReport()
+    for session_factory in session_factories:
+        async with session_factory() as session:
+            shard_report = await deduplicate_clients(session, batch_size=args.batch_size, apply=args.apply)
+
+        report.scanned += shard_report.scanned
+        report.candidates.extend(shard_report.candidates)
+        report.merged_clients += shard_report.merged_clients
+        report.moved_tickets += shard_report.moved_tickets
+
+    for candidate in report.candidates:
+        status = "✅ confirmed" if candidate.confirmed else "❔ review"
+        print(f"{status:<14} client {candidate.client_id} ~ {candidate.duplicate_of} (same {candidate.reason})")
+
+    print("=" * 50)
+    print(f"Scanned clients:   {report.scanned}")
+    print(f"Candidates:        {len(report.candidates)}")
+    if args.apply:
+        print(f"Merged clients:    {report.merged_clients}")
+        print(f"Moved tickets:     {report.moved_tickets}")
+    else:
+        print("Dry run, nothing merged. Pass --apply to merge confirmed duplicates.")
+
+    await engine.dispose()
+    for shard_engine in shard_engines:
+        await shard_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Create and drop custom ticket field indexes to match the field definitions.
+
+The API does this whenever a field definition changes. Run it after restoring
+a database, after creating new shards, or when an index build was interrupted
+(an interrupted concurrent build leaves an invalid index, which is rebuilt).
+
+    python scripts/sync_field_indexes.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.session import async_session, engine, shard_engines
+from src.tickets.custom_fields import sync_custom_field_indexes
+from src.tickets.repository import TicketFieldRepository
+
+from src.users.models import User  # noqa: F401
+from src.clients.models import Client  # noqa: F401
+from src.tickets.models import Ticket  # noqa: F401
+
+
+async def main() -> None:
+    async with async_session() as session:
+        definitions = await TicketFieldRepository(session).get_all()
+
+    for ticket_engine in shard_engines or [engine]:
+        await sync_custom_field_indexes(ticket_engine, definitions)
+        print(f"✅ Synced field indexes: {ticket_engine.url.render_as_string(hide_password=True)}")
+
+    await engine.dispose()
+    for shard_engine in shard_engines:
+        await shard_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,124 @@
+from sqlalchemy import Row, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TABLES = text(
+    """
+    SELECT
+        s.relname AS name,
+        pg_total_relation_size(s.relid) AS total_bytes,
+        pg_relation_size(s.relid) AS table_bytes,
+        pg_indexes_size(s.relid) AS index_bytes,
+        s.n_live_tup AS live_rows,
+        s.n_dead_tup AS dead_rows,
+        (pg_relation_size(s.relid) * s.n_dead_tup / greatest(s.n_live_tup + s.n_dead_tup, 1))::bigint
+            AS estimated_bloat_bytes,
+        coalesce(s.seq_scan, 0) AS seq_scans,
+        coalesce(s.seq_tup_read, 0) AS seq_rows_read,
+        coalesce(s.idx_scan, 0) AS index_scans,
+        s.last_autovacuum,
+        s.last_autoanalyze
+    FROM pg_stat_user_tables s
+    ORDER BY total_bytes DESC, name
+    """
+)
+
+INDEXES = text(
+    """
+    SELECT
+        s.indexrelname AS name,
+        s.relname AS table,
+        pg_relation_size(s.indexrelid) AS bytes,
+        s.idx_scan AS scans,
+        pg_get_indexdef(s.indexrelid) AS definition,
+        i.indisunique OR i.indisprimary OR i.indisexclusion AS enforces_constraint
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    ORDER BY bytes DESC, name
+    """
+)
+
+# Indexes are duplicates when they cover the same columns with the same operator
+# classes, expressions and predicate, whatever their names or index methods.
+DUPLICATE_INDEXES = text(
+    """
+    SELECT
+        c.relname AS table,
+        array_agg(ic.relname ORDER BY pg_relation_size(i.indexrelid) DESC, ic.relname) AS indexes,
+        (sum(pg_relation_size(i.indexrelid)) - max(pg_relation_size(i.indexrelid)))::bigint AS wasted_bytes
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indrelid
+    JOIN pg_class ic ON ic.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname NOT IN ('pg_catalog', 'information_schema') AND n.nspname NOT LIKE 'pg_toast%'
+    GROUP BY
+        c.relname,
+        i.indrelid,
+        i.indkey::text,
+        i.indclass::text,
+        coalesce(pg_get_expr(i.indexprs, i.indrelid), ''),
+        coalesce(pg_get_expr(i.indpred, i.indrelid), '')
+    HAVING count(*) > 1
+    ORDER BY wasted_bytes DESC, c.relname
+    """
+)
+
+CACHE_HIT_RATIO = text(
+    """
+    SELECT
+        sum(heap_blks_hit)::float / nullif(sum(heap_blks_hit) + sum(heap_blks_read), 0) AS tables,
+        sum(idx_blks_hit)::float / nullif(sum(idx_blks_hit) + sum(idx_blks_read), 0) AS indexes
+    FROM pg_statio_user_tables
+    """
+)
+
+TOP_STATEMENTS = text(
+    """
+    SELECT
+        query,
+        calls,
+        total_exec_time AS total_ms,
+        mean_exec_time AS mean_ms,
+        rows,
+        shared_blks_hit::float / nullif(shared_blks_hit + shared_blks_read, 0) AS cache_hit_ratio
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+    ORDER BY total_exec_time DESC
+    LIMIT :limit
+    """
+)
+
+
+class DatabaseReportRepository:
+    """Statistics views of the database the session is connected to."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_database_size(self) -> int:
+        return await self.db.scalar(text("SELECT pg_database_size(current_database())"))
+
+    async def get_tables(self) -> list[Row]:
+        return list(await self.db.execute(TABLES))
+
+    async def get_indexes(self) -> list[Row]:
+        return list(await self.db.execute(INDEXES))
+
+    async def get_duplicate_indexes(self) -> list[Row]:
+        return list(await self.db.execute(DUPLICATE_INDEXES))
+
+    async def get_cache_hit_ratio(self) -> Row:
+        return (await self.db.execute(CACHE_HIT_RATIO)).one()
+
+    async def get_top_statements(self, limit: int) -> list[Row] | None:
+        """Statements by total execution time, or None when pg_stat_statements is not installed."""
+        installed = await self.db.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"))
+        if not installed:
+            return None
+
+        try:
+            # The view raises an error when the library is not in shared_preload_libraries.
+            async with self.db.begin_nested():
+                return list(await self.db.execute(TOP_STATEMENTS, {"limit": limit}))
+        except DBAPIError:
+            return None
@@ -0,0 +1,40 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.admin.schemas import DatabaseReport, ResponseCacheStats
+from src.admin.service import DatabaseReportService
+from src.auth.dependencies import CurrentAdmin
+from src.core.cache import response_cache
+from src.core.dependencies import get_db
+
+router = APIRouter()
+
+
+@router.get(
+    "/db/report",
+    response_model=DatabaseReport,
+    summary="Database report",
+    description="Table and index sizes, unused and duplicate indexes, bloat estimates, sequential scans, cache hit "
+    "ratio and the slowest statements (with pg_stat_statements). Cached for DB_REPORT_CACHE_SECONDS unless "
+    "refresh is set. Only admin can access.",
+)
+async def get_database_report(
+    current_admin: CurrentAdmin,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    refresh: bool = False,
+) -> DatabaseReport:
+    service = DatabaseReportService(db)
+    return await service.get_report(refresh=refresh)
+
+
+@router.get(
+    "/cache",
+    response_model=ResponseCacheStats,
+    summary="Response cache statistics",
+    description="Entries, size, hit ratio, evictions and invalidations of this process's list response cache "
+    "since it started. Only admin can access.",
+)
+async def get_response_cache_stats(current_admin: CurrentAdmin) -> ResponseCacheStats:
+    return ResponseCacheStats.model_validate(response_cache.stats())
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TableReport(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    total_bytes: int = Field(..., description="Table, indexes and TOAST")
+    table_bytes: int
+    index_bytes: int
+    live_rows: int
+    dead_rows: int
+    estimated_bloat_bytes: int = Field(..., description="Table size taken by dead rows, from their share of all rows")
+    seq_scans: int = Field(..., description="Sequential scans since the statistics were reset")
+    seq_rows_read: int
+    index_scans: int
+    last_autovacuum: datetime | None
+    last_autoanalyze: datetime | None
+
+
+class IndexReport(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    table: str
+    bytes: int
+    scans: int = Field(..., description="Index scans since the statistics were reset")
+    definition: str
+
+
+class DuplicateIndexes(BaseModel):
+    table: str
+    indexes: list[str] = Field(..., description="Indexes with the same columns, expressions and predicate")
+    wasted_bytes: int = Field(..., description="Size of all but the largest of them")
+
+
+class CacheHitRatio(BaseModel):
+    tables: float | None = Field(..., description="Share of table block reads served from shared buffers")
+    indexes: float | None = Field(..., description="Share of index block reads served from shared buffers")
+
+
+class StatementReport(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    query: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    rows: int
+    cache_hit_ratio: float | None
+
+
+class DatabaseReport(BaseModel):
+    generated_at: datetime
+    database_bytes: int
+    tables: list[TableReport] = Field(..., description="Tables by total size, largest first")
+    indexes: list[IndexReport] = Field(..., description="Indexes by size, largest first")
+    unused_indexes: list[IndexReport] = Field(
+        ..., description="Never scanned indexes that do not enforce a constraint, largest first"
+    )
+    duplicate_indexes: list[DuplicateIndexes]
+    cache_hit_ratio: CacheHitRatio
+    top_statements: list[StatementReport] | None = Field(
+        ..., description="Statements by total execution time, null without the pg_stat_statements extension"
+    )
+
+
+class ResponseCacheStats(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    entries: int
+    bytes: int = Field(..., description="Approximate size of the cached bodies, headers and keys")
+    hits: int
+    misses: int
+    hit_ratio: float | None = Field(..., description="Share of lookups served from the cache, null before any")
+    evictions: int = Field(..., description="Entries dropped to stay within RESPONSE_CACHE_MAX_ENTRIES or _MAX_BYTES")
+    invalidations: int = Field(..., description="Entries dropped because a write changed what they depend on")
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.admin.repository import DatabaseReportRepository
+from src.admin.schemas import CacheHitRatio, DatabaseReport, DuplicateIndexes, IndexReport, StatementReport, TableReport
+from src.core.config import settings
+
+TOP_STATEMENTS_LIMIT = 10
+
+
+class ReportCache:
+    """The last report of this process and when it goes stale."""
+
+    def __init__(self) -> None:
+        self.report: DatabaseReport | None = None
+        self.expires_at = 0.0
+        self.lock = asyncio.Lock()
+
+    def get(self) -> DatabaseReport | None:
+        return self.report if time.monotonic() < self.expires_at else None
+
+    def set(self, report: DatabaseReport, ttl_seconds: float) -> None:
+        self.report = report
+        self.expires_at = time.monotonic() + ttl_seconds
+
+    def clear(self) -> None:
+        self.report = None
+        self.expires_at = 0.0
+
+
+report_cache = ReportCache()
+
+
+class DatabaseReportService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.repo = DatabaseReportRepository(db)
+
+    async def get_report(self, refresh: bool = False) -> DatabaseReport:
+        """The cached report, rebuilt when older than DB_REPORT_CACHE_SECONDS.
+
+        Concurrent requests for a stale report wait for a single rebuild
+        instead of each running the statistics queries.
+        """
+        if not refresh and (report := report_cache.get()):
+            return report
+
+        async with report_cache.lock:
+            if not refresh and (report := report_cache.get()):
+                return report
+
+            report = await self._build_report()
+            report_cache.set(report, settings.DB_REPORT_CACHE_SECONDS)
+            return report
+
+    async def _build_report(self) -> DatabaseReport:
+        indexes = await self.repo.get_indexes()
+        cache_hit_ratio = await self.repo.get_cache_hit_ratio()
+        top_statements = await self.repo.get_top_statements(TOP_STATEMENTS_LIMIT)
+
+        return DatabaseReport(
+            generated_at=datetime.utcnow(),
+            database_bytes=await self.repo.get_database_size(),
+            tables=[TableReport.model_validate(row) for row in await self.repo.get_tables()],
+            indexes=[IndexReport.model_validate(row) for row in indexes],
+            unused_indexes=[
+                IndexReport.model_validate(row) for row in indexes if row.scans == 0 and not row.enforces_constraint
+            ],
+            duplicate_indexes=[
+                DuplicateIndexes(table=row.table, indexes=row.indexes, wasted_bytes=row.wasted_bytes)
+                for row in await self.repo.get_duplicate_indexes()
+            ],
+            cache_hit_ratio=CacheHitRatio(tables=cache_hit_ratio.tables, indexes=cache_hit_ratio.indexes),
+            top_statements=(
+                [StatementReport.model_validate(row) for row in top_statements] if top_statements is not None else None
+            ),
+        )
@@ -45,5 +45,13 @@ async def get_current_admin_user(current_user: Annotated[User, Depends(get_curre
     return current_user
 
 
+async def get_current_worker_user(current_user: Annotated[User, Depends(get_current_user)]) -> User:
+    if current_user.role != UserRole.WORKER:
+        raise PermissionDeniedError("Worker access required")
+
+    return current_user
+
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 CurrentAdmin = Annotated[User, Depends(get_current_admin_user)]
+CurrentWorker = Annotated[User, Depends(get_current_worker_user)]
@@ -0,0 +1,176 @@
+"""Find and merge duplicate clients.
+
+Clients are streamed in id order and bucketed by blocking keys, so each new
+client is only compared with the few clients that share one of its keys
+instead of with every other client:
+
+- normalized email: the same address in any casing is a confirmed duplicate;
+- normalized phone: a confirmed duplicate when the names also sound alike,
+  otherwise only a candidate (relatives often share a phone);
+- name soundex: only a candidate for manual review.
+
+Confirmed duplicates are grouped transitively and merged into the oldest
+client of each group.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.repository import ClientRepository
+
+logger = logging.getLogger(__name__)
+
+MIN_PHONE_DIGITS = 7
+MAX_BLOCK_SIZE = 50
+
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def soundex(word: str) -> str:
+    letters = [char for char in word.lower() if char.isascii() and char.isalpha()]
+    if not letters:
+        return ""
+
+    code = letters[0].upper()
+    previous = SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+        if char not in "hw":
+            previous = digit
+
+    return (code + "000")[:4]
+
+
+def name_key(full_name: str) -> str:
+    words = [code for word in full_name.split() if (code := soundex(word))]
+    if not words:
+        return ""
+    return words[0] if len(words) == 1 else f"{words[0]}-{words[-1]}"
+
+
+def email_key(email: str) -> str:
+    return email.strip().lower()
+
+
+def phone_key(phone_normalized: str) -> str:
+    return phone_normalized if len(phone_normalized) >= MIN_PHONE_DIGITS else ""
+
+
+@dataclass(frozen=True)
+class MergeCandidate:
+    client_id: int
+    duplicate_of: int
+    reason: Literal["email", "phone", "name"]
+    confirmed: bool
+
+
+@dataclass
+class DedupReport:
+    scanned: int = 0
+    candidates: list[MergeCandidate] = field(default_factory=list)
+    merged_clients: int = 0
+    moved_tickets: int = 0
+
+
+class DuplicateGroups:
+    """Union-find over client ids; the smallest id of a group is its survivor."""
+
+    def __init__(self) -> None:
+        self._parent: dict[int, int] = {}
+
+    def find(self, client_id: int) -> int:
+        root = client_id
+        while (parent := self._parent.get(root, root)) != root:
+            root = parent
+
+        while client_id != root:
+            self._parent[client_id], client_id = root, self._parent[client_id]
+
+        return root
+
+    def union(self, client_id: int, other_id: int) -> None:
+        root, other_root = self.find(client_id), self.find(other_id)
+        if root != other_root:
+            self._parent[max(root, other_root)] = min(root, other_root)
+
+    def survivors(self) -> dict[int, int]:
+        return {client_id: root for client_id in self._parent if (root := self.find(client_id)) != client_id}
+
+
+async def find_duplicates(db: AsyncSession, batch_size: int = 1000) -> tuple[DedupReport, DuplicateGroups]:
+    repo = ClientRepository(db)
+    report = DedupReport()
+    groups = DuplicateGroups()
+    blocks: dict[tuple[str, str], list[int]] = {}
+    name_keys: dict[int, str] = {}
+
+    last_id = 0
+    while batch := await repo.get_dedup_batch(after_id=last_id, limit=batch_size):
+        for client_id, full_name, email, phone_normalized in batch:
+            client_name_key = name_key(full_name)
+            name_keys[client_id] = client_name_key
+
+            keys = (("email", email_key(email)), ("phone", phone_key(phone_normalized)), ("name", client_name_key))
+            for reason, key in keys:
+                if not key:
+                    continue
+
+                members = blocks.setdefault((reason, key), [])
+                match = next(
+                    (
+                        member
+                        for member in members
+                        if reason == "email" or (reason == "phone" and name_keys[member] == client_name_key)
+                    ),
+                    None,
+                )
+
+                if match is not None:
+                    if groups.find(match) != groups.find(client_id):
+                        groups.union(client_id, match)
+                        report.candidates.append(MergeCandidate(client_id, match, reason, confirmed=True))
+                elif members and groups.find(members[0]) != groups.find(client_id):
+                    report.candidates.append(MergeCandidate(client_id, members[0], reason, confirmed=False))
+
+                if len(members) < MAX_BLOCK_SIZE:
+                    members.append(client_id)
+
+        report.scanned += len(batch)
+        last_id = batch[-1].id
+
+    return report, groups
+
+
+async def deduplicate_clients(
+    db: AsyncSession, batch_size: int = 1000, merge_batch_size: int = 500, apply: bool = False
+) -> DedupReport:
+    """Scan all clients for duplicates and, when `apply` is set, merge the confirmed ones."""
+    report, groups = await find_duplicates(db, batch_size=batch_size)
+    survivors = groups.survivors()
+    logger.info(
+        f"Scanned {report.scanned} clients, {len(survivors)} confirmed duplicates",
+        extra={"scanned": report.scanned, "duplicates": len(survivors)},
+    )
+
+    if not apply:
+        return report
+
+    duplicate_ids = sorted(survivors)
+    for start in range(0, len(duplicate_ids), merge_batch_size):
+        chunk = {client_id: survivors[client_id] for client_id in duplicate_ids[start : start + merge_batch_size]}
+        report.moved_tickets += await ClientRepository(db).merge(chunk)
+        report.merged_clients += len(chunk)
+
+    return report
@@ -1,27 +1,68 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import DDL, Computed, Index, String, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
+from src.database.soft_delete import DELETED_ROWS, LIVE_ROWS, SoftDeleteMixin
 
 if TYPE_CHECKING:
     from src.tickets.models import Ticket
 
 
-class Client(Base):
+class Client(SoftDeleteMixin, Base):
 
     __tablename__ = "clients"
+    __table_args__ = (
+        Index("ix_clients_full_name", "full_name", postgresql_where=LIVE_ROWS),
+        Index("ix_clients_email", "email", postgresql_where=LIVE_ROWS),
+        Index("ix_clients_email_prefix", text("lower(email) text_pattern_ops"), postgresql_where=LIVE_ROWS),
+        Index(
+            "ix_clients_phone_normalized",
+            "phone_normalized",
+            postgresql_ops={"phone_normalized": "text_pattern_ops"},
+            postgresql_where=LIVE_ROWS,
+        ),
+        Index(
+            "ix_clients_full_name_trgm",
+            "full_name",
+            postgresql_using="gin",
+            postgresql_ops={"full_name": "gin_trgm_ops"},
+            postgresql_where=LIVE_ROWS,
+        ),
+        Index(
+            "ix_clients_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+            postgresql_where=LIVE_ROWS,
+        ),
+        # Serves max(updated_at), the version of ticket and client lists.
+        Index("ix_clients_updated_at", "updated_at", postgresql_where=LIVE_ROWS),
+        Index("ix_clients_deleted_at", "deleted_at", postgresql_where=DELETED_ROWS),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    full_name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
-    email: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    full_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), nullable=False)
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
+    phone_normalized: Mapped[str] = mapped_column(
+        String(20), Computed("regexp_replace(phone, '[^0-9]', '', 'g')", persisted=True)
+    )
     address: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
-    tickets: Mapped[list[Ticket]] = relationship("Ticket", back_populates="client", cascade="all, delete-orphan")
+    tickets: Mapped[list[Ticket]] = relationship(
+        "Ticket", back_populates="client", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return f"Client(id={self.id}, full_name={self.full_name!r}, email={self.email!r})"
+
+
+TRIGRAM_EXTENSION = DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+event.listen(Client.__table__, "before_create", TRIGRAM_EXTENSION)
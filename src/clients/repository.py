@@ -1,7 +1,18 @@
-from sqlalchemy import func, select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from operator import attrgetter
+
+from sqlalchemy import Integer, Row, any_, bindparam, case, func, select, true, union, update
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.models import Client
+from src.database.search import ilike_contains
+from src.database.sharding import execute_on_all_shards, get_shard_router, stream_on_all_shards
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY
+from src.tickets.models import Ticket, TicketStatus
+
+OPEN_TICKET_STATUSES = (TicketStatus.NEW, TicketStatus.IN_PROGRESS)
 
 
 class ClientRepository:
@@ -18,22 +29,212 @@ class ClientRepository:
     async def get_by_id(self, client_id: int) -> Client | None:
         return await self.db.get(Client, client_id)
 
+    async def get_version(self, client_id: int) -> datetime | None:
+        return await self.db.scalar(select(Client.updated_at).where(Client.id == client_id))
+
+    async def get_list_version(self) -> tuple[int, datetime | None]:
+        """Count and latest `updated_at` of all clients."""
+        query = select(func.count().label("count"), func.max(Client.updated_at).label("updated_at"))
+        rows = await execute_on_all_shards(self.db, query)
+        return sum(row.count for row in rows), max((row.updated_at for row in rows if row.updated_at), default=None)
+
+    async def get_last_updated(self) -> datetime | None:
+        rows = await execute_on_all_shards(self.db, select(func.max(Client.updated_at)))
+        return max((updated_at for (updated_at,) in rows if updated_at), default=None)
+
     async def get_by_email(self, email: str) -> Client | None:
-        result = await self.db.scalar(select(Client).where(Client.email == email))
+        result = await self.db.scalar(
+            select(Client).where(func.lower(Client.email) == email.strip().lower()).order_by(Client.id).limit(1)
+        )
         return result
 
-    async def get_all(self, skip: int = 0, limit: int = 10) -> tuple[list[Client], int]:
-        query = select(Client)
+    async def get_dedup_batch(self, after_id: int, limit: int) -> list[Row]:
+        result = await self.db.execute(
+            select(Client.id, Client.full_name, Client.email, Client.phone_normalized)
+            .where(Client.id > after_id)
+            .order_by(Client.id)
+            .limit(limit)
+        )
+        return list(result)
+
+    async def merge(self, survivors: dict[int, int]) -> int:
+        """Re-point tickets from duplicate clients to their survivors and tombstone the duplicates.
+
+        `survivors` maps duplicate client id to surviving client id. Returns the number of moved tickets.
+        """
+        if not survivors:
+            return 0
+
+        duplicate_ids = list(survivors)
+        merge_map = (
+            func.unnest(
+                bindparam("duplicate_ids", duplicate_ids, type_=ARRAY(Integer)),
+                bindparam("survivor_ids", [survivors[client_id] for client_id in duplicate_ids], type_=ARRAY(Integer)),
+            )
+            .table_valued("duplicate_id", "survivor_id")
+            .render_derived(name="merge_map")
+        )
+        moved = await self.db.execute(
+            update(Ticket)
+            .where(Ticket.client_id == merge_map.c.duplicate_id)
+            .values(client_id=merge_map.c.survivor_id)
+            .execution_options(include_deleted=True, synchronize_session=False)
+        )
+        await self.db.execute(
+            update(Client)
+            .where(Client.id == any_(bindparam("merged_ids", duplicate_ids, type_=ARRAY(Integer))))
+            .values(deleted_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return moved.rowcount
+
+    async def search_by_phone(self, digits: str, limit: int = 10) -> list[Row]:
+        score = case((Client.phone_normalized == digits, 1.0), else_=0.9)
+        query = (
+            select(Client, score.label("score"))
+            .where(Client.phone_normalized.startswith(digits, autoescape=True))
+            .order_by(score.desc(), Client.phone_normalized, Client.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result)
+
+    async def search_by_email_prefix(self, prefix: str, limit: int = 10) -> list[Row]:
+        email = func.lower(Client.email)
+        score = case((email == prefix, 1.0), else_=0.9)
+        query = (
+            select(Client, score.label("score"))
+            .where(email.startswith(prefix, autoescape=True))
+            .order_by(score.desc(), email, Client.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result)
 
+    async def search_by_name(self, term: str, limit: int = 10) -> list[Row]:
+        # Each branch is planned on its own so it can use its trigram index;
+        # OR-ing them in one WHERE makes the planner fall back to a seq scan.
+        matches = union(
+            select(Client.id).where(ilike_contains(Client.full_name, term)),
+            select(Client.id).where(Client.full_name.op("%")(term)),
+            select(Client.id).where(ilike_contains(Client.email, term)),
+        ).subquery()
+        score = func.greatest(
+            func.word_similarity(term, Client.full_name),
+            func.similarity(Client.email, term),
+        )
+        query = (
+            select(Client, score.label("score"))
+            .where(Client.id.in_(select(matches.c.id)))
+            .order_by(score.desc(), Client.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result)
+
+    async def get_all(self, skip: int = 0, limit: int = 10) -> tuple[list[Client], int]:
+        query = select(Client).order_by(Client.id)
         count_query = select(func.count()).select_from(Client)
+
+        shard_router = get_shard_router(self.db)
+        if shard_router:
+            return await shard_router.fetch_page(
+                query,
+                count_query,
+                skip,
+                limit,
+                key=attrgetter("id"),
+                timeout_ms=self.db.info.get(STATEMENT_TIMEOUT_KEY),
+            )
+
         total = await self.db.scalar(count_query) or 0
 
-        query = query.order_by(Client.id).offset(skip).limit(limit)
+        query = query.offset(skip).limit(limit)
         result = await self.db.scalars(query)
         clients = list(result)
 
         return clients, total
 
+    async def stream_export(self, chunk_size: int) -> AsyncIterator[Sequence[Row]]:
+        query = select(
+            Client.id,
+            Client.full_name,
+            Client.email,
+            Client.phone,
+            Client.address,
+            Client.updated_at,
+        ).order_by(Client.id)
+        async for rows in stream_on_all_shards(self.db, query, chunk_size):
+            yield rows
+
+    async def get_overview(self, client_id: int, recent_limit: int = 5) -> Row | None:
+        stats = (
+            select(
+                func.count().label("total_tickets"),
+                *(func.count().filter(Ticket.status == status).label(status.value) for status in TicketStatus),
+                func.max(Ticket.updated_at).label("last_activity_at"),
+            )
+            .where(Ticket.client_id == Client.id)
+            .lateral("stats")
+        )
+
+        recent_rows = (
+            select(Ticket.id, Ticket.title, Ticket.status, Ticket.created_at, Ticket.updated_at)
+            .where(Ticket.client_id == Client.id)
+            .order_by(Ticket.created_at.desc())
+            .limit(recent_limit)
+            .correlate(Client)
+            .lateral("recent_rows")
+        )
+        recent = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id",
+                            recent_rows.c.id,
+                            "title",
+                            recent_rows.c.title,
+                            "status",
+                            recent_rows.c.status,
+                            "created_at",
+                            recent_rows.c.created_at,
+                            "updated_at",
+                            recent_rows.c.updated_at,
+                        ),
+                        recent_rows.c.created_at.desc(),
+                    )
+                ).label("recent_tickets")
+            )
+            .select_from(recent_rows)
+            .lateral("recent")
+        )
+
+        query = (
+            select(Client, *stats.c, recent.c.recent_tickets)
+            .select_from(Client)
+            .outerjoin(stats, true())
+            .outerjoin(recent, true())
+            .where(Client.id == client_id)
+        )
+        result = await self.db.execute(query)
+        return result.first()
+
+    async def count_open_tickets(self, client_ids: list[int]) -> dict[int, int]:
+        if not client_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(Ticket.client_id, func.count())
+            .where(
+                Ticket.client_id == any_(bindparam("client_ids", client_ids, type_=ARRAY(Integer))),
+                Ticket.status.in_(OPEN_TICKET_STATUSES),
+            )
+            .group_by(Ticket.client_id)
+        )
+        return {client_id: count for client_id, count in result}
+
     async def update(self, client: Client, **kwargs) -> Client:
         for key, value in kwargs.items():
             if value is not None:
@@ -44,5 +245,14 @@ class ClientRepository:
         return client
 
     async def delete(self, client: Client) -> None:
-        await self.db.delete(client)
+        deleted_at = datetime.utcnow()
+        await self.db.execute(
+            update(Ticket)
+            .where(Ticket.client_id == client.id)
+            .values(deleted_at=deleted_at)
+            .execution_options(synchronize_session=False)
+        )
+        client.deleted_at = deleted_at
+
         await self.db.commit()
+        self.db.expunge(client)
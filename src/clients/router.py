@@ -1,12 +1,26 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import CurrentAdmin, CurrentUser
-from src.clients.schemas import ClientCreate, ClientListResponse, ClientResponse, ClientUpdate
-from src.clients.service import ClientService
-from src.core.dependencies import get_db
+from src.clients.schemas import (
+    ClientCreate,
+    ClientListResponse,
+    ClientOverviewResponse,
+    ClientResponse,
+    ClientSearchResponse,
+    ClientUpdate,
+)
+from src.clients.service import EXPORT_COLUMNS, ClientService
+from src.core.cache import CacheTag, cached_response
+from src.core.config import settings
+from src.core.dependencies import SessionFactory, get_db, route_class
+from src.core.etag import conditional_response
+from src.core.export import ExportFormat, Rows, export_response
+from src.database.statement_timeout import RouteClass
 
 router = APIRouter()
 
@@ -31,24 +45,69 @@ async def create_client(
     "",
     response_model=ClientListResponse,
     summary="List all clients",
-    description="Get list of all clients with pagination. Requires authentication.",
+    description="Get list of all clients with pagination. Requires authentication. "
+    "Pass with_stats=true to include open ticket counts.",
 )
 async def list_clients(
+    request: Request,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 10,
-) -> ClientListResponse:
+    with_stats: bool = False,
+) -> Response:
     service = ClientService(db)
-    clients, total, total_pages = await service.get_clients(page=page, per_page=per_page)
-
-    return ClientListResponse(
-        clients=clients,
-        total_count=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
-    )
+
+    async def render() -> ClientListResponse:
+        clients, total, total_pages = await service.get_clients(page=page, per_page=per_page, with_stats=with_stats)
+
+        return ClientListResponse.model_construct(
+            clients=clients,
+            total_count=total,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+        )
+
+    async def respond() -> Response:
+        return await conditional_response(request, await service.get_clients_version(with_stats), render)
+
+    tags = (CacheTag.CLIENTS, CacheTag.TICKETS) if with_stats else (CacheTag.CLIENTS,)
+    return await cached_response(request, "all", tags, respond)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export clients",
+    description="Stream all clients, by id, as CSV or NDJSON. Requires authentication.",
+)
+async def export_clients(
+    current_user: CurrentUser,
+    session_factory: SessionFactory,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.CSV,
+) -> StreamingResponse:
+    def export(session: AsyncSession) -> AsyncIterator[Rows]:
+        return ClientService(session).export_clients(settings.EXPORT_CHUNK_ROWS)
+
+    return export_response(session_factory, export, EXPORT_COLUMNS, export_format, "clients")
+
+
+@router.get(
+    "/search",
+    response_model=ClientSearchResponse,
+    summary="Search clients",
+    description="Find clients by phone number, email prefix or name. Results are ranked by match quality.",
+)
+async def search_clients(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: Annotated[str, Query(min_length=3, max_length=100, description="Phone number, email or name")],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> ClientSearchResponse:
+    service = ClientService(db)
+    clients = await service.search_clients(q, limit=limit)
+    return ClientSearchResponse(clients=clients)
 
 
 @router.get(
@@ -59,11 +118,30 @@ async def list_clients(
 )
 async def get_client(
     client_id: int,
+    request: Request,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> ClientResponse:
+) -> Response:
+    service = ClientService(db)
+    return await conditional_response(
+        request, await service.get_client_version(client_id), lambda: service.get_client(client_id)
+    )
+
+
+@router.get(
+    "/{client_id}/overview",
+    response_model=ClientOverviewResponse,
+    summary="Get client overview",
+    description="Get client details with ticket counts by status, recent tickets and last activity time.",
+)
+async def get_client_overview(
+    client_id: int,
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    recent_limit: Annotated[int, Query(ge=1, le=50)] = 5,
+) -> ClientOverviewResponse:
     service = ClientService(db)
-    return await service.get_client(client_id)
+    return await service.get_client_overview(client_id, recent_limit=recent_limit)
 
 
 @router.patch(
@@ -87,6 +165,7 @@ async def update_client(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete client",
     description="Delete a client. Only admin can access.",
+    dependencies=[Depends(route_class(RouteClass.ADMIN))],
 )
 async def delete_client(
     client_id: int,
@@ -1,5 +1,10 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from src.tickets.models import TicketStatus
+
 
 class ClientCreate(BaseModel):
     full_name: str = Field(..., min_length=2, max_length=200, description="Client full name")
@@ -25,9 +30,44 @@ class ClientResponse(BaseModel):
     address: str | None
 
 
+class ClientWithStatsResponse(ClientResponse):
+    open_tickets_count: int
+
+
+class ClientSearchResult(ClientResponse):
+    matched_by: Literal["phone", "email", "name"]
+    score: float
+
+
+class ClientSearchResponse(BaseModel):
+    clients: list[ClientSearchResult]
+
+
 class ClientListResponse(BaseModel):
-    clients: list[ClientResponse]
+    clients: list[ClientWithStatsResponse | ClientResponse]
     total_count: int
     page: int
     per_page: int
     total_pages: int
+
+
+class ClientTicketCounts(BaseModel):
+    total: int
+    new: int
+    in_progress: int
+    done: int
+
+
+class ClientRecentTicket(BaseModel):
+    id: int
+    title: str
+    status: TicketStatus
+    created_at: datetime
+    updated_at: datetime
+
+
+class ClientOverviewResponse(BaseModel):
+    client: ClientResponse
+    ticket_counts: ClientTicketCounts
+    recent_tickets: list[ClientRecentTicket]
+    last_activity_at: datetime | None
@@ -1,14 +1,39 @@
+import re
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.exceptions import ClientNotFoundError
 from src.clients.repository import ClientRepository
-from src.clients.schemas import ClientCreate, ClientResponse, ClientUpdate
+from src.clients.schemas import (
+    ClientCreate,
+    ClientOverviewResponse,
+    ClientRecentTicket,
+    ClientResponse,
+    ClientSearchResult,
+    ClientTicketCounts,
+    ClientUpdate,
+    ClientWithStatsResponse,
+)
+from src.core.cache import CacheTag, invalidates
+from src.core.responses import construct
+
+EXPORT_COLUMNS = ("id", "full_name", "email", "phone", "address", "updated_at")
+
+PHONE_QUERY = re.compile(r"^\+?[\d\s().-]+$")
+MIN_PHONE_DIGITS = 3
+
+
+def normalize_phone(phone: str) -> str:
+    return re.sub(r"\D", "", phone)
 
 
 class ClientService:
     def __init__(self, db: AsyncSession) -> None:
         self.repo = ClientRepository(db)
 
+    @invalidates(CacheTag.CLIENTS)
     async def create_client(self, data: ClientCreate) -> ClientResponse:
         client = await self.repo.create(**data.model_dump())
         return ClientResponse.model_validate(client)
@@ -18,17 +43,87 @@ class ClientService:
         if not client:
             raise ClientNotFoundError(client_id)
 
-        return ClientResponse.model_validate(client)
+        return construct(ClientResponse, client)
+
+    async def get_client_version(self, client_id: int) -> tuple | None:
+        updated_at = await self.repo.get_version(client_id)
+        return (updated_at,) if updated_at else None
+
+    async def get_clients_version(self, with_stats: bool = False) -> tuple | None:
+        """The version of all client list pages; None with stats, which depend on tickets too."""
+        if with_stats:
+            return None
+        return await self.repo.get_list_version()
+
+    async def search_clients(self, query: str, limit: int = 10) -> list[ClientSearchResult]:
+        """Find clients by phone number, email prefix or name.
 
-    async def get_clients(self, page: int = 1, per_page: int = 10) -> tuple[list[ClientResponse], int, int]:
+        The query shape picks the lookup so every search is served by an index:
+        phone-like input matches the normalized phone prefix, input containing
+        "@" matches the email prefix, and anything else is a trigram match on
+        name and email.
+        """
+        query = query.strip()
+        digits = normalize_phone(query)
+
+        if PHONE_QUERY.match(query) and len(digits) >= MIN_PHONE_DIGITS:
+            matched_by = "phone"
+            rows = await self.repo.search_by_phone(digits, limit=limit)
+        elif "@" in query:
+            matched_by = "email"
+            rows = await self.repo.search_by_email_prefix(query.lower(), limit=limit)
+        else:
+            matched_by = "name"
+            rows = await self.repo.search_by_name(query, limit=limit)
+
+        # Sharded sessions return each shard's best matches one after another.
+        rows = sorted(rows, key=lambda row: row.score, reverse=True)[:limit]
+        return [
+            ClientSearchResult(**ClientResponse.model_validate(client).model_dump(), matched_by=matched_by, score=score)
+            for client, score in rows
+        ]
+
+    async def get_client_overview(self, client_id: int, recent_limit: int = 5) -> ClientOverviewResponse:
+        overview = await self.repo.get_overview(client_id, recent_limit=recent_limit)
+        if not overview:
+            raise ClientNotFoundError(client_id)
+
+        return ClientOverviewResponse(
+            client=ClientResponse.model_validate(overview.Client),
+            ticket_counts=ClientTicketCounts(
+                total=overview.total_tickets,
+                new=overview.new,
+                in_progress=overview.in_progress,
+                done=overview.done,
+            ),
+            recent_tickets=[ClientRecentTicket.model_validate(ticket) for ticket in overview.recent_tickets or []],
+            last_activity_at=overview.last_activity_at,
+        )
+
+    async def get_clients(
+        self, page: int = 1, per_page: int = 10, with_stats: bool = False
+    ) -> tuple[list[ClientResponse], int, int]:
         skip = (page - 1) * per_page
         clients, total = await self.repo.get_all(skip=skip, limit=per_page)
 
-        client_responses = [ClientResponse.model_validate(client) for client in clients]
+        if with_stats:
+            open_counts = await self.repo.count_open_tickets([client.id for client in clients])
+            client_responses = [
+                construct(ClientWithStatsResponse, client, open_tickets_count=open_counts.get(client.id, 0))
+                for client in clients
+            ]
+        else:
+            client_responses = [construct(ClientResponse, client) for client in clients]
+
         total_pages = (total + per_page - 1) // per_page
 
         return client_responses, total, total_pages
 
+    async def export_clients(self, chunk_size: int) -> AsyncIterator[Sequence[dict[str, Any]]]:
+        async for rows in self.repo.stream_export(chunk_size):
+            yield [row._asdict() for row in rows]
+
+    @invalidates(CacheTag.CLIENTS)
     async def update_client(self, client_id: int, data: ClientUpdate) -> ClientResponse:
         client = await self.repo.get_by_id(client_id)
         if not client:
@@ -39,6 +134,7 @@ class ClientService:
 
         return ClientResponse.model_validate(updated_client)
 
+    @invalidates(CacheTag.CLIENTS, CacheTag.TICKETS)
     async def delete_client(self, client_id: int) -> None:
         client = await self.repo.get_by_id(client_id)
         if not client:
@@ -0,0 +1,207 @@
+import functools
+import sys
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import ParamSpec, TypeVar
+
+from fastapi import Request, status
+from starlette.responses import Response
+
+from src.core.config import settings
+from src.core.etag import etag_matches
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Response headers kept with a cached body.
+CACHED_HEADERS = ("etag", "cache-control")
+
+
+class CacheTag(StrEnum):
+    """What cached responses depend on; writes invalidate the tags of the tables they change."""
+
+    TICKETS = "tickets"
+    CLIENTS = "clients"
+    USERS = "users"
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    body: bytes
+    headers: dict[str, str]
+    tags: frozenset[str]
+    expires_at: float
+    size: int
+
+
+@dataclass(slots=True)
+class CacheStats:
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class ResponseCache:
+    """Rendered responses of this process, least recently used first, each tagged with what it depends on.
+
+    Entries expire after `ttl_seconds`, and the least recently used ones are
+    evicted beyond `max_entries` or `max_bytes`. Writes call `invalidate`
+    with the tags they affect. Every tag has a generation that `invalidate`
+    bumps: `set` drops a response whose tags were invalidated after the
+    `generation` snapshot taken before it was rendered, so a page read before
+    a concurrent write is never stored after it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.keys_by_tag: dict[str, set[Hashable]] = {}
+        self.generations: Counter[str] = Counter()
+        self.size = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        entry = self.entries.get(key)
+        if entry is None or entry.expires_at <= self.clock():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def generation(self, tags: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self.generations[tag] for tag in sorted(tags))
+
+    def set(
+        self, key: Hashable, body: bytes, headers: dict[str, str], tags: Iterable[str], generation: tuple[int, ...]
+    ) -> None:
+        tags = frozenset(tags)
+        if not self.enabled or self.generation(tags) != generation:
+            return
+
+        size = len(body) + sum(len(name) + len(value) for name, value in headers.items()) + sys.getsizeof(key)
+        if size > self.max_bytes:
+            return
+
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = CacheEntry(body, headers, tags, self.clock() + self.ttl_seconds, size)
+        self.size += size
+        for tag in tags:
+            self.keys_by_tag.setdefault(tag, set()).add(key)
+
+        while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def invalidate(self, *tags: str) -> None:
+        for tag in tags:
+            self.generations[tag] += 1
+            for key in self.keys_by_tag.pop(tag, set()):
+                if key in self.entries:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.keys_by_tag.clear()
+        self.size = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            entries=len(self.entries),
+            bytes=self.size,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            invalidations=self.invalidations,
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self.entries.pop(key)
+        self.size -= entry.size
+        for tag in entry.tags:
+            keys = self.keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.keys_by_tag[tag]
+
+
+response_cache = ResponseCache(
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+def invalidates(*tags: CacheTag) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Drop the cached responses tagged `tags` when the decorated write returns, or fails part way."""
+
+    def decorator(method: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(method)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                response_cache.invalidate(*tags)
+
+        return wrapper
+
+    return decorator
+
+
+async def cached_response(
+    request: Request, scope: str, tags: Iterable[str], respond: Callable[[], Awaitable[Response]]
+) -> Response:
+    """Serve a GET from `response_cache`, keyed by path, normalized query and the caller's visibility `scope`.
+
+    On a miss `respond` builds the response and a `200` is stored under
+    `tags`. A stored ETag still answers a matching If-None-Match with `304`.
+    `X-Cache` tells whether the response came from the cache.
+    """
+    if not response_cache.enabled:
+        return await respond()
+
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), scope)
+    if entry := response_cache.get(key):
+        headers = {**entry.headers, "X-Cache": "hit"}
+        if "etag" in entry.headers and etag_matches(request.headers.get("if-none-match"), entry.headers["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry.body, headers=headers, media_type="application/json")
+
+    generation = response_cache.generation(tags)
+    response = await respond()
+    if response.status_code == status.HTTP_200_OK:
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        response_cache.set(key, response.body, headers, tags, generation)
+    response.headers["X-Cache"] = "miss"
+    return response
@@ -19,12 +19,80 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = Field(default="postgres", description="Database user")
     POSTGRES_PASSWORD: str = Field(default="", description="Database password")
 
+    DATABASE_POOL_SIZE: int = Field(default=10, description="Connections kept open per engine")
+    DATABASE_MAX_OVERFLOW: int = Field(default=20, description="Extra connections allowed above the pool size")
+    DATABASE_PGBOUNCER_MODE: bool = Field(
+        default=False, description="Connect through PgBouncer in transaction pooling mode"
+    )
+    DATABASE_PGBOUNCER_POOL_SIZE: int = Field(
+        default=0, description="Local connections kept open to PgBouncer, 0 opens one per session (NullPool)"
+    )
+    DATABASE_PGBOUNCER_POOL_RECYCLE_SECONDS: int = Field(
+        default=300, description="Reconnect local PgBouncer connections older than this, keep below client_idle_timeout"
+    )
+
+    DATABASE_READ_TIMEOUT_MS: int = Field(
+        default=5000, description="Statement timeout for GET requests, 0 keeps the server default"
+    )
+    DATABASE_WRITE_TIMEOUT_MS: int = Field(
+        default=15000, description="Statement timeout for POST, PATCH and DELETE requests, 0 keeps the server default"
+    )
+    DATABASE_ADMIN_TIMEOUT_MS: int = Field(
+        default=120000, description="Statement timeout for bulk admin operations, 0 keeps the server default"
+    )
+
     JWT_SECRET_KEY: str = Field(..., description="Secret key for JWT token generation")
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = Field(default=24, description="Token expiration time in hours")
 
     PROJECT_NAME: str = Field(default="Repair Requests CRM", description="Project name")
 
+    TICKET_ALLOW_REOPEN: bool = Field(default=True, description="Allow moving done tickets back to in_progress")
+
+    SOFT_DELETE_RETENTION_DAYS: int = Field(default=30, description="Days to keep soft-deleted rows before purging")
+    SOFT_DELETE_PURGE_INTERVAL_SECONDS: int = Field(
+        default=3600, description="Seconds between purge runs, 0 disables the background purge"
+    )
+    SOFT_DELETE_PURGE_BATCH_SIZE: int = Field(default=1000, description="Rows hard-deleted per purge transaction")
+
+    LOG_LEVEL: str = Field(default="INFO", description="Root log level")
+    LOG_JSON: bool = Field(default=True, description="Write log records as JSON lines, plain text otherwise")
+    LOG_QUEUE_SIZE: int = Field(
+        default=10000, description="Log records buffered for the writer thread; the oldest are dropped when full"
+    )
+    LOG_REQUEST_SAMPLE_RATE: float = Field(
+        default=0.1, ge=0, le=1, description="Share of fast successful requests logged; errors and slow ones always are"
+    )
+    LOG_SLOW_REQUEST_SECONDS: float = Field(default=1.0, description="Requests at least this slow are always logged")
+
+    RESPONSE_CACHE_TTL_SECONDS: float = Field(
+        default=10, description="Seconds list responses stay cached per process, 0 disables the response cache"
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=1000, description="Cached list responses kept per process")
+    RESPONSE_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024, description="Memory cached list responses may take per process"
+    )
+
+    COMPRESSION_ENABLED: bool = Field(
+        default=True, description="Compress responses with gzip or brotli; disable when a proxy compresses them"
+    )
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Smallest response body in bytes worth compressing")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip level, 1 (fastest) to 9 (smallest)")
+    COMPRESSION_BROTLI_QUALITY: int = Field(
+        default=4, ge=0, le=11, description="brotli quality, 0 (fastest) to 11 (smallest); needs the brotli package"
+    )
+
+    EXPORT_CHUNK_ROWS: int = Field(
+        default=1000, ge=1, description="Rows fetched from the export cursor and sent to the client at a time"
+    )
+
+    DB_REPORT_CACHE_SECONDS: int = Field(default=30, description="Seconds GET /admin/db/report serves a cached report")
+
+    SHARD_DATABASE_URLS: list[str] = Field(
+        default_factory=list,
+        description="JSON list of shard database URLs; when set, clients and tickets are sharded across them",
+    )
+
     @computed_field
     @property
     def database_url(self) -> str:
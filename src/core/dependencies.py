@@ -1,12 +1,50 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from typing import Annotated
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.database.session import async_session
+from src.database.session import async_session, shard_router
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY, RouteClass, statement_timeout_ms
 
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
+
+def route_class(value: RouteClass) -> Callable[[Request], None]:
+    """Route dependency overriding the statement timeout class, e.g. `Depends(route_class(RouteClass.ADMIN))`.
+
+    Pass it in the route decorator's `dependencies` so it runs before `get_db`.
+    """
+
+    def set_route_class(request: Request) -> None:
+        request.state.route_class = value
+
+    return set_route_class
+
+
+def get_route_class(request: Request) -> RouteClass:
+    explicit = getattr(request.state, "route_class", None)
+    if explicit is not None:
+        return explicit
+    return RouteClass.READ if request.method in READ_METHODS else RouteClass.WRITE
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Sessions for the app's database, sharded when shards are configured.
+
+    Take it instead of `get_db` to open a session that outlives the route, e.g.
+    inside a streamed response body: `get_db` closes its session before the
+    response is sent.
+    """
+    return shard_router.session_factory if shard_router else async_session
+
+
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
+
+
+async def get_db(request: Request, session_factory: SessionFactory) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory() as session:
+        session.info[STATEMENT_TIMEOUT_KEY] = statement_timeout_ms(get_route_class(request))
         try:
             yield session
         except Exception:
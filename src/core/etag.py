@@ -0,0 +1,50 @@
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from fastapi import Request, status
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from src.core.responses import ModelResponse
+
+# Clients may store responses but must revalidate them before reuse.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """A strong ETag from the values the representation depends on."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag`, using the weak comparison GET requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+async def conditional_response(
+    request: Request, version: Sequence[Any] | None, render: Callable[[], Awaitable[BaseModel]]
+) -> Response:
+    """Answer `304 Not Modified` when the client holds the current version, else render the model.
+
+    `version` is what the response depends on besides the URL, typically ids
+    and `updated_at` values from a cheap query. Without one the
+    model is rendered with no ETag, and `render` raises if the resource is
+    missing or forbidden. Read the version before rendering: a concurrent
+    write then pairs a newer body with an older ETag, which only costs the
+    client one more full response.
+    """
+    if version is None:
+        return ModelResponse(await render())
+
+    etag = make_etag(request.url.path, request.url.query, *version)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return ModelResponse(await render(), headers=headers)
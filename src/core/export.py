@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable, Mapping, Sequence
+from datetime import date
+from enum import StrEnum
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.responses import StreamingResponse
+
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY, RouteClass, statement_timeout_ms
+
+Rows = Sequence[Mapping[str, Any]]
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {ExportFormat.CSV: "text/csv", ExportFormat.NDJSON: "application/x-ndjson"}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, list | dict):
+        return json.dumps(value, default=_json_default, ensure_ascii=False)
+    return value
+
+
+def encode_csv(columns: Sequence[str], rows: Rows, header: bool = False) -> bytes:
+    """`rows` as CSV lines, lists and objects as JSON, after a header line of `columns` if asked."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(row[column]) for column in columns] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def encode_ndjson(columns: Sequence[str], rows: Rows) -> bytes:
+    """`rows` as one JSON object per line with the keys in `columns`."""
+    return b"".join(
+        json.dumps({column: row[column] for column in columns}, default=_json_default, ensure_ascii=False).encode()
+        + b"\n"
+        for row in rows
+    )
+
+
+def export_response(
+    session_factory: async_sessionmaker[AsyncSession],
+    export: Callable[[AsyncSession], AsyncIterator[Rows]],
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Stream the rows `export` yields, chunk by chunk, as a CSV or NDJSON attachment.
+
+    The body runs after the route has returned and its `get_db` session is
+    closed, so `export` gets a session of its own, opened when streaming
+    starts and closed when it ends or the client goes away. Check filters
+    before calling this: once the first byte is sent, errors can only cut
+    the download short. A CSV header is sent before the first query runs.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        if export_format == ExportFormat.CSV:
+            yield encode_csv(columns, (), header=True)
+
+        async with session_factory() as session:
+            session.info[STATEMENT_TIMEOUT_KEY] = statement_timeout_ms(RouteClass.READ)
+            async for rows in export(session):
+                if export_format == ExportFormat.CSV:
+                    yield encode_csv(columns, rows)
+                else:
+                    yield encode_ndjson(columns, rows)
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -0,0 +1,138 @@
+import json
+import logging
+import queue
+import random
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from src.core.config import settings
+
+# Attributes every LogRecord has; anything else on a record came from `extra`.
+RECORD_ATTRIBUTES = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and the record's `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update((key, value) for key, value in record.__dict__.items() if key not in RECORD_ATTRIBUTES)
+        if record.exc_info:
+            record.exc_text = record.exc_text or self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class DropOldestQueue(queue.Queue):
+    """A bounded queue whose `put` never blocks: when full, the oldest item is discarded.
+
+    Logging must never hold up a request, and under a backlog the newest
+    records are the ones worth keeping. `dropped` counts discarded items.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize)
+        self.dropped = 0
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        with self.not_full:
+            if 0 < self.maxsize <= self._qsize():
+                # The discarded item takes the new one's place in unfinished_tasks.
+                self._get()
+                self.dropped += 1
+            else:
+                self.unfinished_tasks += 1
+            self._put(item)
+            self.not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, block=False)
+
+
+class StructuredQueueHandler(QueueHandler):
+    """Hands records to the listener thread with the message and traceback rendered, `extra` intact."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class LogQueueListener(QueueListener):
+    """Writes queued records from a background thread and reports records dropped since the last write."""
+
+    queue: DropOldestQueue
+
+    def __init__(self, log_queue: DropOldestQueue, *handlers: logging.Handler) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.reported_dropped = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        dropped = self.queue.dropped
+        if dropped > self.reported_dropped:
+            super().handle(
+                logging.makeLogRecord(
+                    {
+                        "name": __name__,
+                        "levelno": logging.WARNING,
+                        "levelname": "WARNING",
+                        "msg": f"Dropped {dropped - self.reported_dropped} log records, the log queue was full",
+                        "dropped_total": dropped,
+                    }
+                )
+            )
+            self.reported_dropped = dropped
+        super().handle(record)
+
+
+class RequestSampler:
+    """Decides which completed requests are logged.
+
+    Errors (status 400 and above, or no response at all) and requests slower
+    than `slow_seconds` are always logged; other requests with probability
+    `success_rate`.
+    """
+
+    def __init__(self, success_rate: float, slow_seconds: float, rng: Callable[[], float] = random.random) -> None:
+        self.success_rate = success_rate
+        self.slow_seconds = slow_seconds
+        self.rng = rng
+
+    def keep(self, status_code: int | None, process_time: float) -> bool:
+        if status_code is None or status_code >= 400 or process_time >= self.slow_seconds:
+            return True
+        return self.success_rate >= 1 or self.rng() < self.success_rate
+
+
+def configure_logging() -> LogQueueListener:
+    """Route all logging through a bounded queue to a stdout handler on a background thread.
+
+    Call once at startup and `stop()` the returned listener at shutdown, which
+    writes out what is still queued.
+    """
+    log_queue = DropOldestQueue(settings.LOG_QUEUE_SIZE)
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(
+        JsonFormatter() if settings.LOG_JSON else logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.handlers = [StructuredQueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL)
+
+    listener = LogQueueListener(log_queue, output)
+    listener.start()
+    return listener
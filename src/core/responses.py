@@ -0,0 +1,30 @@
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def construct(model: type[ModelT], obj: Any, **values: Any) -> ModelT:
+    """Build an output model from `obj`'s attributes without validation.
+
+    Only for trusted data, such as rows loaded from the database, which were
+    validated on the way in. `values` set or override fields.
+    """
+    fields = {name: getattr(obj, name) for name in model.model_fields if name not in values}
+    return model.model_construct(**fields, **values)
+
+
+class ModelResponse(Response):
+    """JSON response serialized straight from a pydantic model by pydantic-core.
+
+    Returning one from a route skips FastAPI's `response_model` validation and
+    its second serialization pass; keep `response_model` on the route for the
+    OpenAPI schema. Pair it with models built by `construct`.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
@@ -1,16 +1,47 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 
 from fastapi import FastAPI
 
-from src.database.session import engine
+from src.core.config import settings
+from src.core.logging import configure_logging
+from src.database.session import async_session, engine, shard_engines, shard_router
+from src.database.soft_delete import run_purge_job
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    log_listener = configure_logging()
+
     async with engine.begin():
         pass
 
+    purge_tasks = []
+    if settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS > 0:
+        session_factories = shard_router.shard_session_factories if shard_router else [async_session]
+        purge_tasks = [
+            asyncio.create_task(
+                run_purge_job(
+                    session_factory,
+                    retention=timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS),
+                    interval_seconds=settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS,
+                    batch_size=settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+                )
+            )
+            for session_factory in session_factories
+        ]
+
     yield
 
+    for purge_task in purge_tasks:
+        purge_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await purge_task
+
     await engine.dispose()
+    for shard_engine in shard_engines:
+        await shard_engine.dispose()
+
+    log_listener.stop()
@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Integer, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+
+class BatchLoader(Generic[ModelT]):
+    """Loads rows of one model by id in a single `id = ANY(:ids)` query.
+
+    Results, including misses, are memoized for the lifetime of the loader,
+    so repeated lookups within one request never hit the database twice.
+    """
+
+    def __init__(self, db: AsyncSession, model: type[ModelT]) -> None:
+        self.db = db
+        self.model: Any = model
+        self._cache: dict[int, ModelT | None] = {}
+
+    async def load_many(self, ids: Iterable[int | None]) -> dict[int, ModelT]:
+        wanted = {entity_id for entity_id in ids if entity_id is not None}
+        missing = wanted - self._cache.keys()
+
+        if missing:
+            rows = await self.db.scalars(
+                select(self.model).where(self.model.id == any_(bindparam("ids", sorted(missing), type_=ARRAY(Integer))))
+            )
+            found = {row.id: row for row in rows}
+            for entity_id in missing:
+                self._cache[entity_id] = found.get(entity_id)
+
+        return {entity_id: row for entity_id in wanted if (row := self._cache[entity_id]) is not None}
+
+
+def get_batch_loader(db: AsyncSession, model: type[ModelT]) -> BatchLoader[ModelT]:
+    """Return the loader for `model` bound to this session, creating it on first use.
+
+    Sessions are created per request by `get_db`, so loaders are request-scoped.
+    """
+    loaders: dict[type, BatchLoader] = db.info.setdefault("batch_loaders", {})
+    if model not in loaders:
+        loaders[model] = BatchLoader(db, model)
+    return loaders[model]
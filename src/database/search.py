@@ -0,0 +1,13 @@
+from sqlalchemy import ColumnElement
+
+LIKE_ESCAPE = "\\"
+
+
+def ilike_contains(column: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """`column ILIKE '%term%'` with the wildcards in `term` escaped.
+
+    Unlike `icontains`, which compiles to `lower(column) LIKE ...`, a plain
+    ILIKE on the column can be served by a `gin_trgm_ops` index on it.
+    """
+    escaped = term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+    return column.ilike(f"%{escaped}%", escape=LIKE_ESCAPE)
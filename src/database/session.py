@@ -1,15 +1,49 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from src.core.config import settings
+from src.database.sharding import ShardRouter
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.is_development,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+
+def build_engine(url: str) -> AsyncEngine:
+    if not settings.DATABASE_PGBOUNCER_MODE:
+        return create_async_engine(
+            url,
+            echo=settings.is_development,
+            future=True,
+            pool_pre_ping=True,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        )
+
+    # In transaction pooling mode consecutive transactions may run on different
+    # server connections, so nothing may outlive a transaction: psycopg must not
+    # create named prepared statements. PgBouncer does the pooling; a local pool
+    # only saves reconnecting to it, and pre-ping would cost a server round trip
+    # per checkout, so stale connections are recycled by age instead.
+    connect_args = {"prepare_threshold": None}
+    if settings.DATABASE_PGBOUNCER_POOL_SIZE == 0:
+        return create_async_engine(
+            url,
+            echo=settings.is_development,
+            future=True,
+            poolclass=NullPool,
+            connect_args=connect_args,
+        )
+
+    return create_async_engine(
+        url,
+        echo=settings.is_development,
+        future=True,
+        pool_pre_ping=False,
+        pool_size=settings.DATABASE_PGBOUNCER_POOL_SIZE,
+        max_overflow=0,
+        pool_recycle=settings.DATABASE_PGBOUNCER_POOL_RECYCLE_SECONDS,
+        connect_args=connect_args,
+    )
+
+
+engine = build_engine(settings.database_url)
 
 async_session = async_sessionmaker(
     engine,
@@ -18,3 +52,7 @@ async_session = async_sessionmaker(
     autocommit=False,
     autoflush=False,
 )
+
+shard_engines = [build_engine(url) for url in settings.SHARD_DATABASE_URLS]
+
+shard_router = ShardRouter(engine, shard_engines) if shard_engines else None
@@ -0,0 +1,255 @@
+import asyncio
+import heapq
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from itertools import islice
+from typing import Any, TypeVar
+
+from sqlalchemy import BinaryExpression, BindParameter, Column, Executable, MetaData, Row, Select, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Mapper, ORMExecuteState
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BooleanClauseList, ClauseElement, Grouping
+
+from src.clients.models import TRIGRAM_EXTENSION
+from src.database.base import Base
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY
+
+T = TypeVar("T")
+
+PRIMARY_SHARD = "primary"
+
+# Sharded tables and the column whose value is the client id.
+SHARD_KEYS = {"clients": "id", "tickets": "client_id"}
+
+# Columns whose value names a shard when compared for equality in a WHERE clause.
+ROUTING_COLUMNS = {("clients", "id"), ("tickets", "id"), ("tickets", "client_id")}
+
+
+class ShardRouter:
+    """Places every client and its tickets on one of N databases by `client_id % N`.
+
+    Users stay on the primary database. Each shard allocates client and ticket
+    ids from sequences offset by the shard index (see `create_shard_schema`), so
+    `id % N` of any client or ticket names the shard that holds it.
+
+    `session_factory` builds sessions that route each ORM statement on their
+    own: by the instance being flushed, by the primary key being loaded, or by
+    an `id`/`client_id` equality in the WHERE clause. Statements without one run
+    on every shard and their rows are concatenated. Use `fetch_page` for
+    ordered, paginated lists across shards.
+    """
+
+    def __init__(self, primary: AsyncEngine, shards: Sequence[AsyncEngine]) -> None:
+        self.primary = primary
+        self.shards = list(shards)
+        self.shard_ids = [f"shard_{index}" for index in range(len(self.shards))]
+
+        self.session_factory = async_sessionmaker(
+            class_=AsyncSession,
+            sync_session_class=ShardedSession,
+            shards={
+                PRIMARY_SHARD: primary.sync_engine,
+                **{shard_id: shard.sync_engine for shard_id, shard in zip(self.shard_ids, self.shards)},
+            },
+            shard_chooser=self.choose_shard,
+            identity_chooser=self.choose_identity_shards,
+            execute_chooser=self.choose_execute_shards,
+            expire_on_commit=False,
+            autoflush=False,
+            info={"shard_router": self},
+        )
+        self.shard_session_factories = [
+            async_sessionmaker(shard, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+            for shard in self.shards
+        ]
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.shards)
+
+    def shard_for(self, client_id: int) -> str:
+        return self.shard_ids[client_id % self.shard_count]
+
+    def choose_shard(self, mapper: Mapper | None, instance: Any, **kw: Any) -> str:
+        if mapper is None or mapper.local_table.name not in SHARD_KEYS:
+            return PRIMARY_SHARD
+        if instance is None:
+            raise ValueError(f"Statements on {mapper.local_table.name} must be routed by the ORM")
+
+        client_id = getattr(instance, SHARD_KEYS[mapper.local_table.name])
+        if client_id is None:
+            # A new client: its id will come from the chosen shard's sequence.
+            return random.choice(self.shard_ids)
+        return self.shard_for(client_id)
+
+    def choose_identity_shards(self, mapper: Mapper, primary_key: Sequence[Any], **kw: Any) -> list[str]:
+        if mapper.local_table.name not in SHARD_KEYS:
+            return [PRIMARY_SHARD]
+        return [self.shard_for(primary_key[0])]
+
+    def choose_execute_shards(self, context: ORMExecuteState) -> list[str]:
+        if not any(mapper.local_table.name in SHARD_KEYS for mapper in context.all_mappers):
+            return [PRIMARY_SHARD]
+
+        parameters = context.parameters if isinstance(context.parameters, dict) else {}
+        routing_ids = _routing_ids(context.statement, parameters)
+        if not routing_ids:
+            return self.shard_ids
+        return sorted({self.shard_for(entity_id) for entity_id in routing_ids})
+
+    def _shard_session(self, index: int, timeout_ms: int | None) -> AsyncSession:
+        return self.shard_session_factories[index](info={STATEMENT_TIMEOUT_KEY: timeout_ms})
+
+    async def gather(self, fn: Callable[[AsyncSession], Awaitable[T]], timeout_ms: int | None = None) -> list[T]:
+        """Run `fn` concurrently on every shard, each with its own session.
+
+        Pass the calling session's `info[STATEMENT_TIMEOUT_KEY]` as `timeout_ms`
+        so the shard sessions apply the same statement timeout.
+        """
+
+        async def run(index: int) -> T:
+            async with self._shard_session(index, timeout_ms) as session:
+                return await fn(session)
+
+        return await asyncio.gather(*(run(index) for index in range(self.shard_count)))
+
+    async def stream(
+        self, query: Select, chunk_size: int, timeout_ms: int | None = None
+    ) -> AsyncIterator[Sequence[Row]]:
+        """The rows of `query`, shard after shard, `chunk_size` at a time from a server-side cursor."""
+        for index in range(self.shard_count):
+            async with self._shard_session(index, timeout_ms) as session:
+                result = await session.stream(query.execution_options(yield_per=chunk_size))
+                async for rows in result.partitions():
+                    yield rows
+
+    async def fetch_page(
+        self,
+        query: Select,
+        count_query: Select,
+        skip: int,
+        limit: int,
+        key: Callable[[Any], Any],
+        reverse: bool = False,
+        timeout_ms: int | None = None,
+    ) -> tuple[list[Any], int]:
+        """Paginate an ordered query across all shards.
+
+        Every shard returns its first `skip + limit` rows of `query`, which must
+        already be ordered consistently with `key` and `reverse`; the sorted
+        streams are merged and the requested page is cut from the merge.
+        """
+
+        async def fetch(session: AsyncSession) -> tuple[list[Any], int]:
+            total = await session.scalar(count_query) or 0
+            rows = await session.scalars(query.limit(skip + limit))
+            return list(rows), total
+
+        results = await self.gather(fetch, timeout_ms)
+        merged = heapq.merge(*(rows for rows, _ in results), key=key, reverse=reverse)
+        return list(islice(merged, skip, skip + limit)), sum(total for _, total in results)
+
+
+def get_shard_router(db: AsyncSession) -> ShardRouter | None:
+    return db.info.get("shard_router")
+
+
+async def execute_on_all_shards(db: AsyncSession, query: Executable) -> list[Row]:
+    """The rows of `query` from every shard when `db` is sharded, else from `db`, e.g. per-shard aggregates."""
+    shard_router = get_shard_router(db)
+    if shard_router is None:
+        return list(await db.execute(query))
+
+    async def fetch(session: AsyncSession) -> list[Row]:
+        return list(await session.execute(query))
+
+    return [row for rows in await shard_router.gather(fetch, db.info.get(STATEMENT_TIMEOUT_KEY)) for row in rows]
+
+
+async def stream_on_all_shards(db: AsyncSession, query: Select, chunk_size: int) -> AsyncIterator[Sequence[Row]]:
+    """The rows of `query` from every shard when `db` is sharded, else from `db`, `chunk_size` at a time.
+
+    Rows come from a server-side cursor, so memory stays flat however many match.
+    """
+    shard_router = get_shard_router(db)
+    if shard_router is not None:
+        async for rows in shard_router.stream(query, chunk_size, db.info.get(STATEMENT_TIMEOUT_KEY)):
+            yield rows
+        return
+
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for rows in result.partitions():
+        yield rows
+
+
+def _routing_ids(statement: Any, parameters: dict[str, Any]) -> set[int]:
+    whereclause = getattr(statement, "whereclause", None)
+    if whereclause is None:
+        return set()
+
+    routing_ids = set()
+    for element in _conjuncts(whereclause):
+        if (
+            isinstance(element, BinaryExpression)
+            and element.operator is operators.eq
+            and isinstance(element.left, Column)
+            and isinstance(element.right, BindParameter)
+            and (element.left.table.name, element.left.name) in ROUTING_COLUMNS
+        ):
+            # Session.get() passes the primary key as an execution parameter.
+            value = parameters.get(element.right.key, element.right.effective_value)
+            if value is None:
+                return set()
+            routing_ids.add(value)
+    return routing_ids
+
+
+def _conjuncts(clause: ClauseElement) -> Iterator[ClauseElement]:
+    """The terms ANDed together at the top of `clause`; an equality under OR or NOT narrows nothing."""
+    if isinstance(clause, Grouping):
+        yield from _conjuncts(clause.element)
+    elif isinstance(clause, BooleanClauseList) and clause.operator is operators.and_:
+        for term in clause.clauses:
+            yield from _conjuncts(term)
+    else:
+        yield clause
+
+
+def shard_metadata() -> MetaData:
+    """Sharded tables without foreign keys to tables that stay on the primary database."""
+    metadata = MetaData()
+    for table_name in SHARD_KEYS:
+        Base.metadata.tables[table_name].to_metadata(metadata)
+
+    for table in metadata.tables.values():
+        for constraint in list(table.foreign_key_constraints):
+            if constraint.elements[0].target_fullname.split(".")[0] not in metadata.tables:
+                table.constraints.discard(constraint)
+                for element in constraint.elements:
+                    table.foreign_keys.discard(element)
+                    element.parent.foreign_keys.discard(element)
+
+    # DDL listeners are not copied along with the tables.
+    event.listen(metadata.tables["clients"], "before_create", TRIGRAM_EXTENSION)
+    return metadata
+
+
+async def create_shard_schema(engine: AsyncEngine, shard_index: int, shard_count: int) -> None:
+    """Create the sharded tables on a new, empty shard database.
+
+    Id sequences step by `shard_count` from the first positive id congruent to
+    `shard_index`, so every id allocated on this shard satisfies
+    `id % shard_count == shard_index`.
+    """
+    metadata = shard_metadata()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        for table in metadata.sorted_tables:
+            await conn.execute(
+                text(
+                    f"ALTER SEQUENCE {table.name}_id_seq "
+                    f"INCREMENT BY {shard_count} RESTART WITH {shard_index or shard_count}"
+                )
+            )
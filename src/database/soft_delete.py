@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, ORMExecuteState, Session, mapped_column, with_loader_criteria
+
+from src.database.base import Base
+
+logger = logging.getLogger(__name__)
+
+LIVE_ROWS = text("deleted_at IS NULL")
+DELETED_ROWS = text("deleted_at IS NOT NULL")
+
+
+class SoftDeleteMixin:
+    """Rows are tombstoned with `deleted_at` instead of being deleted.
+
+    Every ORM select, update and delete issued through a session hides
+    tombstoned rows automatically. Pass `include_deleted=True` as an
+    execution option to see them (the purge job does this).
+    """
+
+    deleted_at: Mapped[datetime | None] = mapped_column(nullable=True, default=None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_soft_deleted_rows(execute_state: ORMExecuteState) -> None:
+    if (
+        (execute_state.is_select or execute_state.is_update or execute_state.is_delete)
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(SoftDeleteMixin, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+        )
+
+
+def _soft_delete_models() -> list[type[SoftDeleteMixin]]:
+    """Soft-deletable models ordered so that referencing tables are purged first."""
+    models = {
+        mapper.local_table: mapper.class_
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, SoftDeleteMixin)
+    }
+    return [models[table] for table in reversed(Base.metadata.sorted_tables) if table in models]
+
+
+async def purge_soft_deleted(db: AsyncSession, older_than: datetime, batch_size: int = 1000) -> int:
+    purged = 0
+
+    for model in _soft_delete_models():
+        while True:
+            batch = (
+                select(model.id)
+                .where(model.deleted_at < older_than)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                delete(model)
+                .where(model.id.in_(batch))
+                .execution_options(include_deleted=True, synchronize_session=False)
+            )
+            await db.commit()
+
+            purged += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+    return purged
+
+
+async def run_purge_job(
+    session_factory: async_sessionmaker[AsyncSession],
+    retention: timedelta,
+    interval_seconds: int,
+    batch_size: int,
+) -> None:
+    while True:
+        try:
+            async with session_factory() as session:
+                purged = await purge_soft_deleted(session, datetime.utcnow() - retention, batch_size)
+
+            if purged:
+                logger.info(f"Purged {purged} soft-deleted rows", extra={"purged": purged})
+        except Exception:
+            logger.exception("Soft-delete purge failed")
+
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,35 @@
+from enum import StrEnum
+
+from sqlalchemy import Connection, event, text
+from sqlalchemy.orm import Session, SessionTransaction
+
+from src.core.config import settings
+
+STATEMENT_TIMEOUT_KEY = "statement_timeout_ms"
+
+
+class RouteClass(StrEnum):
+    READ = "read"
+    WRITE = "write"
+    ADMIN = "admin"
+
+
+def statement_timeout_ms(route_class: RouteClass) -> int:
+    return {
+        RouteClass.READ: settings.DATABASE_READ_TIMEOUT_MS,
+        RouteClass.WRITE: settings.DATABASE_WRITE_TIMEOUT_MS,
+        RouteClass.ADMIN: settings.DATABASE_ADMIN_TIMEOUT_MS,
+    }[route_class]
+
+
+@event.listens_for(Session, "after_begin")
+def _set_statement_timeout(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    """Apply `session.info["statement_timeout_ms"]` to every transaction the session begins.
+
+    The setting is transaction-local (`SET LOCAL`), so it never leaks to the
+    next user of a pooled or PgBouncer connection, and each shard connection
+    of a sharded session gets it too. 0 or no value keeps the server default.
+    """
+    timeout = session.info.get(STATEMENT_TIMEOUT_KEY)
+    if timeout:
+        connection.execute(text("SELECT set_config('statement_timeout', :timeout, true)"), {"timeout": f"{timeout}ms"})
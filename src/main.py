@@ -1,17 +1,21 @@
 from fastapi import FastAPI, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 
+from src.admin.router import router as admin_router
 from src.auth.router import router as auth_router
 from src.clients.router import router as clients_router
 from src.core.config import settings
 from src.core.exceptions import AppException
 from src.database.events import lifespan
+from src.middleware.compression import CompressionMiddleware
+from src.middleware.disconnect import CancelOnDisconnectMiddleware
 from src.middleware.error_handler import (
     app_exception_handler,
     general_exception_handler,
     integrity_error_handler,
+    operational_error_handler,
     validation_exception_handler,
 )
 from src.middleware.logging import LoggingMiddleware
@@ -36,17 +40,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(CancelOnDisconnectMiddleware)
 
 app.add_exception_handler(AppException, app_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(IntegrityError, integrity_error_handler)
+app.add_exception_handler(OperationalError, operational_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(users_router, prefix="/users", tags=["Users"])
 app.include_router(clients_router, prefix="/clients", tags=["Clients"])
 app.include_router(tickets_router, prefix="/tickets", tags=["Tickets"])
+app.include_router(admin_router, prefix="/admin", tags=["Admin"])
 
 
 @app.get(
@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+from collections.abc import Callable
+from functools import partial
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+# Media types that shrink; images, archives and other binary bodies are already compressed.
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# From these levels on, compressing a large page takes milliseconds, so it runs in a worker thread.
+GZIP_THREAD_LEVEL = 7
+BROTLI_THREAD_QUALITY = 6
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """The `available` encoding the client weighs highest in Accept-Encoding, earlier ones winning ties."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip()] = weight
+
+    best, best_weight = None, 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli or gzip, whichever the client prefers.
+
+    brotli is used when the optional `brotli` package is installed. Only
+    complete bodies of at least `minimum_size` bytes with a compressible
+    media type are compressed. Responses that are already encoded,
+    bodiless, or streamed in several chunks (exports, server-sent events)
+    pass through untouched, so streaming keeps its constant memory and
+    early first byte. At CPU-heavy levels compression runs in a worker
+    thread to keep the event loop free.
+
+    Compressed responses get `Vary: Accept-Encoding`, and a strong ETag is
+    made weak, as the bytes no longer match the identity representation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_level: int = settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = settings.COMPRESSION_BROTLI_QUALITY,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compressors: dict[str, tuple[Callable[[bytes], bytes], bool]] = {
+            "gzip": (partial(gzip.compress, compresslevel=gzip_level, mtime=0), gzip_level >= GZIP_THREAD_LEVEL),
+        }
+        if brotli is not None:
+            self.compressors = {
+                "br": (partial(brotli.compress, quality=brotli_quality), brotli_quality >= BROTLI_THREAD_QUALITY),
+                **self.compressors,
+            }
+        self.encodings = tuple(self.compressors)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "")
+                if "content-encoding" in headers or not media_type.startswith(COMPRESSIBLE_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            # The first body message: compress it if it is the whole, large enough body.
+            passthrough = True
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                await send(start_message)
+                await send(message)
+                return
+
+            compress, in_thread = self.compressors[encoding]
+            compressed = await asyncio.to_thread(compress, body) if in_thread else compress(body)
+
+            headers = MutableHeaders(scope=start_message)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
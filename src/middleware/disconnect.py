@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class CancelOnDisconnectMiddleware:
+    """Cancel the request handler as soon as the HTTP client disconnects.
+
+    The handler runs as a separate task while this middleware watches the
+    client's messages. On `http.disconnect` before the response is complete
+    the task is cancelled: psycopg then cancels the running query on the
+    server and `get_db` returns the connection to the pool instead of
+    finishing work nobody will read. Background tasks that run after the
+    response has been sent are left alone.
+
+    Pure ASGI rather than `BaseHTTPMiddleware`, which would hide the
+    disconnect behind its own receive channel.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        disconnected = False
+        response_complete = False
+
+        async def watch_client() -> None:
+            nonlocal disconnected
+            while not disconnected:
+                message = await receive()
+                disconnected = message["type"] == "http.disconnect"
+                messages.put_nowait(message)
+
+        async def receive_from_queue() -> Message:
+            if disconnected and messages.empty():
+                return {"type": "http.disconnect"}
+            return await messages.get()
+
+        async def send_and_track(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        handler = asyncio.create_task(self.app(scope, receive_from_queue, send_and_track))
+        watcher = asyncio.create_task(watch_client())
+
+        try:
+            await asyncio.wait({handler, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if not handler.done() and disconnected and not response_complete:
+                handler.cancel()
+                logger.info(
+                    f"Client disconnected, cancelled {scope['method']} {scope['path']}",
+                    extra={"method": scope["method"], "path": scope["path"]},
+                )
+                try:
+                    await handler
+                except asyncio.CancelledError:
+                    pass
+                return
+
+            await handler
+        finally:
+            watcher.cancel()
+            handler.cancel()
@@ -3,7 +3,8 @@ import logging
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from sqlalchemy.exc import IntegrityError
+from psycopg.errors import QueryCanceled
+from sqlalchemy.exc import IntegrityError, OperationalError
 
 from src.core.exceptions import AppException
 
@@ -27,17 +28,24 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-    logger.warning(
-        f"Validation error: {exc.errors()}",
-        extra={"path": request.url.path, "method": request.method},
-    )
+    errors = exc.errors()
+    if logger.isEnabledFor(logging.WARNING):
+        # Locations and error types only: the full errors repeat the (possibly large) input.
+        logger.warning(
+            f"Validation error: {len(errors)} invalid fields",
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "errors": [{"loc": error["loc"], "type": error["type"]} for error in errors],
+            },
+        )
 
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "ValidationError",
             "detail": "Request validation failed",
-            "errors": exc.errors(),
+            "errors": errors,
         },
     )
 
@@ -57,6 +65,24 @@ async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSON
     )
 
 
+async def operational_error_handler(request: Request, exc: OperationalError) -> JSONResponse:
+    if not isinstance(exc.orig, QueryCanceled):
+        return await general_exception_handler(request, exc)
+
+    logger.warning(
+        f"Database statement timed out: {exc.orig}",
+        extra={"path": request.url.path, "method": request.method},
+    )
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": "DatabaseTimeoutError",
+            "detail": "Database query took too long, try narrowing the request",
+        },
+    )
+
+
 async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger.exception(
         f"Unhandled exception: {str(exc)}",
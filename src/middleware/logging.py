@@ -1,40 +1,68 @@
 import logging
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.logging import RequestSampler
 
 logger = logging.getLogger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        start_time = time.time()
+class LoggingMiddleware:
+    """Log HTTP requests and add their processing time as `X-Process-Time`.
+
+    Pure ASGI: the response passes straight through a wrapped `send`, so
+    there is no extra task or memory stream per request and streaming
+    responses are not buffered. `X-Process-Time` is the time until the
+    response starts; the completion log also includes sending the body.
+
+    Each request gets one INFO record when it completes, subject to the
+    `sampler`, and a DEBUG record when it starts. Records are only built
+    when they will be logged.
+    """
 
-        logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
-            },
-        )
+    def __init__(self, app: ASGIApp, sampler: RequestSampler | None = None) -> None:
+        self.app = app
+        self.sampler = sampler or RequestSampler(settings.LOG_REQUEST_SAMPLE_RATE, settings.LOG_SLOW_REQUEST_SECONDS)
 
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        process_time = time.time() - start_time
+        start_time = time.perf_counter()
+        status_code = None
 
-        logger.info(
-            f"Request completed: {response.status_code} in {process_time:.4f}s",
-            extra={
-                "status_code": response.status_code,
-                "process_time": process_time,
-                "path": request.url.path,
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Request started: {scope['method']} {scope['path']}",
+                extra={"method": scope["method"], "path": scope["path"]},
+            )
 
-        response.headers["X-Process-Time"] = f"{process_time:.4f}"
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{time.perf_counter() - start_time:.4f}")
+            await send(message)
 
-        return response
+        try:
+            await self.app(scope, receive, send_with_process_time)
+        finally:
+            process_time = time.perf_counter() - start_time
+            if logger.isEnabledFor(logging.INFO) and self.sampler.keep(status_code, process_time):
+                client = scope.get("client")
+                logger.info(
+                    f"Request completed: {scope['method']} {scope['path']} {status_code} in {process_time:.4f}s",
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "query_params": scope["query_string"].decode("latin-1"),
+                        "client_host": client[0] if client else None,
+                        "status_code": status_code,
+                        "process_time": process_time,
+                    },
+                )
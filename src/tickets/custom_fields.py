@@ -0,0 +1,193 @@
+"""Admin-defined ticket fields stored in the `tickets.custom_fields` JSONB column.
+
+Values are validated against their `TicketFieldDefinition` on every write.
+Searchable fields get a partial expression index, created and dropped by
+`sync_custom_field_indexes` in the background whenever definitions change
+(until it is built the field is reported `pending`), and can be filtered
+on with equality or, for numbers and dates, range comparisons. Filters use
+exactly the indexed expression so Postgres can match the index:
+
+- strings and booleans: `custom_fields ->> 'key'`;
+- integers and numbers: `(custom_fields ->> 'key')::numeric`;
+- dates, stored as `YYYY-MM-DD`: `custom_fields ->> 'key'` in the "C"
+  collation, so the text order is the date order.
+"""
+
+import logging
+import re
+from collections.abc import Mapping, Sequence
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, Literal
+
+from sqlalchemy import ColumnElement, Numeric, Text, bindparam, cast, literal_column, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.tickets.exceptions import InvalidCustomFieldError
+from src.tickets.models import CUSTOM_FIELD_KEY_MAX_LENGTH, CustomFieldType, Ticket, TicketFieldDefinition
+
+logger = logging.getLogger(__name__)
+
+FilterOperator = Literal["eq", "gt", "gte", "lt", "lte"]
+
+KEY_PATTERN = re.compile(rf"[a-z][a-z0-9_]{{0,{CUSTOM_FIELD_KEY_MAX_LENGTH - 1}}}")
+MAX_STRING_LENGTH = 200
+INDEX_PREFIX = "ix_tickets_cf_"
+
+RANGE_TYPES = {CustomFieldType.INTEGER, CustomFieldType.NUMBER, CustomFieldType.DATE}
+
+INDEX_EXPRESSIONS = {
+    CustomFieldType.STRING: "(custom_fields ->> '{key}')",
+    CustomFieldType.BOOLEAN: "(custom_fields ->> '{key}')",
+    CustomFieldType.INTEGER: "((custom_fields ->> '{key}')::numeric)",
+    CustomFieldType.NUMBER: "((custom_fields ->> '{key}')::numeric)",
+    CustomFieldType.DATE: "((custom_fields ->> '{key}') COLLATE \"C\")",
+}
+
+
+# Custom field indexes on the tickets table and whether they are valid, i.e. completely built.
+INDEXES_QUERY = text(
+    "SELECT c.relname AS name, i.indisvalid AS valid FROM pg_index i "
+    "JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE i.indrelid = 'tickets'::regclass AND starts_with(c.relname, :prefix)"
+).bindparams(prefix=INDEX_PREFIX)
+
+
+def index_name(key: str) -> str:
+    return f"{INDEX_PREFIX}{key}"
+
+
+def field_expression(definition: TicketFieldDefinition) -> ColumnElement:
+    # The key is rendered inline, not as a parameter, so the expression matches the index.
+    value = Ticket.custom_fields.op("->>", return_type=Text)(literal_column(f"'{definition.key}'"))
+    if definition.type in (CustomFieldType.INTEGER, CustomFieldType.NUMBER):
+        return cast(value, Numeric)
+    if definition.type == CustomFieldType.DATE:
+        return value.collate("C")
+    return value
+
+
+def _coerce(definition: TicketFieldDefinition, value: Any) -> Any:
+    field_type = definition.type
+
+    if field_type == CustomFieldType.STRING and isinstance(value, str) and len(value) <= MAX_STRING_LENGTH:
+        return value
+    if field_type == CustomFieldType.INTEGER and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if field_type == CustomFieldType.NUMBER and isinstance(value, int | float) and not isinstance(value, bool):
+        return value
+    if field_type == CustomFieldType.BOOLEAN and isinstance(value, bool):
+        return value
+    if field_type == CustomFieldType.DATE and isinstance(value, str):
+        try:
+            return date.fromisoformat(value).isoformat()
+        except ValueError:
+            pass
+
+    raise InvalidCustomFieldError(f"{definition.key} expects a {field_type} value, got {value!r}")
+
+
+def validate_custom_fields(
+    definitions: Mapping[str, TicketFieldDefinition], values: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Check `values` against the field definitions; None values are kept and mean "remove"."""
+    unknown = sorted(set(values) - set(definitions))
+    if unknown:
+        raise InvalidCustomFieldError(f"Unknown custom fields: {', '.join(unknown)}")
+
+    return {key: None if value is None else _coerce(definitions[key], value) for key, value in values.items()}
+
+
+def merge_custom_fields(current: Mapping[str, Any], changes: Mapping[str, Any]) -> dict[str, Any]:
+    merged = {**current, **changes}
+    return {key: value for key, value in merged.items() if value is not None}
+
+
+def _filter_value(definition: TicketFieldDefinition, raw: str) -> Any:
+    if definition.type in (CustomFieldType.INTEGER, CustomFieldType.NUMBER):
+        try:
+            return Decimal(raw)
+        except InvalidOperation:
+            raise InvalidCustomFieldError(f"{definition.key} expects a number, got {raw!r}") from None
+
+    if definition.type == CustomFieldType.BOOLEAN:
+        if raw.lower() not in ("true", "false"):
+            raise InvalidCustomFieldError(f"{definition.key} expects true or false, got {raw!r}")
+        return raw.lower()
+
+    if definition.type == CustomFieldType.DATE:
+        return _coerce(definition, raw)
+
+    return raw
+
+
+def custom_field_condition(
+    definition: TicketFieldDefinition, operator: FilterOperator, raw: str
+) -> ColumnElement[bool]:
+    if not definition.searchable:
+        raise InvalidCustomFieldError(f"{definition.key} is not searchable")
+    if operator != "eq" and definition.type not in RANGE_TYPES:
+        raise InvalidCustomFieldError(f"{definition.key} only supports equality filters")
+
+    expression = field_expression(definition)
+    value = bindparam(None, _filter_value(definition, raw), type_=expression.type)
+    return {
+        "eq": expression == value,
+        "gt": expression > value,
+        "gte": expression >= value,
+        "lt": expression < value,
+        "lte": expression <= value,
+    }[operator]
+
+
+async def sync_custom_field_indexes(engine: AsyncEngine, definitions: list[TicketFieldDefinition]) -> None:
+    """Make the custom field indexes on `engine` match the searchable definitions.
+
+    Indexes are built and dropped concurrently, so writes to tickets are not
+    blocked. A build that fails, e.g. on a stored value the index expression
+    cannot cast, is logged and its invalid index dropped, so the field stays
+    pending until the next sync builds it. An interrupted build leaves an
+    invalid index behind, which the next sync drops and builds again.
+    """
+    wanted = {
+        index_name(definition.key): INDEX_EXPRESSIONS[definition.type].format(key=definition.key)
+        for definition in definitions
+        if definition.searchable
+    }
+
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        existing = {name: valid for name, valid in await conn.execute(INDEXES_QUERY)}
+
+        for name, valid in existing.items():
+            if name not in wanted or not valid:
+                await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+                logger.info(f"Dropped custom field index {name}", extra={"index": name})
+
+        for name, expression in wanted.items():
+            if not existing.get(name):
+                try:
+                    await conn.execute(
+                        text(f'CREATE INDEX CONCURRENTLY "{name}" ON tickets ({expression}) WHERE deleted_at IS NULL')
+                    )
+                except DBAPIError:
+                    logger.exception(f"Building custom field index {name} failed", extra={"index": name})
+                    await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+                    continue
+                logger.info(f"Created custom field index {name}", extra={"index": name})
+
+
+async def build_custom_field_indexes(engines: Sequence[AsyncEngine], definitions: list[TicketFieldDefinition]) -> None:
+    """Sync the custom field indexes on every database holding tickets, as a background task.
+
+    A database that cannot be synced is logged and skipped; its fields stay
+    pending until the next sync.
+    """
+    for engine in engines:
+        try:
+            await sync_custom_field_indexes(engine, definitions)
+        except Exception:
+            logger.exception(
+                f"Syncing custom field indexes failed on {engine.url.render_as_string(hide_password=True)}"
+            )
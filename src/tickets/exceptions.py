@@ -26,3 +26,28 @@ class InvalidStatusTransitionError(TicketException):
 class WorkerNotFoundError(TicketException):
     def __init__(self, worker_id: int) -> None:
         super().__init__(message=f"Worker with ID {worker_id} not found", status_code=404)
+
+
+class NoTicketToClaimError(TicketException):
+    def __init__(self) -> None:
+        super().__init__(message="No unassigned new tickets to claim", status_code=404)
+
+
+class InvalidTicketQueryError(TicketException):
+    def __init__(self, message: str) -> None:
+        super().__init__(message=f"Invalid ticket query: {message}", status_code=400)
+
+
+class InvalidCustomFieldError(TicketException):
+    def __init__(self, message: str) -> None:
+        super().__init__(message=message, status_code=422)
+
+
+class CustomFieldNotFoundError(TicketException):
+    def __init__(self, key: str) -> None:
+        super().__init__(message=f"Custom field {key!r} not found", status_code=404)
+
+
+class CustomFieldExistsError(TicketException):
+    def __init__(self, key: str) -> None:
+        super().__init__(message=f"Custom field {key!r} already exists", status_code=409)
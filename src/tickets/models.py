@@ -1,33 +1,88 @@
 from __future__ import annotations
 
 from datetime import datetime
-from enum import StrEnum
-from typing import TYPE_CHECKING
+from enum import IntEnum, StrEnum
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, SmallInteger, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
+from src.database.soft_delete import DELETED_ROWS, LIVE_ROWS, SoftDeleteMixin
 
 if TYPE_CHECKING:
     from src.clients.models import Client
     from src.users.models import User
 
 
+TAG_MAX_LENGTH = 50
+CUSTOM_FIELD_KEY_MAX_LENGTH = 40
+
+
 class TicketStatus(StrEnum):
     NEW = "new"
     IN_PROGRESS = "in_progress"
     DONE = "done"
 
 
-class Ticket(Base):
+class TicketPriority(IntEnum):
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
+    URGENT = 4
+
+
+class TicketSort(StrEnum):
+    NEWEST = "newest"
+    QUEUE = "queue"
+
+
+class Ticket(SoftDeleteMixin, Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        Index("ix_tickets_title", "title", postgresql_where=LIVE_ROWS),
+        Index("ix_tickets_status", "status", postgresql_where=LIVE_ROWS),
+        Index("ix_tickets_created_at", "created_at", postgresql_where=LIVE_ROWS),
+        Index(
+            "ix_tickets_updated_at_brin",
+            "updated_at",
+            postgresql_using="brin",
+            postgresql_with={"autosummarize": "on"},
+            postgresql_where=LIVE_ROWS,
+        ),
+        Index("ix_tickets_tags", "tags", postgresql_using="gin", postgresql_where=LIVE_ROWS),
+        Index("ix_tickets_deleted_at", "deleted_at", postgresql_where=DELETED_ROWS),
+        # Each worker's queue in `sort=queue` order, so their next tickets are read without sorting.
+        Index(
+            "ix_tickets_worker_queue",
+            "assigned_worker_id",
+            text("priority DESC"),
+            "due_at",
+            "created_at",
+            "id",
+            postgresql_where=LIVE_ROWS,
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    title: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[TicketStatus] = mapped_column(String(20), nullable=False, default=TicketStatus.NEW, index=True)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False, index=True)
+    status: Mapped[TicketStatus] = mapped_column(String(20), nullable=False, default=TicketStatus.NEW)
+    priority: Mapped[TicketPriority] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=TicketPriority.NORMAL,
+        server_default=text(str(TicketPriority.NORMAL.value)),
+    )
+    due_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    tags: Mapped[list[str]] = mapped_column(
+        ARRAY(String(TAG_MAX_LENGTH)), nullable=False, default=list, server_default=text("'{}'")
+    )
+    custom_fields: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, default=dict, server_default=text("'{}'")
+    )
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     client_id: Mapped[int] = mapped_column(ForeignKey("clients.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -40,3 +95,32 @@ class Ticket(Base):
 
     def __repr__(self) -> str:
         return f"Ticket(id={self.id}, title={self.title!r}, status={self.status})"
+
+
+class CustomFieldType(StrEnum):
+    STRING = "string"
+    INTEGER = "integer"
+    NUMBER = "number"
+    DATE = "date"
+    BOOLEAN = "boolean"
+
+
+class CustomFieldIndexStatus(StrEnum):
+    READY = "ready"
+    PENDING = "pending"
+
+
+class TicketFieldDefinition(Base):
+    """Admin-defined field stored under `key` in `Ticket.custom_fields`."""
+
+    __tablename__ = "ticket_field_definitions"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(String(CUSTOM_FIELD_KEY_MAX_LENGTH), unique=True, nullable=False)
+    label: Mapped[str] = mapped_column(String(100), nullable=False)
+    type: Mapped[CustomFieldType] = mapped_column(String(20), nullable=False)
+    searchable: Mapped[bool] = mapped_column(default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TicketFieldDefinition(key={self.key!r}, type={self.type}, searchable={self.searchable})"
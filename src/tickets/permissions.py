@@ -1,25 +1,63 @@
+from enum import StrEnum
+
+from sqlalchemy import ColumnElement, false, true
+
 from src.tickets.models import Ticket
 from src.users.models import User, UserRole
 
 
-def can_view_ticket(user: User, ticket: Ticket) -> bool:
+class TicketScope(StrEnum):
+    ALL = "all"
+    ASSIGNED = "assigned"
+    NONE = "none"
+
+
+def ticket_scope(user: User) -> TicketScope:
+    """The tickets a user may see and modify.
+
+    This is the only place the ticket access rules are spelled out; the
+    boolean checks and the SQL predicates below are both derived from it.
+    """
     if user.role == UserRole.ADMIN:
-        return True
+        return TicketScope.ALL
 
     if user.role == UserRole.WORKER:
-        return ticket.assigned_worker_id == user.id
+        return TicketScope.ASSIGNED
+
+    return TicketScope.NONE
+
+
+def _allows(user: User, ticket: Ticket) -> bool:
+    scope = ticket_scope(user)
+    return scope == TicketScope.ALL or (scope == TicketScope.ASSIGNED and ticket.assigned_worker_id == user.id)
+
+
+def _clause(user: User) -> ColumnElement[bool]:
+    scope = ticket_scope(user)
 
-    return False
+    if scope == TicketScope.ALL:
+        return true()
+
+    if scope == TicketScope.ASSIGNED:
+        return Ticket.assigned_worker_id == user.id
+
+    return false()
+
+
+def can_view_ticket(user: User, ticket: Ticket) -> bool:
+    return _allows(user, ticket)
+
+
+def can_view_ticket_clause(user: User) -> ColumnElement[bool]:
+    return _clause(user)
 
 
 def can_modify_ticket(user: User, ticket: Ticket) -> bool:
-    if user.role == UserRole.ADMIN:
-        return True
+    return _allows(user, ticket)
 
-    if user.role == UserRole.WORKER:
-        return ticket.assigned_worker_id == user.id
 
-    return False
+def can_modify_ticket_clause(user: User) -> ColumnElement[bool]:
+    return _clause(user)
 
 
 def can_assign_ticket(user: User) -> bool:
@@ -27,4 +65,4 @@ def can_assign_ticket(user: User) -> bool:
 
 
 def can_view_all_tickets(user: User) -> bool:
-    return user.role == UserRole.ADMIN
+    return ticket_scope(user) == TicketScope.ALL
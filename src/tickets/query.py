@@ -0,0 +1,329 @@
+"""Compact filter language for ticket lists (`GET /tickets?q=...`).
+
+    status:new,in_progress worker:none created:>2026-01-01 client:"acme" boiler
+
+A query is a whitespace-separated list of terms that must all match. A term
+is `field:value`, optionally prefixed with `-` to negate it; a bare word or
+quoted phrase searches titles. Comma-separated values are alternatives.
+Matching is case-insensitive and quoted values cannot contain quotes.
+
+- `status:` ticket statuses;
+- `worker:` worker ids, `me` or `none`;
+- `client:` client ids or client name fragments;
+- `title:` title fragments;
+- `tag:` tags, any of the listed ones (repeat the term to require several);
+- `id:` ticket ids;
+- `created:`, `updated:` a date or ISO datetime prefixed with `>`, `>=`, `<`
+  or `<=`, a day, or a `start..end` range (`*` leaves a side open). Dates
+  are whole days: `created:<=2026-01-31` includes January 31st.
+
+Queries compile to plans of SQL predicates. Each predicate is written in a
+form an index on its column can serve, if the table has one (a negated
+status becomes the complementary `IN` list, a client name a semi-join
+through the client name index) and is labelled with the access path it
+allows: `seek` for a btree or GIN index, `range` for a BRIN index, `scan`
+otherwise. Predicates are ordered so the most selective indexed ones come
+first. Plans are cached by the normalized query, so spelling variants of
+the same filter share one plan.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+
+from sqlalchemy import Column, ColumnElement, and_, false, not_, or_, select
+
+from src.clients.models import Client
+from src.database.search import ilike_contains
+from src.tickets.exceptions import InvalidTicketQueryError
+from src.tickets.models import Ticket, TicketStatus
+from src.users.models import User
+
+PLAN_CACHE_SIZE = 512
+MAX_TERMS = 20
+
+TERM = re.compile(r'\s*(-)?(?:([a-z_]+):)?((?:"[^"]*"|[^\s"])+)', re.IGNORECASE)
+VALUE = re.compile(r'"([^"]*)"|([^,"]+)')
+COMPARISON = re.compile(r"(>=|<=|>|<)?(.+)")
+
+STRATEGIES = ("seek", "range", "scan")
+DATE_FIELDS = {"created", "updated"}
+
+Clause = Callable[[User], ColumnElement[bool]]
+
+
+@dataclass(frozen=True, slots=True)
+class Term:
+    field: str
+    values: tuple[str, ...]
+    negated: bool = False
+
+    def __str__(self) -> str:
+        values = ",".join(f'"{value}"' if re.search(r'[\s,"]', value) else value for value in self.values)
+        return f"{'-' if self.negated else ''}{self.field}:{values}"
+
+
+@dataclass(frozen=True, slots=True)
+class Predicate:
+    term: Term
+    strategy: str
+    selectivity: int
+    clause: Clause
+
+    @property
+    def sort_key(self) -> tuple[int, int]:
+        return STRATEGIES.index(self.strategy), self.selectivity
+
+
+@dataclass(frozen=True, slots=True)
+class TicketQueryPlan:
+    query: str
+    predicates: tuple[Predicate, ...]
+
+    def where(self, user: User) -> list[ColumnElement[bool]]:
+        return [predicate.clause(user) for predicate in self.predicates]
+
+    def explain(self) -> list[str]:
+        return [f"{predicate.strategy:<5} {predicate.term}" for predicate in self.predicates]
+
+
+def parse(query: str) -> list[Term]:
+    terms = []
+    position = 0
+    query = query.rstrip()
+
+    while position < len(query):
+        match = TERM.match(query, position)
+        if not match:
+            quote = query.index('"', position)
+            raise InvalidTicketQueryError(f"Unterminated quote at position {quote + 1}")
+
+        negated, field, raw = match.groups()
+        if field is None and raw.endswith(":"):
+            if query.startswith('"', match.end()):
+                raise InvalidTicketQueryError(f"Unterminated quote at position {match.end() + 1}")
+            raise InvalidTicketQueryError(f"Missing value for {raw}")
+
+        if field is None:
+            values = (_unquote(raw),)
+        else:
+            values = tuple(quoted or bare for quoted, bare in VALUE.findall(raw))
+        values = tuple(value for value in values if value.strip())
+        if not values:
+            raise InvalidTicketQueryError(f"Missing value for {field or 'title'}:")
+
+        terms.append(Term(field.lower() if field else "title", values, bool(negated)))
+
+        position = match.end()
+
+    if len(terms) > MAX_TERMS:
+        raise InvalidTicketQueryError(f"Queries are limited to {MAX_TERMS} terms")
+
+    return terms
+
+
+def normalize(terms: list[Term]) -> str:
+    """Canonical spelling of a query: lower case, sorted and deduplicated; dates are kept as typed."""
+    normalized = set()
+    for term in terms:
+        values = [value.strip() for value in term.values]
+        if term.field not in DATE_FIELDS:
+            values = sorted({value.lower() for value in values})
+        normalized.add(Term(term.field, tuple(values), term.negated))
+
+    return " ".join(sorted(map(str, normalized)))
+
+
+def get_query_plan(query: str) -> TicketQueryPlan:
+    return _compile(normalize(parse(query)))
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile(normalized: str) -> TicketQueryPlan:
+    predicates = []
+    for term in parse(normalized):
+        compiler = COMPILERS.get(term.field)
+        if compiler is None:
+            raise InvalidTicketQueryError(
+                f"Unknown filter field {term.field!r}, expected one of {', '.join(COMPILERS)}"
+            )
+        predicates.append(compiler(term))
+
+    return TicketQueryPlan(normalized, tuple(sorted(predicates, key=lambda predicate: predicate.sort_key)))
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) > 1 and value[0] == value[-1] == '"' else value
+
+
+def _index_kinds() -> dict[str, str]:
+    """Index method of the leading column of every index on the tickets table."""
+    kinds = {column.name: "btree" for column in Ticket.__table__.primary_key}
+    for index in Ticket.__table__.indexes:
+        column = index.expressions[0]
+        if isinstance(column, Column):
+            kinds.setdefault(column.name, index.dialect_options["postgresql"]["using"] or "btree")
+    return kinds
+
+
+INDEX_KINDS = _index_kinds()
+
+
+def _strategy(column: Column, indexable: bool = True) -> str:
+    if not indexable:
+        return "scan"
+    return {"btree": "seek", "gin": "seek", "brin": "range"}.get(INDEX_KINDS.get(column.name, ""), "scan")
+
+
+def _ids(term: Term) -> list[int]:
+    try:
+        return [int(value) for value in term.values]
+    except ValueError:
+        raise InvalidTicketQueryError(f"{term.field}: expects numeric ids") from None
+
+
+def _in(column: Column, values: list, negated: bool) -> ColumnElement[bool]:
+    return column.not_in(values) if negated else column.in_(values)
+
+
+def _compile_id(term: Term) -> Predicate:
+    clause = _in(Ticket.id, _ids(term), term.negated)
+    return Predicate(term, _strategy(Ticket.id, not term.negated), 0, lambda user: clause)
+
+
+def _compile_status(term: Term) -> Predicate:
+    try:
+        statuses = {TicketStatus(value) for value in term.values}
+    except ValueError:
+        expected = ", ".join(status.value for status in TicketStatus)
+        raise InvalidTicketQueryError(f"status: expects one of {expected}") from None
+
+    # Statuses are a closed set: a negation is the complementary list, which the index can serve.
+    if term.negated:
+        statuses = set(TicketStatus) - statuses
+    clause = Ticket.status.in_(sorted(statuses)) if statuses else false()
+    return Predicate(term, _strategy(Ticket.status), 3, lambda user: clause)
+
+
+def _compile_worker(term: Term) -> Predicate:
+    unassigned = "none" in term.values
+    include_current = "me" in term.values
+    worker_ids = _ids(Term(term.field, tuple(value for value in term.values if value not in ("none", "me"))))
+
+    def clause(user: User) -> ColumnElement[bool]:
+        ids = worker_ids + [user.id] if include_current else worker_ids
+        matches = or_(
+            *([Ticket.assigned_worker_id.is_(None)] if unassigned else []),
+            *([Ticket.assigned_worker_id.in_(ids)] if ids else []),
+        )
+        if not term.negated:
+            return matches
+        # NOT IN never matches NULL, so `-worker:5` keeps unassigned tickets explicitly.
+        return not_(matches) if unassigned else or_(Ticket.assigned_worker_id.is_(None), not_(matches))
+
+    return Predicate(term, _strategy(Ticket.assigned_worker_id, not term.negated), 2, clause)
+
+
+def _compile_client(term: Term) -> Predicate:
+    client_ids = [int(value) for value in term.values if value.isdigit()]
+    names = [value for value in term.values if not value.isdigit()]
+
+    conditions = []
+    if client_ids:
+        conditions.append(Ticket.client_id.in_(client_ids))
+    if names:
+        # A semi-join: matching client ids come from the trigram index on client names.
+        matching_clients = select(Client.id).where(or_(*(ilike_contains(Client.full_name, name) for name in names)))
+        conditions.append(Ticket.client_id.in_(matching_clients))
+
+    clause = not_(or_(*conditions)) if term.negated else or_(*conditions)
+    return Predicate(term, _strategy(Ticket.client_id, not term.negated), 1 if not names else 4, lambda user: clause)
+
+
+def _compile_title(term: Term) -> Predicate:
+    matches = or_(*(ilike_contains(Ticket.title, value) for value in term.values))
+    clause = not_(matches) if term.negated else matches
+    return Predicate(term, "scan", 9, lambda user: clause)
+
+
+def _compile_tag(term: Term) -> Predicate:
+    matches = Ticket.tags.overlap(list(term.values))
+    clause = not_(matches) if term.negated else matches
+    return Predicate(term, _strategy(Ticket.tags, not term.negated), 5, lambda user: clause)
+
+
+def _parse_moment(value: str, field: str) -> tuple[datetime, bool]:
+    """The start of a date or datetime as naive UTC, and whether it was a whole day."""
+    try:
+        if len(value) == 10:
+            return datetime.combine(date.fromisoformat(value), datetime.min.time()), True
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise InvalidTicketQueryError(f"{field}: {value!r} is not a date or ISO datetime") from None
+
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC).replace(tzinfo=None)
+    return moment, False
+
+
+def _date_range(term: Term) -> tuple[datetime | None, datetime | None]:
+    """Half-open [start, end) range selected by a date term."""
+    if len(term.values) != 1:
+        raise InvalidTicketQueryError(f"{term.field}: takes a single date or range")
+    value = term.values[0]
+
+    if ".." in value:
+        first, last = value.split("..", 1)
+        start = _parse_moment(first, term.field)[0] if first not in ("", "*") else None
+        end = None
+        if last not in ("", "*"):
+            end, whole_day = _parse_moment(last, term.field)
+            end += timedelta(days=1) if whole_day else timedelta()
+        return start, end
+
+    operator, raw = COMPARISON.fullmatch(value).groups()
+    moment, whole_day = _parse_moment(raw, term.field)
+    # The first instant after the value: the next day, or the next microsecond for a time.
+    after = moment + (timedelta(days=1) if whole_day else timedelta(microseconds=1))
+
+    return {
+        ">": (after, None),
+        ">=": (moment, None),
+        "<": (None, moment),
+        "<=": (None, after),
+        None: (moment, after),
+    }[operator]
+
+
+def _compile_date(column: Column) -> Callable[[Term], Predicate]:
+    def compile_term(term: Term) -> Predicate:
+        start, end = _date_range(term)
+        if start is None and end is None:
+            raise InvalidTicketQueryError(f"{term.field}: range needs at least one bound")
+
+        bounds = [*([column >= start] if start else []), *([column < end] if end else [])]
+        if term.negated:
+            # The complement of one bound is still a single range the index can serve.
+            clause = or_(*([column < start] if start else []), *([column >= end] if end else []))
+            indexable = len(bounds) == 1
+        else:
+            clause = and_(*bounds)
+            indexable = True
+
+        return Predicate(term, _strategy(column, indexable), 6 if len(bounds) == 2 else 7, lambda user: clause)
+
+    return compile_term
+
+
+COMPILERS: dict[str, Callable[[Term], Predicate]] = {
+    "status": _compile_status,
+    "worker": _compile_worker,
+    "client": _compile_client,
+    "title": _compile_title,
+    "tag": _compile_tag,
+    "id": _compile_id,
+    "created": _compile_date(Ticket.created_at),
+    "updated": _compile_date(Ticket.updated_at),
+}
@@ -1,9 +1,27 @@
-from sqlalchemy import and_, func, select
+import random
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from operator import attrgetter
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Text, and_, delete, func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from src.tickets.models import Ticket, TicketStatus
-from src.users.models import User, UserRole
+from src.clients.models import Client
+from src.database.sharding import execute_on_all_shards, get_shard_router, stream_on_all_shards
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY
+from src.tickets.custom_fields import INDEXES_QUERY
+from src.tickets.models import Ticket, TicketFieldDefinition, TicketSort, TicketStatus
+
+# Work queue order: most urgent first, then earliest due (undated last), then oldest. It matches
+# ix_tickets_worker_queue, so a worker's next tickets come straight off the index.
+QUEUE_ORDER = (Ticket.priority.desc(), Ticket.due_at.asc(), Ticket.created_at.asc(), Ticket.id.asc())
+
+
+def _queue_key(ticket: Ticket) -> tuple:
+    return -ticket.priority, ticket.due_at is None, ticket.due_at or datetime.min, ticket.created_at, ticket.id
 
 
 class TicketRepository:
@@ -14,17 +32,44 @@ class TicketRepository:
         ticket = Ticket(**kwargs)
         self.db.add(ticket)
         await self.db.commit()
-        await self.db.refresh(ticket, ["client", "assigned_worker"])
+        await self.db.refresh(ticket)
         return ticket
 
-    async def get_by_id(self, ticket_id: int) -> Ticket | None:
-        result = await self.db.scalar(
-            select(Ticket)
-            .where(Ticket.id == ticket_id)
-            .options(joinedload(Ticket.client), joinedload(Ticket.assigned_worker))
-        )
+    async def get_by_id(self, ticket_id: int, visibility: ColumnElement[bool] | None = None) -> Ticket | None:
+        query = select(Ticket).where(Ticket.id == ticket_id)
+        if visibility is not None:
+            query = query.where(visibility)
+
+        result = await self.db.scalar(query.execution_options(populate_existing=True))
         return result
 
+    async def get_status(
+        self, ticket_id: int, permission: ColumnElement[bool]
+    ) -> Row[tuple[TicketStatus, bool]] | None:
+        result = await self.db.execute(
+            select(Ticket.status, permission.label("permitted")).where(Ticket.id == ticket_id)
+        )
+        return result.first()
+
+    async def get_version(self, ticket_id: int, visibility: ColumnElement[bool]) -> Row | None:
+        """What the ticket's detail response depends on, or None when it is missing or not visible."""
+        result = await self.db.execute(
+            select(Ticket.updated_at, Client.updated_at.label("client_updated_at"), Ticket.assigned_worker_id)
+            .join(Client, Client.id == Ticket.client_id)
+            .where(Ticket.id == ticket_id, visibility)
+        )
+        return result.first()
+
+    async def get_list_version(self, **filters: Any) -> tuple[int, datetime | None]:
+        """Count and latest `updated_at` of the tickets matching `filters` (as for `get_all`)."""
+        query = select(func.count().label("count"), func.max(Ticket.updated_at).label("updated_at"))
+        conditions = self._filter_conditions(**filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        rows = await execute_on_all_shards(self.db, query)
+        return sum(row.count for row in rows), max((row.updated_at for row in rows if row.updated_at), default=None)
+
     async def get_all(
         self,
         skip: int = 0,
@@ -32,11 +77,131 @@ class TicketRepository:
         status: TicketStatus | None = None,
         title_search: str | None = None,
         assigned_worker_id: int | None = None,
-        user: User | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        updated_since: datetime | None = None,
+        tags: Sequence[str] = (),
+        match_all_tags: bool = True,
+        visibility: ColumnElement[bool] | None = None,
+        query_conditions: Sequence[ColumnElement[bool]] = (),
+        sort: TicketSort = TicketSort.NEWEST,
     ) -> tuple[list[Ticket], int]:
-        query = select(Ticket).options(joinedload(Ticket.client), joinedload(Ticket.assigned_worker))
+        query = select(Ticket)
+
+        conditions = self._filter_conditions(
+            status=status,
+            title_search=title_search,
+            assigned_worker_id=assigned_worker_id,
+            created_from=created_from,
+            created_to=created_to,
+            updated_since=updated_since,
+            tags=tags,
+            match_all_tags=match_all_tags,
+            visibility=visibility,
+            query_conditions=query_conditions,
+        )
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        count_query = select(func.count()).select_from(query.subquery())
+        if sort == TicketSort.QUEUE:
+            query = query.order_by(*QUEUE_ORDER)
+        else:
+            query = query.order_by(Ticket.created_at.desc())
+
+        shard_router = get_shard_router(self.db)
+        if shard_router:
+            timeout_ms = self.db.info.get(STATEMENT_TIMEOUT_KEY)
+            if sort == TicketSort.QUEUE:
+                return await shard_router.fetch_page(
+                    query, count_query, skip, limit, key=_queue_key, timeout_ms=timeout_ms
+                )
+            return await shard_router.fetch_page(
+                query, count_query, skip, limit, key=attrgetter("created_at"), reverse=True, timeout_ms=timeout_ms
+            )
+
+        total = await self.db.scalar(count_query) or 0
+
+        query = query.offset(skip).limit(limit)
+        result = await self.db.scalars(query)
+        tickets = list(result)
+
+        return tickets, total
+
+    async def stream_export(self, chunk_size: int, **filters: Any) -> AsyncIterator[Sequence[Row]]:
+        """Export rows of the tickets matching `filters` (as for `get_all`) with their client, by id."""
+        query = (
+            select(
+                Ticket.id,
+                Ticket.title,
+                Ticket.description,
+                Ticket.status,
+                Ticket.priority,
+                Ticket.due_at,
+                Ticket.tags,
+                Ticket.custom_fields,
+                Ticket.created_at,
+                Ticket.updated_at,
+                Ticket.client_id,
+                Client.full_name.label("client_full_name"),
+                Client.email.label("client_email"),
+                Ticket.assigned_worker_id,
+            )
+            .join(Client, Client.id == Ticket.client_id)
+            .order_by(Ticket.id)
+        )
+        conditions = self._filter_conditions(**filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        async for rows in stream_on_all_shards(self.db, query, chunk_size):
+            yield rows
+
+    async def get_tag_counts(self, limit: int = 50, **filters: Any) -> list[tuple[str, int]]:
+        """Tickets per tag among the tickets matching `filters` (as for `get_all`), most frequent first."""
+        tags = func.unnest(Ticket.tags).table_valued("tag").render_derived(name="tags").lateral()
+        count = func.count().label("count")
+        query = (
+            select(tags.c.tag, count)
+            .select_from(Ticket)
+            .join(tags, true())
+            .group_by(tags.c.tag)
+            .order_by(count.desc(), tags.c.tag)
+        )
+
+        conditions = self._filter_conditions(**filters)
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        shard_router = get_shard_router(self.db)
+        if shard_router:
+            # Per-shard top lists cannot be merged exactly, so every shard returns all of its tags.
+            async def fetch(session: AsyncSession) -> list[Row]:
+                return list(await session.execute(query))
+
+            totals: Counter[str] = Counter()
+            for rows in await shard_router.gather(fetch, self.db.info.get(STATEMENT_TIMEOUT_KEY)):
+                totals.update(dict(rows))
+            return sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
 
-        conditions = []
+        result = await self.db.execute(query.limit(limit))
+        return [(row.tag, row.count) for row in result]
+
+    @staticmethod
+    def _filter_conditions(
+        status: TicketStatus | None = None,
+        title_search: str | None = None,
+        assigned_worker_id: int | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        updated_since: datetime | None = None,
+        tags: Sequence[str] = (),
+        match_all_tags: bool = True,
+        visibility: ColumnElement[bool] | None = None,
+        query_conditions: Sequence[ColumnElement[bool]] = (),
+    ) -> list[ColumnElement[bool]]:
+        conditions = list(query_conditions)
 
         if status:
             conditions.append(Ticket.status == status)
@@ -47,20 +212,23 @@ class TicketRepository:
         if assigned_worker_id is not None:
             conditions.append(Ticket.assigned_worker_id == assigned_worker_id)
 
-        if user and user.role == UserRole.WORKER:
-            conditions.append(Ticket.assigned_worker_id == user.id)
+        if created_from is not None:
+            conditions.append(Ticket.created_at >= created_from)
 
-        if conditions:
-            query = query.where(and_(*conditions))
+        if created_to is not None:
+            conditions.append(Ticket.created_at < created_to)
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query) or 0
+        if updated_since is not None:
+            conditions.append(Ticket.updated_at >= updated_since)
 
-        query = query.order_by(Ticket.created_at.desc()).offset(skip).limit(limit)
-        result = await self.db.scalars(query)
-        tickets = list(result)
+        if tags:
+            # @> and && are both served by the GIN index on tags.
+            conditions.append(Ticket.tags.contains(list(tags)) if match_all_tags else Ticket.tags.overlap(list(tags)))
 
-        return tickets, total
+        if visibility is not None:
+            conditions.append(visibility)
+
+        return conditions
 
     async def update(self, ticket: Ticket, **kwargs) -> Ticket:
         for key, value in kwargs.items():
@@ -68,9 +236,112 @@ class TicketRepository:
                 setattr(ticket, key, value)
 
         await self.db.commit()
-        await self.db.refresh(ticket, ["client", "assigned_worker"])
+        await self.db.refresh(ticket)
         return ticket
 
+    async def update_status(
+        self,
+        ticket_id: int,
+        status: TicketStatus,
+        allowed_from: list[TicketStatus],
+        permission: ColumnElement[bool],
+    ) -> Ticket | None:
+        updated_id = await self.db.scalar(
+            update(Ticket)
+            .where(Ticket.id == ticket_id, Ticket.status.in_(allowed_from), permission)
+            .values(status=status)
+            .returning(Ticket.id)
+        )
+        await self.db.commit()
+
+        if updated_id is None:
+            return None
+
+        return await self.get_by_id(updated_id)
+
+    async def claim_next(self, worker_id: int) -> Ticket | None:
+        """Assign the first unassigned new ticket in queue order to `worker_id` and start it.
+
+        The candidate row is locked with SKIP LOCKED, so concurrent claimers
+        each take a different ticket instead of queueing behind one lock, and
+        the assignment happens in the same statement. On a sharded database
+        shards are tried in random order until one has a ticket.
+        """
+        candidate = (
+            select(Ticket.id)
+            .where(Ticket.assigned_worker_id.is_(None), Ticket.status == TicketStatus.NEW)
+            .order_by(*QUEUE_ORDER)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        claim = (
+            update(Ticket)
+            .where(Ticket.id == candidate)
+            .values(assigned_worker_id=worker_id, status=TicketStatus.IN_PROGRESS)
+            .returning(Ticket)
+            .execution_options(populate_existing=True)
+        )
+
+        shard_router = get_shard_router(self.db)
+        shard_ids = random.sample(shard_router.shard_ids, shard_router.shard_count) if shard_router else [None]
+        for shard_id in shard_ids:
+            bind_arguments = {"shard_id": shard_id} if shard_id else None
+            ticket = await self.db.scalar(claim, bind_arguments=bind_arguments)
+            await self.db.commit()
+            if ticket is not None:
+                return ticket
+
+        return None
+
     async def delete(self, ticket: Ticket) -> None:
-        await self.db.delete(ticket)
+        ticket.deleted_at = datetime.utcnow()
+        await self.db.commit()
+        self.db.expunge(ticket)
+
+
+class TicketFieldRepository:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_all(self) -> list[TicketFieldDefinition]:
+        result = await self.db.scalars(select(TicketFieldDefinition).order_by(TicketFieldDefinition.key))
+        return list(result)
+
+    async def get_by_key(self, key: str) -> TicketFieldDefinition | None:
+        return await self.db.scalar(select(TicketFieldDefinition).where(TicketFieldDefinition.key == key))
+
+    async def get_ready_index_names(self) -> set[str]:
+        """Custom field indexes that are built and valid on every database holding tickets."""
+        rows = await execute_on_all_shards(self.db, INDEXES_QUERY)
+        shard_router = get_shard_router(self.db)
+        databases = shard_router.shard_count if shard_router else 1
+        valid = Counter(row.name for row in rows if row.valid)
+        return {name for name, count in valid.items() if count == databases}
+
+    async def create(self, **kwargs) -> TicketFieldDefinition:
+        definition = TicketFieldDefinition(**kwargs)
+        self.db.add(definition)
+        await self.db.commit()
+        await self.db.refresh(definition)
+        return definition
+
+    async def update(self, definition: TicketFieldDefinition, **kwargs) -> TicketFieldDefinition:
+        for key, value in kwargs.items():
+            if value is not None:
+                setattr(definition, key, value)
+
+        await self.db.commit()
+        await self.db.refresh(definition)
+        return definition
+
+    async def delete(self, definition: TicketFieldDefinition) -> None:
+        """Delete the definition and its values, including those of deleted tickets."""
+        await self.db.execute(
+            update(Ticket)
+            .where(Ticket.custom_fields.has_key(definition.key))
+            .values(custom_fields=Ticket.custom_fields.op("-", return_type=JSONB)(literal(definition.key, Text)))
+            .execution_options(include_deleted=True, synchronize_session=False)
+        )
+        await self.db.execute(delete(TicketFieldDefinition).where(TicketFieldDefinition.id == definition.id))
         await self.db.commit()
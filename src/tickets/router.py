@@ -1,20 +1,38 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.dependencies import CurrentAdmin, CurrentUser
-from src.core.dependencies import get_db
+from src.auth.dependencies import CurrentAdmin, CurrentUser, CurrentWorker
+from src.core.cache import CacheTag, cached_response
+from src.core.config import settings
+from src.core.dependencies import SessionFactory, get_db, route_class
+from src.core.etag import conditional_response
+from src.core.export import ExportFormat, Rows, export_response
+from src.database.statement_timeout import RouteClass
+from src.tickets.models import TicketSort
 from src.tickets.schemas import (
     TicketAssign,
     TicketCreatePublic,
+    TicketFacetsResponse,
+    TicketFieldCreate,
+    TicketFieldResponse,
+    TicketFieldUpdate,
     TicketFilters,
     TicketListResponse,
     TicketResponse,
     TicketStatusUpdate,
     TicketUpdate,
 )
-from src.tickets.service import TicketService
+from src.tickets.service import EXPORT_COLUMNS, TicketFieldService, TicketService
+from src.users.models import UserRole
+
+CUSTOM_FIELD_PARAM_PREFIX = "cf."
 
 router = APIRouter()
 
@@ -34,43 +52,223 @@ async def create_ticket_public(
     return await service.create_ticket_public(data)
 
 
+def custom_field_filters(request: Request) -> list[dict[str, str]]:
+    """`cf.<key>=value` and `cf.<key>.<op>=value` query parameters."""
+    filters = []
+    for name, value in request.query_params.multi_items():
+        if name.startswith(CUSTOM_FIELD_PARAM_PREFIX):
+            key, _, operator = name.removeprefix(CUSTOM_FIELD_PARAM_PREFIX).partition(".")
+            filters.append({"key": key, "operator": operator or "eq", "value": value})
+    return filters
+
+
+def ticket_filters(
+    request: Request,
+    status: str | None = None,
+    title: str | None = None,
+    assigned_worker_id: int | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    updated_since: datetime | None = None,
+    tag: Annotated[list[str] | None, Query(description="Tag filter, repeat for several tags")] = None,
+    tag_match: Literal["any", "all"] = "all",
+    q: Annotated[str | None, Query(max_length=500)] = None,
+) -> TicketFilters:
+    try:
+        return TicketFilters(
+            status=status,
+            title=title,
+            assigned_worker_id=assigned_worker_id,
+            created_from=created_from,
+            created_to=created_to,
+            updated_since=updated_since,
+            tags=tag or [],
+            tag_match=tag_match,
+            q=q,
+            custom_fields=custom_field_filters(request),
+        )
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False, include_context=False)
+        raise RequestValidationError([{**error, "loc": ("query", *error["loc"])} for error in errors]) from exc
+
+
+FILTERS_DESCRIPTION = (
+    "created_from/created_to select a half-open creation range, updated_since returns tickets changed since then. "
+    "tag filters by tags (repeat it for several), matching any or all of them per tag_match. "
+    "q takes a filter expression such as "
+    '`status:new,in_progress worker:none created:>2026-01-01 client:"acme" boiler` '
+    "(fields: status, worker, client, title, tag, id, created, updated; prefix a term with - to negate it). "
+    "cf.<key>=value filters on a searchable custom field, cf.<key>.gt/gte/lt/lte=value on a range of "
+    "an integer, number or date field."
+)
+
+
 @router.get(
     "",
     response_model=TicketListResponse,
     summary="List all tickets",
-    description="Get list of tickets. Admin sees all, worker sees only assigned tickets.",
+    description="Get list of tickets. Admin sees all, worker sees only assigned tickets. " + FILTERS_DESCRIPTION,
 )
 async def list_tickets(
+    request: Request,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
+    filters: Annotated[TicketFilters, Depends(ticket_filters)],
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 10,
-    status: str | None = None,
-    title: str | None = None,
-    assigned_worker_id: int | None = None,
-) -> TicketListResponse:
+    sort: Annotated[
+        TicketSort, Query(description="newest first, or queue: priority, due date, then age")
+    ] = TicketSort.NEWEST,
+) -> Response:
     service = TicketService(db)
 
-    filters = TicketFilters(
-        status=status,
-        title=title,
-        assigned_worker_id=assigned_worker_id,
-    )
+    async def render() -> TicketListResponse:
+        tickets, total, total_pages = await service.get_tickets(
+            current_user=current_user,
+            page=page,
+            per_page=per_page,
+            filters=filters,
+            sort=sort,
+        )
 
-    tickets, total, total_pages = await service.get_tickets(
-        current_user=current_user,
-        page=page,
-        per_page=per_page,
-        filters=filters,
-    )
+        return TicketListResponse.model_construct(
+            tickets=tickets,
+            total_count=total,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+        )
 
-    return TicketListResponse(
-        tickets=tickets,
-        total_count=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
-    )
+    async def respond() -> Response:
+        return await conditional_response(request, await service.get_tickets_version(current_user, filters), render)
+
+    # Admins share cached pages unless q may refer to themselves, as in worker:me.
+    shared = current_user.role == UserRole.ADMIN and filters.q is None
+    scope = "admin" if shared else f"user:{current_user.id}"
+    return await cached_response(request, scope, (CacheTag.TICKETS, CacheTag.CLIENTS, CacheTag.USERS), respond)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export tickets",
+    description="Stream all tickets matching the list filters, by id, as CSV or NDJSON with client and worker names. "
+    "Admin sees all, worker sees only assigned tickets. " + FILTERS_DESCRIPTION,
+)
+async def export_tickets(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    session_factory: SessionFactory,
+    filters: Annotated[TicketFilters, Depends(ticket_filters)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.CSV,
+) -> StreamingResponse:
+    export_filters = await TicketService(db).get_export_filters(current_user, filters)
+
+    def export(session: AsyncSession) -> AsyncIterator[Rows]:
+        return TicketService(session).export_tickets(export_filters, settings.EXPORT_CHUNK_ROWS)
+
+    return export_response(session_factory, export, EXPORT_COLUMNS, export_format, "tickets")
+
+
+@router.get(
+    "/facets",
+    response_model=TicketFacetsResponse,
+    summary="Tag facets",
+    description="Count tickets per tag over the tickets matching the list filters, most frequent first. "
+    + FILTERS_DESCRIPTION,
+)
+async def get_ticket_facets(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    filters: Annotated[TicketFilters, Depends(ticket_filters)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+) -> TicketFacetsResponse:
+    service = TicketService(db)
+    return await service.get_facets(current_user, filters, limit=limit)
+
+
+@router.get(
+    "/fields",
+    response_model=list[TicketFieldResponse],
+    summary="List custom fields",
+    description="Get the custom ticket field definitions.",
+)
+async def list_ticket_fields(
+    current_user: CurrentUser,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> list[TicketFieldResponse]:
+    service = TicketFieldService(db)
+    return await service.get_fields()
+
+
+@router.post(
+    "/fields",
+    response_model=TicketFieldResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create custom field",
+    description="Define a custom ticket field. Searchable fields are indexed in the background, index_status is "
+    "pending until the index is built. Only admin can access.",
+    dependencies=[Depends(route_class(RouteClass.ADMIN))],
+)
+async def create_ticket_field(
+    data: TicketFieldCreate,
+    current_admin: CurrentAdmin,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
+) -> TicketFieldResponse:
+    service = TicketFieldService(db, background_tasks)
+    return await service.create_field(data)
+
+
+@router.patch(
+    "/fields/{key}",
+    response_model=TicketFieldResponse,
+    summary="Update custom field",
+    description="Rename a custom field or change whether it is searchable; indexes are built or dropped in the "
+    "background. Only admin can access.",
+    dependencies=[Depends(route_class(RouteClass.ADMIN))],
+)
+async def update_ticket_field(
+    key: str,
+    data: TicketFieldUpdate,
+    current_admin: CurrentAdmin,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
+) -> TicketFieldResponse:
+    service = TicketFieldService(db, background_tasks)
+    return await service.update_field(key, data)
+
+
+@router.delete(
+    "/fields/{key}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Delete custom field",
+    description="Delete a custom field and its values on all tickets. Only admin can access.",
+    dependencies=[Depends(route_class(RouteClass.ADMIN))],
+)
+async def delete_ticket_field(
+    key: str,
+    current_admin: CurrentAdmin,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
+) -> None:
+    service = TicketFieldService(db, background_tasks)
+    await service.delete_field(key)
+
+
+@router.post(
+    "/claim",
+    response_model=TicketResponse,
+    summary="Claim next ticket",
+    description="Assign the next unassigned new ticket in queue order to the calling worker and start it. "
+    "Concurrent claims never return the same ticket. Only workers can access.",
+)
+async def claim_ticket(
+    current_worker: CurrentWorker,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> TicketResponse:
+    service = TicketService(db)
+    return await service.claim_ticket(current_worker)
 
 
 @router.get(
@@ -81,18 +279,24 @@ async def list_tickets(
 )
 async def get_ticket(
     ticket_id: int,
+    request: Request,
     current_user: CurrentUser,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> TicketResponse:
+) -> Response:
     service = TicketService(db)
-    return await service.get_ticket(ticket_id, current_user)
+    return await conditional_response(
+        request,
+        await service.get_ticket_version(ticket_id, current_user),
+        lambda: service.get_ticket(ticket_id, current_user),
+    )
 
 
 @router.patch(
     "/{ticket_id}",
     response_model=TicketResponse,
     summary="Update ticket",
-    description="Update ticket information. Only admin can access.",
+    description="Update ticket information; change the status with `PATCH /tickets/{id}/status`. "
+    "Only admin can access.",
 )
 async def update_ticket(
     ticket_id: int,
@@ -133,7 +337,7 @@ async def assign_ticket(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> TicketResponse:
     service = TicketService(db)
-    return await service.assign_ticket(ticket_id, data.worker_id)
+    return await service.assign_ticket(ticket_id, data.worker_id, current_admin)
 
 
 @router.delete(
@@ -148,4 +352,4 @@ async def delete_ticket(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> None:
     service = TicketService(db)
-    await service.delete_ticket(ticket_id)
+    await service.delete_ticket(ticket_id, current_admin)
@@ -1,8 +1,41 @@
-from datetime import datetime
+import re
+from datetime import UTC, datetime
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
 
-from src.tickets.models import TicketStatus
+from src.tickets.models import (
+    CUSTOM_FIELD_KEY_MAX_LENGTH,
+    TAG_MAX_LENGTH,
+    CustomFieldIndexStatus,
+    CustomFieldType,
+    TicketPriority,
+    TicketStatus,
+)
+
+MAX_TAGS = 20
+
+TAG_PATTERN = re.compile(r"[a-z0-9][a-z0-9:_-]*")
+
+Tag = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True, min_length=1, max_length=TAG_MAX_LENGTH)]
+
+
+def normalize_tags(tags: list[str] | None) -> list[str] | None:
+    if tags is None:
+        return None
+
+    for tag in tags:
+        if not TAG_PATTERN.fullmatch(tag):
+            raise ValueError(f"Invalid tag {tag!r}: use letters, digits, ':', '_' and '-'")
+
+    return list(dict.fromkeys(tags))
+
+
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    # Ticket timestamps are stored as naive UTC.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
 
 
 class TicketCreatePublic(BaseModel):
@@ -19,13 +52,30 @@ class TicketCreate(BaseModel):
     description: str = Field(..., min_length=10, description="Detailed description")
     client_id: int = Field(..., description="Client ID")
     assigned_worker_id: int | None = Field(None, description="Assigned worker ID")
+    priority: TicketPriority = Field(TicketPriority.NORMAL, description="1 low, 2 normal, 3 high, 4 urgent")
+    due_at: datetime | None = Field(None, description="When the repair is due")
+    tags: list[Tag] = Field(
+        default_factory=list, max_length=MAX_TAGS, description="Tags such as device:boiler or urgency:high"
+    )
+    custom_fields: dict[str, Any] = Field(default_factory=dict, description="Values of admin-defined fields by key")
+
+    _normalize_tags = field_validator("tags")(normalize_tags)
+    _to_naive_utc = field_validator("due_at")(to_naive_utc)
 
 
 class TicketUpdate(BaseModel):
     title: str | None = Field(None, min_length=3, max_length=200, description="Ticket title")
     description: str | None = Field(None, min_length=10, description="Ticket description")
-    status: TicketStatus | None = Field(None, description="Ticket status")
     assigned_worker_id: int | None = Field(None, description="Assigned worker ID")
+    priority: TicketPriority | None = Field(None, description="1 low, 2 normal, 3 high, 4 urgent")
+    due_at: datetime | None = Field(None, description="When the repair is due")
+    tags: list[Tag] | None = Field(None, max_length=MAX_TAGS, description="Replaces the ticket's tags")
+    custom_fields: dict[str, Any] | None = Field(
+        None, description="Custom field values to set by key, null removes a value"
+    )
+
+    _normalize_tags = field_validator("tags")(normalize_tags)
+    _to_naive_utc = field_validator("due_at")(to_naive_utc)
 
 
 class TicketAssign(BaseModel):
@@ -60,6 +110,10 @@ class TicketResponse(BaseModel):
     title: str
     description: str
     status: TicketStatus
+    priority: TicketPriority
+    due_at: datetime | None
+    tags: list[str]
+    custom_fields: dict[str, Any]
     created_at: datetime
     updated_at: datetime
     client: ClientInfo
@@ -72,6 +126,9 @@ class TicketListItem(BaseModel):
     id: int
     title: str
     status: TicketStatus
+    priority: TicketPriority
+    due_at: datetime | None
+    tags: list[str]
     created_at: datetime
     client_full_name: str
     assigned_worker_full_name: str | None
@@ -85,7 +142,67 @@ class TicketListResponse(BaseModel):
     total_pages: int
 
 
+class CustomFieldFilter(BaseModel):
+    key: str = Field(..., description="Custom field key")
+    operator: Literal["eq", "gt", "gte", "lt", "lte"] = Field("eq", description="Comparison")
+    value: str = Field(..., max_length=200, description="Value to compare with")
+
+
 class TicketFilters(BaseModel):
     status: TicketStatus | None = Field(None, description="Filter by status")
     title: str | None = Field(None, min_length=2, description="Search by title (partial match)")
     assigned_worker_id: int | None = Field(None, description="Filter by assigned worker")
+    created_from: datetime | None = Field(None, description="Created at or after this time")
+    created_to: datetime | None = Field(None, description="Created before this time")
+    updated_since: datetime | None = Field(None, description="Updated at or after this time")
+    tags: list[Tag] = Field(default_factory=list, description="Filter by tags")
+    tag_match: Literal["any", "all"] = Field("all", description="Match tickets with any or all of the tags")
+    custom_fields: list[CustomFieldFilter] = Field(
+        default_factory=list, description="Filters on searchable custom fields"
+    )
+    q: str | None = Field(
+        None,
+        max_length=500,
+        description='Filter expression, e.g. status:new,in_progress worker:none created:>2026-01-01 client:"acme"',
+    )
+
+    _normalize_tags = field_validator("tags")(normalize_tags)
+    _to_naive_utc = field_validator("created_from", "created_to", "updated_since")(to_naive_utc)
+
+
+class TagCount(BaseModel):
+    tag: str = Field(..., description="Tag")
+    count: int = Field(..., description="Matching tickets with this tag")
+
+
+class TicketFacetsResponse(BaseModel):
+    tags: list[TagCount] = Field(..., description="Tag counts over the filtered tickets, most frequent first")
+
+
+class TicketFieldCreate(BaseModel):
+    key: str = Field(
+        ...,
+        pattern=rf"^[a-z][a-z0-9_]{{0,{CUSTOM_FIELD_KEY_MAX_LENGTH - 1}}}$",
+        description="Key in custom_fields: lower case letters, digits and underscores",
+    )
+    label: str = Field(..., min_length=1, max_length=100, description="Display name")
+    type: CustomFieldType = Field(..., description="Value type")
+    searchable: bool = Field(False, description="Index the field and allow filtering on it")
+
+
+class TicketFieldUpdate(BaseModel):
+    label: str | None = Field(None, min_length=1, max_length=100, description="Display name")
+    searchable: bool | None = Field(None, description="Index the field and allow filtering on it")
+
+
+class TicketFieldResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    key: str
+    label: str
+    type: CustomFieldType
+    searchable: bool
+    index_status: CustomFieldIndexStatus | None = Field(
+        None, description="Whether the index of a searchable field is built yet; null for other fields"
+    )
+    created_at: datetime
@@ -1,15 +1,47 @@
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from fastapi import BackgroundTasks
+from sqlalchemy import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.clients.models import Client
 from src.clients.repository import ClientRepository
 from src.clients.schemas import ClientCreate
-from src.tickets.exceptions import TicketAccessDeniedError, TicketNotFoundError, WorkerNotFoundError
-from src.tickets.models import Ticket, TicketStatus
-from src.tickets.permissions import can_view_ticket
-from src.tickets.repository import TicketRepository
+from src.core.cache import CacheTag, invalidates
+from src.core.responses import construct
+from src.database.loader import get_batch_loader
+from src.database.sharding import get_shard_router
+from src.tickets.custom_fields import (
+    build_custom_field_indexes,
+    custom_field_condition,
+    index_name,
+    merge_custom_fields,
+    validate_custom_fields,
+)
+from src.tickets.exceptions import (
+    CustomFieldExistsError,
+    CustomFieldNotFoundError,
+    InvalidCustomFieldError,
+    InvalidStatusTransitionError,
+    NoTicketToClaimError,
+    TicketAccessDeniedError,
+    TicketNotFoundError,
+    WorkerNotFoundError,
+)
+from src.tickets.models import CustomFieldIndexStatus, Ticket, TicketFieldDefinition, TicketSort, TicketStatus
+from src.tickets.permissions import can_modify_ticket_clause, can_view_ticket_clause
+from src.tickets.query import get_query_plan
+from src.tickets.repository import TicketFieldRepository, TicketRepository
 from src.tickets.schemas import (
     ClientInfo,
+    TagCount,
     TicketCreate,
     TicketCreatePublic,
+    TicketFacetsResponse,
+    TicketFieldCreate,
+    TicketFieldResponse,
+    TicketFieldUpdate,
     TicketFilters,
     TicketListItem,
     TicketResponse,
@@ -17,16 +49,39 @@ from src.tickets.schemas import (
     TicketUpdate,
     WorkerInfo,
 )
+from src.tickets.transitions import allowed_source_statuses
 from src.users.models import User, UserRole
 from src.users.repository import UserRepository
 
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_at",
+    "tags",
+    "custom_fields",
+    "created_at",
+    "updated_at",
+    "client_id",
+    "client_full_name",
+    "client_email",
+    "assigned_worker_id",
+    "assigned_worker_full_name",
+)
+
 
 class TicketService:
     def __init__(self, db: AsyncSession) -> None:
         self.repo = TicketRepository(db)
         self.client_repo = ClientRepository(db)
         self.user_repo = UserRepository(db)
+        self.field_repo = TicketFieldRepository(db)
+        self.client_loader = get_batch_loader(db, Client)
+        self.worker_loader = get_batch_loader(db, User)
 
+    @invalidates(CacheTag.TICKETS, CacheTag.CLIENTS)
     async def create_ticket_public(self, data: TicketCreatePublic) -> TicketResponse:
         client = await self.client_repo.get_by_email(data.client_email)
 
@@ -46,8 +101,9 @@ class TicketService:
             status=TicketStatus.NEW,
         )
 
-        return self._to_response(ticket)
+        return await self._to_response(ticket)
 
+    @invalidates(CacheTag.TICKETS)
     async def create_ticket(self, data: TicketCreate) -> TicketResponse:
         client = await self.client_repo.get_by_id(data.client_id)
         if not client:
@@ -58,18 +114,16 @@ class TicketService:
             if not worker or worker.role != UserRole.WORKER:
                 raise WorkerNotFoundError(data.assigned_worker_id)
 
-        ticket = await self.repo.create(**data.model_dump())
-        return self._to_response(ticket)
+        custom_fields = await self._validate_custom_fields(data.custom_fields)
+        ticket = await self.repo.create(
+            **data.model_dump(exclude={"custom_fields"}),
+            custom_fields=merge_custom_fields({}, custom_fields),
+        )
+        return await self._to_response(ticket)
 
     async def get_ticket(self, ticket_id: int, current_user: User) -> TicketResponse:
-        ticket = await self.repo.get_by_id(ticket_id)
-        if not ticket:
-            raise TicketNotFoundError(ticket_id)
-
-        if not can_view_ticket(current_user, ticket):
-            raise TicketAccessDeniedError()
-
-        return self._to_response(ticket)
+        ticket = await self._get_permitted(ticket_id, can_view_ticket_clause(current_user))
+        return await self._to_response(ticket)
 
     async def get_tickets(
         self,
@@ -77,27 +131,66 @@ class TicketService:
         page: int = 1,
         per_page: int = 10,
         filters: TicketFilters | None = None,
+        sort: TicketSort = TicketSort.NEWEST,
     ) -> tuple[list[TicketListItem], int, int]:
         skip = (page - 1) * per_page
 
         tickets, total = await self.repo.get_all(
-            skip=skip,
-            limit=per_page,
-            status=filters.status if filters else None,
-            title_search=filters.title if filters else None,
-            assigned_worker_id=filters.assigned_worker_id if filters else None,
-            user=current_user,
+            skip=skip, limit=per_page, sort=sort, **await self._filter_args(filters or TicketFilters(), current_user)
         )
 
-        ticket_items = [self._to_list_item(ticket) for ticket in tickets]
+        ticket_items = await self._to_list_items(tickets)
         total_pages = (total + per_page - 1) // per_page
 
         return ticket_items, total, total_pages
 
+    async def get_export_filters(self, current_user: User, filters: TicketFilters) -> dict[str, Any]:
+        """The repository filters for `export_tickets`, resolved while errors can still become a 4xx."""
+        return await self._filter_args(filters, current_user)
+
+    async def export_tickets(
+        self, export_filters: dict[str, Any], chunk_size: int
+    ) -> AsyncIterator[Sequence[dict[str, Any]]]:
+        async for rows in self.repo.stream_export(chunk_size, **export_filters):
+            workers = await self.worker_loader.load_many(row.assigned_worker_id for row in rows)
+            yield [
+                {
+                    **row._asdict(),
+                    "assigned_worker_full_name": (
+                        workers[row.assigned_worker_id].full_name if row.assigned_worker_id in workers else None
+                    ),
+                }
+                for row in rows
+            ]
+
+    async def get_ticket_version(self, ticket_id: int, current_user: User) -> tuple | None:
+        """What `get_ticket` returns depends on, or None when the ticket is missing or not visible."""
+        version = await self.repo.get_version(ticket_id, can_view_ticket_clause(current_user))
+        if version is None:
+            return None
+
+        worker_id = version.assigned_worker_id
+        return (*version, await self.user_repo.get_version(worker_id) if worker_id else None)
+
+    async def get_tickets_version(self, current_user: User, filters: TicketFilters) -> tuple:
+        """Changes whenever a `get_tickets` page may: the matching tickets' count and latest update,
+        and the latest client and user updates, as their names are on the list."""
+        count, updated_at = await self.repo.get_list_version(**await self._filter_args(filters, current_user))
+        return (
+            current_user.id,
+            count,
+            updated_at,
+            await self.client_repo.get_last_updated(),
+            await self.user_repo.get_last_updated(),
+        )
+
+    async def get_facets(self, current_user: User, filters: TicketFilters, limit: int = 50) -> TicketFacetsResponse:
+        tag_counts = await self.repo.get_tag_counts(limit=limit, **await self._filter_args(filters, current_user))
+        return TicketFacetsResponse(tags=[TagCount(tag=tag, count=count) for tag, count in tag_counts])
+
+    @invalidates(CacheTag.TICKETS)
     async def update_ticket(self, ticket_id: int, data: TicketUpdate, current_user: User) -> TicketResponse:
-        ticket = await self.repo.get_by_id(ticket_id)
-        if not ticket:
-            raise TicketNotFoundError(ticket_id)
+        ticket = await self._get_permitted(ticket_id, can_modify_ticket_clause(current_user))
 
         if data.assigned_worker_id is not None:
             worker = await self.user_repo.get_by_id(data.assigned_worker_id)
@@ -105,60 +198,213 @@ class TicketService:
                 raise WorkerNotFoundError(data.assigned_worker_id)
 
         update_data = data.model_dump(exclude_unset=True)
+        if data.custom_fields is not None:
+            changes = await self._validate_custom_fields(data.custom_fields)
+            update_data["custom_fields"] = merge_custom_fields(ticket.custom_fields, changes)
         updated_ticket = await self.repo.update(ticket, **update_data)
 
-        return self._to_response(updated_ticket)
+        return await self._to_response(updated_ticket)
 
+    @invalidates(CacheTag.TICKETS)
     async def update_ticket_status(
         self, ticket_id: int, data: TicketStatusUpdate, current_user: User
     ) -> TicketResponse:
-        ticket = await self.repo.get_by_id(ticket_id)
-        if not ticket:
-            raise TicketNotFoundError(ticket_id)
+        permission = can_modify_ticket_clause(current_user)
 
-        if not can_view_ticket(current_user, ticket):
-            raise TicketAccessDeniedError()
+        updated_ticket = await self.repo.update_status(
+            ticket_id,
+            status=data.status,
+            allowed_from=allowed_source_statuses(data.status),
+            permission=permission,
+        )
+        if updated_ticket:
+            return await self._to_response(updated_ticket)
 
-        updated_ticket = await self.repo.update(ticket, status=data.status)
-        return self._to_response(updated_ticket)
+        current_status = await self._check_access(ticket_id, permission)
+        raise InvalidStatusTransitionError(current_status, data.status)
 
-    async def assign_ticket(self, ticket_id: int, worker_id: int) -> TicketResponse:
-        ticket = await self.repo.get_by_id(ticket_id)
-        if not ticket:
-            raise TicketNotFoundError(ticket_id)
+    @invalidates(CacheTag.TICKETS)
+    async def assign_ticket(self, ticket_id: int, worker_id: int, current_user: User) -> TicketResponse:
+        ticket = await self._get_permitted(ticket_id, can_modify_ticket_clause(current_user))
 
         worker = await self.user_repo.get_by_id(worker_id)
         if not worker or worker.role != UserRole.WORKER:
             raise WorkerNotFoundError(worker_id)
 
         updated_ticket = await self.repo.update(ticket, assigned_worker_id=worker_id)
-        return self._to_response(updated_ticket)
+        return await self._to_response(updated_ticket)
 
-    async def delete_ticket(self, ticket_id: int) -> None:
-        ticket = await self.repo.get_by_id(ticket_id)
+    @invalidates(CacheTag.TICKETS)
+    async def claim_ticket(self, current_worker: User) -> TicketResponse:
+        ticket = await self.repo.claim_next(current_worker.id)
         if not ticket:
-            raise TicketNotFoundError(ticket_id)
+            raise NoTicketToClaimError()
 
+        return await self._to_response(ticket)
+
+    @invalidates(CacheTag.TICKETS)
+    async def delete_ticket(self, ticket_id: int, current_user: User) -> None:
+        ticket = await self._get_permitted(ticket_id, can_modify_ticket_clause(current_user))
         await self.repo.delete(ticket)
 
-    def _to_response(self, ticket: Ticket) -> TicketResponse:
-        return TicketResponse(
+    async def _filter_args(self, filters: TicketFilters, current_user: User) -> dict[str, Any]:
+        query_conditions = get_query_plan(filters.q).where(current_user) if filters.q else []
+        if filters.custom_fields:
+            definitions = await self._field_definitions()
+            for field_filter in filters.custom_fields:
+                definition = definitions.get(field_filter.key)
+                if definition is None:
+                    raise InvalidCustomFieldError(f"Unknown custom field {field_filter.key!r}")
+                query_conditions.append(custom_field_condition(definition, field_filter.operator, field_filter.value))
+
+        return {
+            "status": filters.status,
+            "title_search": filters.title,
+            "assigned_worker_id": filters.assigned_worker_id,
+            "created_from": filters.created_from,
+            "created_to": filters.created_to,
+            "updated_since": filters.updated_since,
+            "tags": filters.tags,
+            "match_all_tags": filters.tag_match == "all",
+            "visibility": can_view_ticket_clause(current_user),
+            "query_conditions": query_conditions,
+        }
+
+    async def _field_definitions(self) -> dict[str, TicketFieldDefinition]:
+        return {definition.key: definition for definition in await self.field_repo.get_all()}
+
+    async def _validate_custom_fields(self, values: dict[str, Any]) -> dict[str, Any]:
+        if not values:
+            return {}
+        return validate_custom_fields(await self._field_definitions(), values)
+
+    async def _get_permitted(self, ticket_id: int, permission: ColumnElement[bool]) -> Ticket:
+        ticket = await self.repo.get_by_id(ticket_id, permission)
+        if ticket:
+            return ticket
+
+        await self._check_access(ticket_id, permission)
+        # Visible now, but not when it was loaded: it was reassigned or deleted in between.
+        raise TicketNotFoundError(ticket_id)
+
+    async def _check_access(self, ticket_id: int, permission: ColumnElement[bool]) -> TicketStatus:
+        """Probe by primary key why a permission-filtered query found no ticket."""
+        current = await self.repo.get_status(ticket_id, permission)
+        if not current:
+            raise TicketNotFoundError(ticket_id)
+
+        current_status, permitted = current
+        if not permitted:
+            raise TicketAccessDeniedError()
+
+        return current_status
+
+    async def _load_related(self, tickets: list[Ticket]) -> tuple[dict[int, Client], dict[int, User]]:
+        clients = await self.client_loader.load_many(ticket.client_id for ticket in tickets)
+        workers = await self.worker_loader.load_many(ticket.assigned_worker_id for ticket in tickets)
+        return clients, workers
+
+    async def _to_response(self, ticket: Ticket) -> TicketResponse:
+        clients, workers = await self._load_related([ticket])
+        worker = workers.get(ticket.assigned_worker_id) if ticket.assigned_worker_id else None
+
+        return TicketResponse.model_construct(
             id=ticket.id,
             title=ticket.title,
             description=ticket.description,
             status=ticket.status,
+            priority=ticket.priority,
+            due_at=ticket.due_at,
+            tags=ticket.tags,
+            custom_fields=ticket.custom_fields,
             created_at=ticket.created_at,
             updated_at=ticket.updated_at,
-            client=ClientInfo.model_validate(ticket.client),
-            assigned_worker=WorkerInfo.model_validate(ticket.assigned_worker) if ticket.assigned_worker else None,
+            client=construct(ClientInfo, clients[ticket.client_id]),
+            assigned_worker=construct(WorkerInfo, worker) if worker else None,
         )
 
-    def _to_list_item(self, ticket: Ticket) -> TicketListItem:
-        return TicketListItem(
-            id=ticket.id,
-            title=ticket.title,
-            status=ticket.status,
-            created_at=ticket.created_at,
-            client_full_name=ticket.client.full_name,
-            assigned_worker_full_name=ticket.assigned_worker.full_name if ticket.assigned_worker else None,
-        )
+    async def _to_list_items(self, tickets: list[Ticket]) -> list[TicketListItem]:
+        clients, workers = await self._load_related(tickets)
+
+        items = []
+        for ticket in tickets:
+            worker = workers.get(ticket.assigned_worker_id) if ticket.assigned_worker_id else None
+            items.append(
+                TicketListItem.model_construct(
+                    id=ticket.id,
+                    title=ticket.title,
+                    status=ticket.status,
+                    priority=ticket.priority,
+                    due_at=ticket.due_at,
+                    tags=ticket.tags,
+                    created_at=ticket.created_at,
+                    client_full_name=clients[ticket.client_id].full_name,
+                    assigned_worker_full_name=worker.full_name if worker else None,
+                )
+            )
+
+        return items
+
+
+class TicketFieldService:
+    """Custom field definitions. Index changes are built by `background_tasks` after the response is sent,
+    or before returning without them."""
+
+    def __init__(self, db: AsyncSession, background_tasks: BackgroundTasks | None = None) -> None:
+        self.db = db
+        self.repo = TicketFieldRepository(db)
+        self.background_tasks = background_tasks
+
+    async def get_fields(self) -> list[TicketFieldResponse]:
+        definitions = await self.repo.get_all()
+        ready = await self.repo.get_ready_index_names()
+        return [self._to_response(definition, ready) for definition in definitions]
+
+    async def create_field(self, data: TicketFieldCreate) -> TicketFieldResponse:
+        if await self.repo.get_by_key(data.key):
+            raise CustomFieldExistsError(data.key)
+
+        definition = await self.repo.create(**data.model_dump())
+        ready = await self.repo.get_ready_index_names()
+        await self._sync_indexes()
+        return self._to_response(definition, ready)
+
+    async def update_field(self, key: str, data: TicketFieldUpdate) -> TicketFieldResponse:
+        definition = await self._get(key)
+        definition = await self.repo.update(definition, **data.model_dump(exclude_unset=True))
+        ready = await self.repo.get_ready_index_names()
+        await self._sync_indexes()
+        return self._to_response(definition, ready)
+
+    @invalidates(CacheTag.TICKETS)
+    async def delete_field(self, key: str) -> None:
+        definition = await self._get(key)
+        await self.repo.delete(definition)
+        await self._sync_indexes()
+
+    async def _get(self, key: str) -> TicketFieldDefinition:
+        definition = await self.repo.get_by_key(key)
+        if not definition:
+            raise CustomFieldNotFoundError(key)
+        return definition
+
+    async def _sync_indexes(self) -> None:
+        definitions = await self.repo.get_all()
+        # Concurrent index builds wait for open transactions, including this session's own,
+        # so it must not start another one before the build.
+        await self.db.commit()
+
+        shard_router = get_shard_router(self.db)
+        engines = shard_router.shards if shard_router else [self.db.bind]
+        if self.background_tasks is None:
+            await build_custom_field_indexes(engines, definitions)
+        else:
+            self.background_tasks.add_task(build_custom_field_indexes, engines, definitions)
+
+    @staticmethod
+    def _to_response(definition: TicketFieldDefinition, ready_indexes: set[str]) -> TicketFieldResponse:
+        index_status = None
+        if definition.searchable:
+            ready = index_name(definition.key) in ready_indexes
+            index_status = CustomFieldIndexStatus.READY if ready else CustomFieldIndexStatus.PENDING
+        return construct(TicketFieldResponse, definition, index_status=index_status)
@@ -0,0 +1,25 @@
+from src.core.config import settings
+from src.tickets.models import TicketStatus
+
+STATUS_TRANSITIONS: dict[TicketStatus, frozenset[TicketStatus]] = {
+    TicketStatus.NEW: frozenset({TicketStatus.IN_PROGRESS}),
+    TicketStatus.IN_PROGRESS: frozenset({TicketStatus.DONE}),
+    TicketStatus.DONE: frozenset(),
+}
+
+REOPEN_TRANSITIONS: dict[TicketStatus, frozenset[TicketStatus]] = {
+    TicketStatus.DONE: frozenset({TicketStatus.IN_PROGRESS}),
+}
+
+
+def allowed_transitions() -> dict[TicketStatus, frozenset[TicketStatus]]:
+    if not settings.TICKET_ALLOW_REOPEN:
+        return STATUS_TRANSITIONS
+
+    return {
+        status: targets | REOPEN_TRANSITIONS.get(status, frozenset()) for status, targets in STATUS_TRANSITIONS.items()
+    }
+
+
+def allowed_source_statuses(to_status: TicketStatus) -> list[TicketStatus]:
+    return [status for status, targets in allowed_transitions().items() if to_status in targets]
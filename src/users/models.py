@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
@@ -27,9 +28,12 @@ class User(Base):
     full_name: Mapped[str] = mapped_column(String(200), nullable=False)
     role: Mapped[UserRole] = mapped_column(String(20), nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True
+    )
 
     assigned_tickets: Mapped[list[Ticket]] = relationship(
-        "Ticket", back_populates="assigned_worker", cascade="all, delete-orphan"
+        "Ticket", back_populates="assigned_worker", passive_deletes=True
     )
 
     def __repr__(self) -> str:
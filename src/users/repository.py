@@ -1,6 +1,10 @@
-from sqlalchemy import func, select
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Row, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.sharding import get_shard_router
+from src.tickets.models import Ticket
 from src.users.models import User, UserRole
 
 
@@ -29,12 +33,7 @@ class UserRepository:
         role: UserRole | None = None,
         is_active: bool | None = None,
     ) -> tuple[list[User], int]:
-        query = select(User)
-
-        if role:
-            query = query.where(User.role == role)
-        if is_active is not None:
-            query = query.where(User.is_active == is_active)
+        query = select(User).where(*self._filter_conditions(role, is_active))
 
         count_query = select(func.count()).select_from(query.subquery())
         total = await self.db.scalar(count_query) or 0
@@ -45,6 +44,30 @@ class UserRepository:
 
         return users, total
 
+    async def get_version(self, user_id: int) -> datetime | None:
+        return await self.db.scalar(select(User.updated_at).where(User.id == user_id))
+
+    async def get_list_version(
+        self, role: UserRole | None = None, is_active: bool | None = None
+    ) -> Row[tuple[int, datetime | None]]:
+        """Count and latest `updated_at` of the users matching the filters (as for `get_all`)."""
+        result = await self.db.execute(
+            select(func.count(), func.max(User.updated_at)).where(*self._filter_conditions(role, is_active))
+        )
+        return result.one()
+
+    async def get_last_updated(self) -> datetime | None:
+        return await self.db.scalar(select(func.max(User.updated_at)))
+
+    @staticmethod
+    def _filter_conditions(role: UserRole | None, is_active: bool | None) -> list[ColumnElement[bool]]:
+        conditions = []
+        if role:
+            conditions.append(User.role == role)
+        if is_active is not None:
+            conditions.append(User.is_active == is_active)
+        return conditions
+
     async def update(self, user: User, **kwargs) -> User:
         for key, value in kwargs.items():
             if value is not None:
@@ -55,5 +78,13 @@ class UserRepository:
         return user
 
     async def delete(self, user: User) -> None:
+        if get_shard_router(self.db):
+            # Tickets live on other databases, so no foreign key unassigns them.
+            await self.db.execute(
+                update(Ticket)
+                .where(Ticket.assigned_worker_id == user.id)
+                .values(assigned_worker_id=None)
+                .execution_options(synchronize_session=False)
+            )
         await self.db.delete(user)
         await self.db.commit()
@@ -1,10 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_admin_user
-from src.core.dependencies import get_db
+from src.core.cache import CacheTag, cached_response
+from src.core.dependencies import get_db, route_class
+from src.core.etag import conditional_response
+from src.database.statement_timeout import RouteClass
 from src.users.models import User, UserRole
 from src.users.schemas import UserCreate, UserListResponse, UserResponse, UserUpdate
 from src.users.service import UserService
@@ -35,28 +38,38 @@ async def create_user(
     description="Get list of all users with pagination. Only admin can access.",
 )
 async def list_users(
+    request: Request,
     current_admin: Annotated[User, Depends(get_current_admin_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     page: Annotated[int, Query(ge=1)] = 1,
     per_page: Annotated[int, Query(ge=1, le=100)] = 10,
     role: UserRole | None = None,
     is_active: bool | None = None,
-) -> UserListResponse:
+) -> Response:
     service = UserService(db)
-    users, total, total_pages = await service.get_users(
-        page=page,
-        per_page=per_page,
-        role=role,
-        is_active=is_active,
-    )
 
-    return UserListResponse(
-        users=users,
-        total_count=total,
-        page=page,
-        per_page=per_page,
-        total_pages=total_pages,
-    )
+    async def render() -> UserListResponse:
+        users, total, total_pages = await service.get_users(
+            page=page,
+            per_page=per_page,
+            role=role,
+            is_active=is_active,
+        )
+
+        return UserListResponse.model_construct(
+            users=users,
+            total_count=total,
+            page=page,
+            per_page=per_page,
+            total_pages=total_pages,
+        )
+
+    async def respond() -> Response:
+        return await conditional_response(
+            request, await service.get_users_version(role=role, is_active=is_active), render
+        )
+
+    return await cached_response(request, "admin", (CacheTag.USERS,), respond)
 
 
 @router.get(
@@ -67,11 +80,14 @@ async def list_users(
 )
 async def get_user(
     user_id: int,
+    request: Request,
     current_admin: Annotated[User, Depends(get_current_admin_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> UserResponse:
+) -> Response:
     service = UserService(db)
-    return await service.get_user(user_id)
+    return await conditional_response(
+        request, await service.get_user_version(user_id), lambda: service.get_user(user_id)
+    )
 
 
 @router.patch(
@@ -95,6 +111,7 @@ async def update_user(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete user",
     description="Delete a user. Only admin can access.",
+    dependencies=[Depends(route_class(RouteClass.ADMIN))],
 )
 async def delete_user(
     user_id: int,
@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.utils import hash_password
+from src.core.cache import CacheTag, invalidates
+from src.core.responses import construct
 from src.users.exceptions import UserAlreadyExistsError, UserNotFoundError
 from src.users.models import UserRole
 from src.users.repository import UserRepository
@@ -11,6 +13,7 @@ class UserService:
     def __init__(self, db: AsyncSession) -> None:
         self.repo = UserRepository(db)
 
+    @invalidates(CacheTag.USERS)
     async def create_user(self, data: UserCreate) -> UserResponse:
         existing_user = await self.repo.get_by_email(data.email)
         if existing_user:
@@ -31,7 +34,14 @@ class UserService:
         if not user:
             raise UserNotFoundError(user_id)
 
-        return UserResponse.model_validate(user)
+        return construct(UserResponse, user)
+
+    async def get_user_version(self, user_id: int) -> tuple | None:
+        updated_at = await self.repo.get_version(user_id)
+        return (updated_at,) if updated_at else None
+
+    async def get_users_version(self, role: UserRole | None = None, is_active: bool | None = None) -> tuple:
+        return tuple(await self.repo.get_list_version(role=role, is_active=is_active))
 
     async def get_users(
         self,
@@ -43,11 +53,12 @@ class UserService:
         skip = (page - 1) * per_page
         users, total = await self.repo.get_all(skip=skip, limit=per_page, role=role, is_active=is_active)
 
-        user_responses = [UserResponse.model_validate(user) for user in users]
+        user_responses = [construct(UserResponse, user) for user in users]
         total_pages = (total + per_page - 1) // per_page
 
         return user_responses, total, total_pages
 
+    @invalidates(CacheTag.USERS)
     async def update_user(self, user_id: int, data: UserUpdate) -> UserResponse:
         user = await self.repo.get_by_id(user_id)
         if not user:
@@ -65,6 +76,7 @@ class UserService:
         updated_user = await self.repo.update(user, **update_data)
         return UserResponse.model_validate(updated_user)
 
+    @invalidates(CacheTag.USERS)
     async def delete_user(self, user_id: int) -> None:
         user = await self.repo.get_by_id(user_id)
         if not user:
@@ -0,0 +1,62 @@
+from collections.abc import Generator
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.admin.service import report_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_report_cache() -> Generator[None, None, None]:
+    report_cache.clear()
+    yield
+    report_cache.clear()
+
+
+@pytest.mark.asyncio
+class TestAdminRouter:
+    async def test_database_report(self, client: AsyncClient, admin_headers: dict[str, str]):
+        response = await client.get("/admin/db/report", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["database_bytes"] > 0
+        tables = {table["name"]: table for table in data["tables"]}
+        assert {"users", "clients", "tickets"} <= tables.keys()
+        assert tables["tickets"]["total_bytes"] >= tables["tickets"]["table_bytes"]
+        assert any(index["name"] == "ix_tickets_worker_queue" for index in data["indexes"])
+        assert all(not index["name"].endswith("_pkey") for index in data["unused_indexes"])
+        assert set(data["cache_hit_ratio"]) == {"tables", "indexes"}
+
+    async def test_duplicate_indexes_are_reported(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession
+    ):
+        await db_session.execute(
+            text("CREATE INDEX ix_tickets_status_copy ON tickets (status) WHERE deleted_at IS NULL")
+        )
+        await db_session.commit()
+        try:
+            response = await client.get("/admin/db/report", headers=admin_headers)
+        finally:
+            await db_session.execute(text("DROP INDEX ix_tickets_status_copy"))
+            await db_session.commit()
+
+        duplicates = response.json()["duplicate_indexes"]
+        assert [(duplicate["table"], sorted(duplicate["indexes"])) for duplicate in duplicates] == [
+            ("tickets", ["ix_tickets_status", "ix_tickets_status_copy"])
+        ]
+
+    async def test_report_is_cached(self, client: AsyncClient, admin_headers: dict[str, str]):
+        first = await client.get("/admin/db/report", headers=admin_headers)
+        cached = await client.get("/admin/db/report", headers=admin_headers)
+        refreshed = await client.get("/admin/db/report", headers=admin_headers, params={"refresh": True})
+
+        assert cached.json()["generated_at"] == first.json()["generated_at"]
+        assert refreshed.json()["generated_at"] > first.json()["generated_at"]
+
+    async def test_report_requires_admin(self, client: AsyncClient, worker_headers: dict[str, str]):
+        response = await client.get("/admin/db/report", headers=worker_headers)
+
+        assert response.status_code == 403
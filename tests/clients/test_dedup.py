@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.dedup import deduplicate_clients, soundex
+from src.clients.models import Client
+from src.tickets.models import Ticket, TicketStatus
+
+
+@pytest.fixture
+async def duplicate_clients(db_session: AsyncSession) -> list[Client]:
+    clients = [
+        Client(full_name="John Smith", email="john.smith@example.com", phone="+1 555 123 4567"),
+        Client(full_name="John Smith", email="John.Smith@Example.com ", phone="+1 555 000 0000"),
+        Client(full_name="Jon Smyth", email="jsmyth@example.com", phone="1-555-123-4567"),
+        Client(full_name="Mary Smith", email="mary@example.com", phone="+1 (555) 123-4567"),
+        Client(full_name="Alice Brown", email="alice@example.com", phone="+1 555 999 9999"),
+    ]
+    db_session.add_all(clients)
+    await db_session.flush()
+    db_session.add_all(
+        Ticket(title=f"Repair for {client.id}", description="Dedup test", status=TicketStatus.NEW, client_id=client.id)
+        for client in clients
+    )
+    await db_session.commit()
+    return clients
+
+
+@pytest.mark.asyncio
+class TestClientDedup:
+    async def test_soundex(self):
+        assert soundex("Robert") == soundex("Rupert") == "R163"
+        assert soundex("Ashcraft") == "A261"
+        assert soundex("") == ""
+
+    async def test_dry_run_reports_candidates_without_merging(
+        self, db_session: AsyncSession, duplicate_clients: list[Client]
+    ):
+        john, john_upper, jon, mary, _ = duplicate_clients
+
+        report = await deduplicate_clients(db_session, batch_size=2)
+
+        assert report.scanned == 5
+        confirmed = {(c.client_id, c.duplicate_of, c.reason) for c in report.candidates if c.confirmed}
+        assert confirmed == {(john_upper.id, john.id, "email"), (jon.id, john.id, "phone")}
+        assert (mary.id, john.id) in {(c.client_id, c.duplicate_of) for c in report.candidates if not c.confirmed}
+        assert report.merged_clients == 0
+        assert await db_session.scalar(select(func.count()).select_from(Client)) == 5
+
+    async def test_apply_merges_confirmed_duplicates(self, db_session: AsyncSession, duplicate_clients: list[Client]):
+        john = duplicate_clients[0]
+
+        report = await deduplicate_clients(db_session, batch_size=2, merge_batch_size=1, apply=True)
+
+        assert report.merged_clients == 2
+        assert report.moved_tickets == 2
+        assert await db_session.scalar(select(func.count()).select_from(Client)) == 3
+        john_tickets = await db_session.scalar(
+            select(func.count()).select_from(Ticket).where(Ticket.client_id == john.id)
+        )
+        assert john_tickets == 3
@@ -3,6 +3,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.models import Client
+from src.tickets.models import Ticket, TicketStatus
 
 
 @pytest.fixture
@@ -19,6 +20,17 @@ async def test_client(db_session: AsyncSession) -> Client:
     return client
 
 
+@pytest.fixture
+async def client_tickets(db_session: AsyncSession, test_client: Client) -> list[Ticket]:
+    tickets = [
+        Ticket(title=f"Repair {status.value}", description="Overview test", status=status, client_id=test_client.id)
+        for status in (TicketStatus.NEW, TicketStatus.IN_PROGRESS, TicketStatus.DONE, TicketStatus.NEW)
+    ]
+    db_session.add_all(tickets)
+    await db_session.commit()
+    return tickets
+
+
 @pytest.mark.asyncio
 class TestClientsRouter:
     async def test_create_client_success(self, client: AsyncClient, admin_headers: dict[str, str]):
@@ -156,6 +168,92 @@ class TestClientsRouter:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
+    async def test_search_clients_by_phone(
+        self, client: AsyncClient, worker_headers: dict[str, str], test_client: Client
+    ):
+        response = await client.get("/clients/search", headers=worker_headers, params={"q": "+1 (234) 567-890"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["clients"]] == [test_client.id]
+        assert data["clients"][0]["matched_by"] == "phone"
+        assert data["clients"][0]["score"] == 1.0
+
+    async def test_search_clients_by_email_prefix(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client
+    ):
+        response = await client.get("/clients/search", headers=admin_headers, params={"q": "TestClient@"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data["clients"]] == [test_client.id]
+        assert data["clients"][0]["matched_by"] == "email"
+
+    async def test_search_clients_by_name_ranks_best_match_first(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client, db_session: AsyncSession
+    ):
+        db_session.add(Client(full_name="Tess Clayton", email="tess@example.com", phone="+1000000000"))
+        await db_session.commit()
+
+        response = await client.get("/clients/search", headers=admin_headers, params={"q": "Test Clint"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["clients"][0]["id"] == test_client.id
+        assert all(c["matched_by"] == "name" for c in data["clients"])
+
+    async def test_search_clients_by_name_escapes_wildcards(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client
+    ):
+        response = await client.get("/clients/search", headers=admin_headers, params={"q": "%_%"})
+
+        assert response.status_code == 200
+        assert response.json()["clients"] == []
+
+    async def test_search_clients_query_too_short(self, client: AsyncClient, admin_headers: dict[str, str]):
+        response = await client.get("/clients/search", headers=admin_headers, params={"q": "ab"})
+
+        assert response.status_code == 422
+
+    async def test_get_client_overview(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client, client_tickets: list[Ticket]
+    ):
+        response = await client.get(
+            f"/clients/{test_client.id}/overview", headers=admin_headers, params={"recent_limit": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["client"]["id"] == test_client.id
+        assert data["ticket_counts"] == {"total": 4, "new": 2, "in_progress": 1, "done": 1}
+        assert len(data["recent_tickets"]) == 2
+        assert data["last_activity_at"] is not None
+
+    async def test_get_client_overview_without_tickets(
+        self, client: AsyncClient, worker_headers: dict[str, str], test_client: Client
+    ):
+        response = await client.get(f"/clients/{test_client.id}/overview", headers=worker_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ticket_counts"]["total"] == 0
+        assert data["recent_tickets"] == []
+        assert data["last_activity_at"] is None
+
+    async def test_get_client_overview_not_found(self, client: AsyncClient, admin_headers: dict[str, str]):
+        response = await client.get("/clients/99999/overview", headers=admin_headers)
+
+        assert response.status_code == 404
+
+    async def test_list_clients_with_stats(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client, client_tickets: list[Ticket]
+    ):
+        response = await client.get("/clients", headers=admin_headers, params={"with_stats": True})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["clients"][0]["open_tickets_count"] == 3
+
     async def test_update_client_admin(self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client):
         response = await client.patch(
             f"/clients/{test_client.id}",
@@ -1,9 +1,11 @@
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.exceptions import ClientNotFoundError
 from src.clients.schemas import ClientCreate, ClientUpdate
 from src.clients.service import ClientService
+from src.tickets.models import Ticket, TicketStatus
 
 
 @pytest.mark.asyncio
@@ -105,6 +107,25 @@ class TestClientService:
         with pytest.raises(ClientNotFoundError):
             await service.get_client(created.id)
 
+    async def test_delete_client_removes_tickets(self, db_session: AsyncSession):
+        service = ClientService(db_session)
+
+        created = await service.create_client(
+            ClientCreate(full_name="Owner", email="owner@test.com", phone="+1234567890"),
+        )
+        db_session.add_all(
+            Ticket(title=f"Repair {i}", description="Cascade test", status=TicketStatus.NEW, client_id=created.id)
+            for i in range(3)
+        )
+        await db_session.commit()
+
+        await service.delete_client(created.id)
+
+        remaining = await db_session.scalar(
+            select(func.count()).select_from(Ticket).where(Ticket.client_id == created.id)
+        )
+        assert remaining == 0
+
     async def test_delete_client_not_found(self, db_session: AsyncSession):
         service = ClientService(db_session)
 
@@ -6,8 +6,9 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.auth.utils import hash_password
+from src.core.cache import response_cache
 from src.core.config import settings
-from src.core.dependencies import get_db
+from src.core.dependencies import get_db, get_session_factory
 from src.database.base import Base
 from src.main import app
 from src.users.models import User, UserRole
@@ -37,6 +38,13 @@ async def test_engine():
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def disable_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests write rows directly, which the response cache does not see; cache tests enable it themselves."""
+    monkeypatch.setattr(response_cache, "ttl_seconds", 0)
+    response_cache.clear()
+
+
 @pytest.fixture
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
     session_maker = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
@@ -52,6 +60,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        db_session.bind, class_=AsyncSession, expire_on_commit=False
+    )
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,155 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.models import Client
+from src.core.cache import CacheTag, ResponseCache, response_cache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(clock: FakeClock, max_entries: int = 10, max_bytes: int = 10_000) -> ResponseCache:
+    return ResponseCache(ttl_seconds=10, max_entries=max_entries, max_bytes=max_bytes, clock=clock)
+
+
+def store(cache: ResponseCache, key: str, *tags: str, body: bytes = b"{}") -> None:
+    cache.set(key, body, {}, tags, cache.generation(tags))
+
+
+class TestResponseCache:
+    def test_evicts_least_recently_used(self):
+        cache = make_cache(FakeClock(), max_entries=2)
+        store(cache, "a", CacheTag.TICKETS)
+        store(cache, "b", CacheTag.TICKETS)
+        assert cache.get("a") is not None
+
+        store(cache, "c", CacheTag.TICKETS)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats().evictions == 1
+
+    def test_evicts_beyond_max_bytes(self):
+        cache = make_cache(FakeClock(), max_bytes=300)
+        store(cache, "a", CacheTag.TICKETS, body=b"x" * 150)
+        store(cache, "b", CacheTag.TICKETS, body=b"x" * 150)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.stats().bytes <= 300
+
+        store(cache, "c", CacheTag.TICKETS, body=b"x" * 1000)
+        assert cache.get("c") is None
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        cache = make_cache(clock)
+        store(cache, "a", CacheTag.TICKETS)
+
+        clock.now = 9.9
+        assert cache.get("a") is not None
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats().entries == 0
+
+    def test_invalidate_drops_tagged_entries(self):
+        cache = make_cache(FakeClock())
+        store(cache, "tickets", CacheTag.TICKETS, CacheTag.CLIENTS)
+        store(cache, "clients", CacheTag.CLIENTS)
+        store(cache, "users", CacheTag.USERS)
+
+        cache.invalidate(CacheTag.CLIENTS)
+
+        assert cache.get("tickets") is None
+        assert cache.get("clients") is None
+        assert cache.get("users") is not None
+        assert cache.stats().invalidations == 2
+
+    def test_drops_responses_rendered_before_an_invalidation(self):
+        cache = make_cache(FakeClock())
+        generation = cache.generation([CacheTag.TICKETS])
+
+        cache.invalidate(CacheTag.TICKETS)
+        cache.set("a", b"{}", {}, [CacheTag.TICKETS], generation)
+
+        assert cache.get("a") is None
+
+    def test_disabled_without_ttl(self):
+        cache = ResponseCache(ttl_seconds=0, max_entries=10, max_bytes=10_000)
+        store(cache, "a", CacheTag.TICKETS)
+
+        assert not cache.enabled
+        assert cache.stats().entries == 0
+
+
+@pytest.fixture
+def enable_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(response_cache, "ttl_seconds", 60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("enable_response_cache")
+class TestCachedLists:
+    async def test_serves_repeated_reads_until_a_write(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession
+    ):
+        db_session.add(Client(full_name="Cached Client", email="cached@test.com", phone="+1234567890"))
+        await db_session.commit()
+        params = {"per_page": 100}
+
+        first = await client.get("/clients", headers=admin_headers, params=params)
+        second = await client.get("/clients", headers=admin_headers, params=params)
+
+        assert first.headers["x-cache"] == "miss"
+        assert second.headers["x-cache"] == "hit"
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+
+        response = await client.get("/clients", headers={**admin_headers, "If-None-Match": first.headers["etag"]})
+        assert response.status_code == 200
+        response = await client.get(
+            "/clients", headers={**admin_headers, "If-None-Match": first.headers["etag"]}, params=params
+        )
+        assert response.status_code == 304
+        assert response.headers["x-cache"] == "hit"
+
+        created = await client.post(
+            "/clients",
+            headers=admin_headers,
+            json={"full_name": "New Client", "email": "new.cached@test.com", "phone": "+1234567891"},
+        )
+        assert created.status_code == 201
+
+        response = await client.get("/clients", headers=admin_headers, params=params)
+        assert response.headers["x-cache"] == "miss"
+        assert response.json()["total_count"] == first.json()["total_count"] + 1
+
+    async def test_worker_lists_are_not_shared(
+        self, client: AsyncClient, admin_headers: dict[str, str], worker_headers: dict[str, str]
+    ):
+        await client.get("/tickets", headers=admin_headers)
+        response = await client.get("/tickets", headers=worker_headers)
+
+        assert response.headers["x-cache"] == "miss"
+
+    async def test_stats(self, client: AsyncClient, admin_headers: dict[str, str], worker_headers: dict[str, str]):
+        await client.get("/users", headers=admin_headers)
+        await client.get("/users", headers=admin_headers)
+
+        response = await client.get("/admin/cache", headers=admin_headers)
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+        response = await client.get("/admin/cache", headers=worker_headers)
+        assert response.status_code == 403
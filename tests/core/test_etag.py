@@ -0,0 +1,123 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.models import Client
+from src.core.etag import etag_matches, make_etag
+from src.tickets.models import Ticket
+from src.users.models import User
+
+
+@pytest.fixture
+async def test_client(db_session: AsyncSession) -> Client:
+    client = Client(full_name="ETag Client", email="etag@test.com", phone="+1234567890")
+    db_session.add(client)
+    await db_session.commit()
+    await db_session.refresh(client)
+    return client
+
+
+@pytest.fixture
+async def test_ticket(db_session: AsyncSession, test_client: Client) -> Ticket:
+    ticket = Ticket(title="ETag ticket", description="Conditional GET", client_id=test_client.id)
+    db_session.add(ticket)
+    await db_session.commit()
+    await db_session.refresh(ticket)
+    return ticket
+
+
+async def assert_revalidates(client: AsyncClient, url: str, headers: dict[str, str], **kwargs) -> str:
+    """GET `url`, check a conditional GET with its ETag answers 304, and return the ETag."""
+    response = await client.get(url, headers=headers, **kwargs)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    response = await client.get(url, headers={**headers, "If-None-Match": etag}, **kwargs)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    return etag
+
+
+class TestEtagMatching:
+    def test_if_none_match(self):
+        etag = make_etag("tickets", 1)
+
+        assert etag.startswith('"') and etag.endswith('"')
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+        assert etag_matches("*", etag)
+        assert etag_matches(f'"other", {etag}', etag)
+        assert etag_matches(f"W/{etag}", etag)
+
+
+@pytest.mark.asyncio
+class TestConditionalGet:
+    async def test_ticket_detail(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_ticket: Ticket, test_client: Client
+    ):
+        url = f"/tickets/{test_ticket.id}"
+        etag = await assert_revalidates(client, url, admin_headers)
+
+        await client.patch(url, headers=admin_headers, json={"title": "ETag ticket, edited"})
+        edited_etag = await assert_revalidates(client, url, admin_headers)
+        assert edited_etag != etag
+
+        # The client's name is part of the ticket detail.
+        await client.patch(f"/clients/{test_client.id}", headers=admin_headers, json={"full_name": "Renamed Client"})
+        response = await client.get(url, headers={**admin_headers, "If-None-Match": edited_etag})
+        assert response.status_code == 200
+        assert response.json()["client"]["full_name"] == "Renamed Client"
+
+    async def test_ticket_detail_checks_access_first(
+        self, client: AsyncClient, worker_headers: dict[str, str], test_ticket: Ticket
+    ):
+        response = await client.get(f"/tickets/{test_ticket.id}", headers={**worker_headers, "If-None-Match": "*"})
+
+        assert response.status_code in (403, 404)
+        assert "etag" not in response.headers
+
+    async def test_ticket_list(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession, test_ticket: Ticket
+    ):
+        params = {"title": "ETag", "per_page": 5}
+        etag = await assert_revalidates(client, "/tickets", admin_headers, params=params)
+
+        db_session.add(Ticket(title="ETag ticket 2", description="Conditional GET", client_id=test_ticket.client_id))
+        await db_session.commit()
+
+        response = await client.get("/tickets", headers={**admin_headers, "If-None-Match": etag}, params=params)
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+        other_page = await client.get("/tickets", headers=admin_headers, params={**params, "page": 2})
+        assert other_page.headers["etag"] != response.headers["etag"]
+
+    async def test_client_detail_and_list(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_client: Client
+    ):
+        url = f"/clients/{test_client.id}"
+        etag = await assert_revalidates(client, url, admin_headers)
+        list_etag = await assert_revalidates(client, "/clients", admin_headers)
+
+        await client.patch(url, headers=admin_headers, json={"address": "1 Cache Lane"})
+
+        assert await assert_revalidates(client, url, admin_headers) != etag
+        assert await assert_revalidates(client, "/clients", admin_headers) != list_etag
+
+        response = await client.get("/clients", headers=admin_headers, params={"with_stats": True})
+        assert "etag" not in response.headers
+
+        response = await client.get("/clients/999999", headers={**admin_headers, "If-None-Match": "*"})
+        assert response.status_code == 404
+
+    async def test_user_detail_and_list(self, client: AsyncClient, admin_headers: dict[str, str], worker_user: User):
+        url = f"/users/{worker_user.id}"
+        etag = await assert_revalidates(client, url, admin_headers)
+        list_etag = await assert_revalidates(client, "/users", admin_headers, params={"role": "worker"})
+
+        await client.patch(url, headers=admin_headers, json={"full_name": "Renamed Worker"})
+
+        assert await assert_revalidates(client, url, admin_headers) != etag
+        assert await assert_revalidates(client, "/users", admin_headers, params={"role": "worker"}) != list_etag
@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.models import Client
+from src.core.config import settings
+from src.core.export import encode_csv, encode_ndjson
+from src.tickets.models import Ticket
+from src.users.models import User
+
+
+@pytest.fixture
+async def test_client(db_session: AsyncSession) -> Client:
+    client = Client(full_name="Export Client", email="export@test.com", phone="+1234567890")
+    db_session.add(client)
+    await db_session.commit()
+    await db_session.refresh(client)
+    return client
+
+
+@pytest.fixture
+async def test_tickets(db_session: AsyncSession, test_client: Client, worker_user: User) -> list[Ticket]:
+    tickets = [
+        Ticket(
+            title=f"Export ticket {i}",
+            description='Says "hello", then\na new line',
+            client_id=test_client.id,
+            assigned_worker_id=worker_user.id if i % 2 else None,
+            tags=["device:boiler"],
+            custom_fields={"visits": i},
+            created_at=datetime(2026, 3, 1, 12, i),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(tickets)
+    await db_session.commit()
+    return tickets
+
+
+def read_csv(text: str) -> list[dict[str, str]]:
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+class TestEncoding:
+    def test_csv(self):
+        rows = [{"id": 1, "tags": ["a", "b"], "fields": {"k": 1}, "due_at": None, "at": datetime(2026, 1, 2, 3, 4)}]
+        columns = ("id", "tags", "fields", "due_at", "at")
+
+        assert encode_csv(columns, rows, header=True).decode().splitlines() == [
+            "id,tags,fields,due_at,at",
+            '1,"[""a"", ""b""]","{""k"": 1}",,2026-01-02T03:04:00',
+        ]
+
+    def test_ndjson(self):
+        rows = [{"id": 1, "at": datetime(2026, 1, 2), "extra": "dropped"}, {"id": 2, "at": None, "extra": ""}]
+
+        lines = encode_ndjson(("id", "at"), rows).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [{"id": 1, "at": "2026-01-02T00:00:00"}, {"id": 2, "at": None}]
+
+
+@pytest.mark.asyncio
+class TestExport:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "EXPORT_CHUNK_ROWS", 2)
+
+    async def test_tickets_csv(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_tickets: list[Ticket], worker_user: User
+    ):
+        response = await client.get("/tickets/export", headers=admin_headers, params={"title": "Export ticket"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert response.headers["content-disposition"] == 'attachment; filename="tickets.csv"'
+
+        rows = read_csv(response.text)
+        assert [row["id"] for row in rows] == [str(ticket.id) for ticket in test_tickets]
+        assert rows[0]["description"] == 'Says "hello", then\na new line'
+        assert rows[0]["client_full_name"] == "Export Client"
+        assert rows[0]["assigned_worker_full_name"] == ""
+        assert rows[1]["assigned_worker_full_name"] == worker_user.full_name
+        assert json.loads(rows[1]["tags"]) == ["device:boiler"]
+        assert json.loads(rows[1]["custom_fields"]) == {"visits": 1}
+        assert rows[1]["created_at"] == "2026-03-01T12:01:00"
+
+    async def test_tickets_ndjson_for_worker(
+        self, client: AsyncClient, worker_headers: dict[str, str], test_tickets: list[Ticket]
+    ):
+        response = await client.get(
+            "/tickets/export", headers=worker_headers, params={"title": "Export ticket", "format": "ndjson"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        tickets = [json.loads(line) for line in response.text.splitlines()]
+        assert [ticket["id"] for ticket in tickets] == [ticket.id for ticket in test_tickets[1::2]]
+        assert tickets[0]["custom_fields"] == {"visits": 1}
+
+    async def test_invalid_filters_fail_before_streaming(self, client: AsyncClient, admin_headers: dict[str, str]):
+        response = await client.get("/tickets/export", headers=admin_headers, params={"cf.unknown": "1"})
+
+        assert response.status_code == 422
+
+        response = await client.get("/tickets/export", headers=admin_headers, params={"format": "xml"})
+        assert response.status_code == 422
+
+    async def test_clients(self, client: AsyncClient, worker_headers: dict[str, str], test_client: Client):
+        response = await client.get("/clients/export", headers=worker_headers)
+
+        assert response.status_code == 200
+        rows = [row for row in read_csv(response.text) if row["id"] == str(test_client.id)]
+        assert rows == [
+            {
+                "id": str(test_client.id),
+                "full_name": "Export Client",
+                "email": "export@test.com",
+                "phone": "+1234567890",
+                "address": "",
+                "updated_at": test_client.updated_at.isoformat(),
+            }
+        ]
+
+        response = await client.get("/clients/export")
+        assert response.status_code in (401, 403)
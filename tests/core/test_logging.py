@@ -0,0 +1,85 @@
+import json
+import logging
+import sys
+
+from src.core.logging import DropOldestQueue, JsonFormatter, LogQueueListener, RequestSampler, StructuredQueueHandler
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def make_record(msg: str, **extra) -> logging.LogRecord:
+    record = logging.makeLogRecord({"name": "test", "levelno": logging.INFO, "levelname": "INFO", "msg": msg})
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    def test_extra_fields_and_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("Failed %s", args=("job",), exc_info=sys.exc_info(), path="/tickets", status_code=500)
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        assert entry["message"] == "Failed job"
+        assert (entry["level"], entry["logger"]) == ("INFO", "test")
+        assert (entry["path"], entry["status_code"]) == ("/tickets", 500)
+        assert entry["exception"].endswith("ValueError: boom")
+        assert "args" not in entry and "exc_info" not in entry
+
+
+class TestDropOldestQueue:
+    def test_full_queue_drops_the_oldest(self):
+        log_queue = DropOldestQueue(maxsize=2)
+
+        for item in range(5):
+            log_queue.put_nowait(item)
+
+        assert log_queue.dropped == 3
+        assert [log_queue.get_nowait(), log_queue.get_nowait()] == [3, 4]
+        assert log_queue.empty()
+
+
+class TestLogQueueListener:
+    def test_records_are_written_and_drops_reported(self):
+        log_queue = DropOldestQueue(maxsize=2)
+        handler = StructuredQueueHandler(log_queue)
+        output = ListHandler()
+
+        for i in range(4):
+            handler.handle(make_record("Record %d", args=(i,), request_id=i))
+        listener = LogQueueListener(log_queue, output)
+        listener.start()
+        listener.stop()
+
+        assert [record.getMessage() for record in output.records] == [
+            "Dropped 2 log records, the log queue was full",
+            "Record 2",
+            "Record 3",
+        ]
+        assert output.records[-1].request_id == 3
+
+
+class TestRequestSampler:
+    def test_errors_and_slow_requests_are_always_kept(self):
+        sampler = RequestSampler(success_rate=0, slow_seconds=1)
+
+        assert sampler.keep(500, 0.01)
+        assert sampler.keep(404, 0.01)
+        assert sampler.keep(None, 0.01)
+        assert sampler.keep(200, 1.5)
+        assert not sampler.keep(200, 0.01)
+
+    def test_fast_successes_are_sampled(self):
+        draws = iter([0.05, 0.5])
+        sampler = RequestSampler(success_rate=0.1, slow_seconds=1, rng=lambda: next(draws))
+
+        assert [sampler.keep(200, 0.01), sampler.keep(200, 0.01)] == [True, False]
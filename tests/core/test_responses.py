@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from src.clients.models import Client
+from src.core.responses import ModelResponse, construct
+from src.tickets.models import Ticket, TicketPriority, TicketStatus
+from src.tickets.schemas import ClientInfo, TicketResponse
+
+
+class TestTrustedResponses:
+    def test_constructed_models_render_like_validated_ones(self):
+        client = Client(id=7, full_name="Fast Client", email="fast@test.com", phone="+1234567890")
+        ticket = Ticket(
+            id=3,
+            title="Leaking tap",
+            description="Kitchen",
+            status=TicketStatus.NEW,
+            priority=TicketPriority.HIGH,
+            due_at=None,
+            tags=["device:tap"],
+            custom_fields={"visits": 1},
+            created_at=datetime(2026, 1, 1, 10, 30),
+            updated_at=datetime(2026, 1, 2),
+        )
+
+        trusted = construct(TicketResponse, ticket, client=construct(ClientInfo, client), assigned_worker=None)
+        validated = TicketResponse.model_validate(trusted.model_dump())
+        response = ModelResponse(trusted)
+
+        assert response.body == validated.model_dump_json().encode()
+        assert response.headers["content-type"] == "application/json"
+        assert trusted.client.email == "fast@test.com"
+
+    def test_construct_values_override_attributes(self):
+        client = Client(id=7, full_name="Fast Client", email="fast@test.com", phone="+1234567890")
+
+        info = construct(ClientInfo, client, full_name="Renamed")
+
+        assert (info.id, info.full_name) == (7, "Renamed")
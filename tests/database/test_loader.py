@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.models import Client
+from src.database.loader import get_batch_loader
+
+
+@pytest.fixture
+def statements(db_session: AsyncSession):
+    executed: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        executed.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+class TestBatchLoader:
+    async def test_loads_many_in_one_query_and_memoizes(self, db_session: AsyncSession, statements: list[str]):
+        clients = [Client(full_name=f"Client {i}", email=f"c{i}@test.com", phone="+1234567890") for i in range(3)]
+        db_session.add_all(clients)
+        await db_session.commit()
+        ids = [client.id for client in clients]
+        statements.clear()
+
+        loader = get_batch_loader(db_session, Client)
+        loaded = await loader.load_many([*ids, ids[0], None, 99999])
+
+        assert set(loaded) == set(ids)
+        assert len(statements) == 1
+        assert "ANY" in statements[0]
+
+        again = await get_batch_loader(db_session, Client).load_many([ids[1], 99999])
+
+        assert list(again) == [ids[1]]
+        assert len(statements) == 1
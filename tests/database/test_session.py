@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import NullPool
+
+from src.core.config import settings
+from src.database.session import build_engine
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.mark.asyncio
+class TestBuildEngine:
+    async def test_pgbouncer_mode_disables_prepared_statements(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "DATABASE_PGBOUNCER_MODE", True)
+        monkeypatch.setattr(settings, "DATABASE_PGBOUNCER_POOL_SIZE", 0)
+
+        engine = build_engine(TEST_DATABASE_URL)
+        try:
+            async with engine.connect() as conn:
+                driver_connection = (await conn.get_raw_connection()).driver_connection
+                assert driver_connection.prepare_threshold is None
+            assert isinstance(engine.pool, NullPool)
+        finally:
+            await engine.dispose()
+
+    async def test_pgbouncer_mode_with_local_pool(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(settings, "DATABASE_PGBOUNCER_MODE", True)
+        monkeypatch.setattr(settings, "DATABASE_PGBOUNCER_POOL_SIZE", 3)
+
+        engine = build_engine(TEST_DATABASE_URL)
+        try:
+            assert engine.pool.size() == 3
+        finally:
+            await engine.dispose()
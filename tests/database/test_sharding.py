@@ -0,0 +1,243 @@
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, func, or_, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.clients.models import Client
+from src.clients.repository import ClientRepository
+from src.database.sharding import (
+    ShardRouter,
+    create_shard_schema,
+    execute_on_all_shards,
+    shard_metadata,
+    stream_on_all_shards,
+)
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY
+from src.tickets.models import Ticket, TicketStatus
+from src.tickets.repository import TicketRepository
+from src.tickets.schemas import TicketFilters
+from src.tickets.service import TicketService
+from src.users.models import User
+from src.users.repository import UserRepository
+from tests.conftest import TEST_DATABASE_URL
+
+SHARD_COUNT = 2
+SHARD_DATABASE_URLS = [f"{TEST_DATABASE_URL}_shard_{index}" for index in range(SHARD_COUNT)]
+
+
+async def create_database(engine: AsyncEngine, url: str) -> None:
+    name = url.rsplit("/", 1)[1]
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if not await conn.scalar(text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": name}):
+            await conn.execute(text(f'CREATE DATABASE "{name}"'))
+
+
+@pytest.fixture
+async def shard_router(test_engine: AsyncEngine) -> AsyncGenerator[ShardRouter, None]:
+    try:
+        for url in SHARD_DATABASE_URLS:
+            await create_database(test_engine, url)
+    except DBAPIError as exc:
+        pytest.skip(f"Cannot create shard databases: {exc}")
+
+    shards = [create_async_engine(url) for url in SHARD_DATABASE_URLS]
+    metadata = shard_metadata()
+    for index, shard in enumerate(shards):
+        async with shard.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await create_shard_schema(shard, index, SHARD_COUNT)
+
+    yield ShardRouter(test_engine, shards)
+
+    for shard in shards:
+        await shard.dispose()
+
+
+@pytest.fixture
+async def sharded_session(shard_router: ShardRouter) -> AsyncGenerator[AsyncSession, None]:
+    async with shard_router.session_factory() as session:
+        yield session
+
+
+async def create_clients_with_tickets(db: AsyncSession, count: int) -> list[Client]:
+    repo = ClientRepository(db)
+    clients = [
+        await repo.create(full_name=f"Client {i}", email=f"client{i}@shard.test", phone="+1234567890")
+        for i in range(count)
+    ]
+
+    start = datetime(2024, 1, 1)
+    for i, client in enumerate(clients):
+        db.add(
+            Ticket(
+                title=f"Repair {i}",
+                description="Sharding test",
+                status=TicketStatus.NEW,
+                client_id=client.id,
+                created_at=start + timedelta(hours=i),
+            )
+        )
+    await db.commit()
+    return clients
+
+
+@contextmanager
+def count_shard_statements(shard_router: ShardRouter) -> Iterator[dict[str, int]]:
+    statements: dict[str, int] = {}
+    listeners = []
+    for shard_id, shard in zip(shard_router.shard_ids, shard_router.shards):
+
+        def count(*args, shard_id: str = shard_id) -> None:
+            statements[shard_id] = statements.get(shard_id, 0) + 1
+
+        event.listen(shard.sync_engine, "before_cursor_execute", count)
+        listeners.append((shard.sync_engine, count))
+
+    try:
+        yield statements
+    finally:
+        for engine, listener in listeners:
+            event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.mark.asyncio
+class TestSharding:
+    async def test_clients_and_tickets_share_a_shard(self, shard_router: ShardRouter, sharded_session: AsyncSession):
+        clients = await create_clients_with_tickets(sharded_session, 8)
+
+        for index, session_factory in enumerate(shard_router.shard_session_factories):
+            async with session_factory() as session:
+                client_ids = set(await session.scalars(select(Client.id)))
+                ticket_client_ids = set(await session.scalars(select(Ticket.client_id)))
+                ticket_ids = set(await session.scalars(select(Ticket.id)))
+
+            assert all(client_id % SHARD_COUNT == index for client_id in client_ids)
+            assert ticket_client_ids <= client_ids
+            assert all(ticket_id % SHARD_COUNT == index for ticket_id in ticket_ids)
+
+        assert {client.id for client in clients} == set(
+            await sharded_session.scalars(select(Client.id).execution_options(populate_existing=True))
+        )
+
+    async def test_ticket_list_is_merged_across_shards(self, sharded_session: AsyncSession, admin_user: User):
+        await create_clients_with_tickets(sharded_session, 7)
+        service = TicketService(sharded_session)
+
+        first_page, total, total_pages = await service.get_tickets(admin_user, page=1, per_page=3)
+        second_page, _, _ = await service.get_tickets(admin_user, page=2, per_page=3)
+
+        assert total == 7
+        assert total_pages == 3
+        assert [ticket.title for ticket in first_page + second_page] == [f"Repair {i}" for i in range(6, 0, -1)]
+
+    async def test_list_versions_cover_every_shard(self, sharded_session: AsyncSession, admin_user: User):
+        clients = await create_clients_with_tickets(sharded_session, 5)
+
+        count, updated_at = await TicketRepository(sharded_session).get_list_version()
+        client_count, client_updated_at = await ClientRepository(sharded_session).get_list_version()
+
+        assert (count, client_count) == (5, 5)
+        assert client_updated_at == max(client.updated_at for client in clients)
+        assert updated_at is not None
+
+    async def test_export_streams_every_shard(self, sharded_session: AsyncSession, admin_user: User):
+        await create_clients_with_tickets(sharded_session, 5)
+        service = TicketService(sharded_session)
+
+        export_filters = await service.get_export_filters(admin_user, TicketFilters())
+        chunks = [rows async for rows in service.export_tickets(export_filters, chunk_size=2)]
+
+        assert all(len(rows) <= 2 for rows in chunks)
+        assert sorted(row["title"] for rows in chunks for row in rows) == [f"Repair {i}" for i in range(5)]
+        assert all(row["client_full_name"].startswith("Client ") for rows in chunks for row in rows)
+
+    async def test_tag_counts_are_summed_across_shards(self, sharded_session: AsyncSession, admin_user: User):
+        await create_clients_with_tickets(sharded_session, 6)
+        for shard_id in ("shard_0", "shard_1"):
+            await sharded_session.execute(
+                Ticket.__table__.update().values(tags=["device:boiler"]), bind_arguments={"shard_id": shard_id}
+            )
+        await sharded_session.commit()
+
+        facets = await TicketService(sharded_session).get_facets(admin_user, TicketFilters())
+
+        assert [(tag_count.tag, tag_count.count) for tag_count in facets.tags] == [("device:boiler", 6)]
+
+    async def test_claims_take_every_ticket_once(self, sharded_session: AsyncSession, worker_user: User):
+        await create_clients_with_tickets(sharded_session, 5)
+        repo = TicketRepository(sharded_session)
+
+        claimed = [await repo.claim_next(worker_user.id) for _ in range(6)]
+
+        assert claimed[-1] is None
+        assert len({ticket.id for ticket in claimed[:-1]}) == 5
+        assert all(ticket.status == TicketStatus.IN_PROGRESS for ticket in claimed[:-1])
+
+    async def test_lookup_by_id_uses_one_shard(self, shard_router: ShardRouter, sharded_session: AsyncSession):
+        clients = await create_clients_with_tickets(sharded_session, 4)
+        ticket_id = await sharded_session.scalar(select(Ticket.id).where(Ticket.client_id == clients[1].id))
+
+        sharded_session.expunge_all()
+        with count_shard_statements(shard_router) as statements:
+            ticket = await sharded_session.get(Ticket, ticket_id)
+            status = await sharded_session.scalar(select(Ticket.status).where(Ticket.id == ticket_id))
+
+        assert ticket.client_id == clients[1].id
+        assert status == TicketStatus.NEW
+        assert list(statements) == [shard_router.shard_for(ticket_id)]
+
+    async def test_equality_under_or_queries_every_shard(
+        self, shard_router: ShardRouter, sharded_session: AsyncSession
+    ):
+        clients = await create_clients_with_tickets(sharded_session, 4)
+        ticket_id = await sharded_session.scalar(select(Ticket.id).where(Ticket.client_id == clients[1].id))
+
+        with count_shard_statements(shard_router) as statements:
+            titles = await sharded_session.scalars(
+                select(Ticket.title).where(or_(Ticket.id == ticket_id, Ticket.title == "Repair 2"))
+            )
+        assert sorted(titles) == ["Repair 1", "Repair 2"]
+        assert sorted(statements) == shard_router.shard_ids
+
+        with count_shard_statements(shard_router) as statements:
+            titles = await sharded_session.scalars(
+                select(Ticket.title).where(
+                    Ticket.client_id == clients[1].id, or_(Ticket.id == ticket_id, Ticket.title == "Repair 2")
+                )
+            )
+        assert list(titles) == ["Repair 1"]
+        assert list(statements) == [shard_router.shard_for(ticket_id)]
+
+    async def test_shard_sessions_apply_the_statement_timeout(self, sharded_session: AsyncSession):
+        sharded_session.info[STATEMENT_TIMEOUT_KEY] = 1234
+        query = select(func.current_setting("statement_timeout"))
+
+        rows = await execute_on_all_shards(sharded_session, query)
+        chunks = [rows async for rows in stream_on_all_shards(sharded_session, query, chunk_size=10)]
+
+        assert [row[0] for row in rows] == ["1234ms"] * SHARD_COUNT
+        assert [row[0] for rows in chunks for row in rows] == ["1234ms"] * SHARD_COUNT
+
+    async def test_deleting_worker_unassigns_tickets_on_every_shard(
+        self, sharded_session: AsyncSession, worker_user: User
+    ):
+        await create_clients_with_tickets(sharded_session, 4)
+        for shard_id in ("shard_0", "shard_1"):
+            await sharded_session.execute(
+                Ticket.__table__.update().values(assigned_worker_id=worker_user.id),
+                bind_arguments={"shard_id": shard_id},
+            )
+        await sharded_session.commit()
+
+        user = await sharded_session.get(User, worker_user.id)
+        await UserRepository(sharded_session).delete(user)
+
+        assigned = await sharded_session.scalars(
+            select(func.count()).select_from(Ticket).where(Ticket.assigned_worker_id.is_not(None))
+        )
+        assert sum(assigned) == 0
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.clients.models import Client
+from src.clients.repository import ClientRepository
+from src.database.soft_delete import purge_soft_deleted
+from src.tickets.models import Ticket, TicketStatus
+from src.tickets.repository import TicketRepository
+
+
+@pytest.fixture
+async def client_with_tickets(db_session: AsyncSession) -> Client:
+    client = Client(full_name="Soft Delete Client", email="soft@test.com", phone="+1234567890")
+    db_session.add(client)
+    await db_session.flush()
+    db_session.add_all(
+        Ticket(title=f"Repair {i}", description="Soft delete test", status=TicketStatus.NEW, client_id=client.id)
+        for i in range(3)
+    )
+    await db_session.commit()
+    return client
+
+
+async def count_rows(db: AsyncSession, model: type, include_deleted: bool = False) -> int:
+    query = select(func.count()).select_from(model).execution_options(include_deleted=include_deleted)
+    return await db.scalar(query) or 0
+
+
+@pytest.mark.asyncio
+class TestSoftDelete:
+    async def test_deleted_ticket_is_hidden_but_kept(self, db_session: AsyncSession, client_with_tickets: Client):
+        repo = TicketRepository(db_session)
+        tickets, total = await repo.get_all()
+        assert total == 3
+
+        await repo.delete(tickets[0])
+
+        assert await repo.get_by_id(tickets[0].id) is None
+        _, total = await repo.get_all()
+        assert total == 2
+        assert await count_rows(db_session, Ticket, include_deleted=True) == 3
+
+    async def test_deleting_client_tombstones_its_tickets(self, db_session: AsyncSession, client_with_tickets: Client):
+        repo = ClientRepository(db_session)
+
+        await repo.delete(client_with_tickets)
+
+        assert await repo.get_by_id(client_with_tickets.id) is None
+        assert await count_rows(db_session, Ticket) == 0
+        assert await count_rows(db_session, Ticket, include_deleted=True) == 3
+        assert await count_rows(db_session, Client, include_deleted=True) == 1
+
+    async def test_purge_removes_only_expired_tombstones(self, db_session: AsyncSession, client_with_tickets: Client):
+        repo = TicketRepository(db_session)
+        tickets, _ = await repo.get_all()
+        await repo.delete(tickets[0])
+
+        purged = await purge_soft_deleted(db_session, older_than=datetime.utcnow() - timedelta(days=1))
+        assert purged == 0
+
+        purged = await purge_soft_deleted(db_session, older_than=datetime.utcnow() + timedelta(seconds=1), batch_size=1)
+        assert purged == 1
+        assert await count_rows(db_session, Ticket, include_deleted=True) == 2
@@ -0,0 +1,62 @@
+import json
+
+import pytest
+from fastapi import Request
+from psycopg.errors import QueryCanceled
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.dependencies import get_route_class
+from src.database.statement_timeout import STATEMENT_TIMEOUT_KEY, RouteClass
+from src.main import app
+from src.middleware.error_handler import operational_error_handler
+
+
+def make_request(method: str, path: str = "/tickets") -> Request:
+    return Request({"type": "http", "method": method, "path": path, "headers": [], "query_string": b""})
+
+
+@pytest.mark.asyncio
+class TestStatementTimeout:
+    async def test_timeout_is_set_per_transaction(self, db_session: AsyncSession):
+        db_session.info[STATEMENT_TIMEOUT_KEY] = 250
+        try:
+            assert await db_session.scalar(text("SHOW statement_timeout")) == "250ms"
+            await db_session.rollback()
+
+            db_session.info.pop(STATEMENT_TIMEOUT_KEY)
+            assert await db_session.scalar(text("SHOW statement_timeout")) != "250ms"
+        finally:
+            db_session.info.pop(STATEMENT_TIMEOUT_KEY, None)
+
+    async def test_slow_statement_is_cancelled(self, db_session: AsyncSession):
+        db_session.info[STATEMENT_TIMEOUT_KEY] = 50
+        try:
+            with pytest.raises(OperationalError) as exc_info:
+                await db_session.execute(text("SELECT pg_sleep(2)"))
+            await db_session.rollback()
+        finally:
+            db_session.info.pop(STATEMENT_TIMEOUT_KEY, None)
+
+        assert isinstance(exc_info.value.orig, QueryCanceled)
+
+        response = await operational_error_handler(make_request("GET"), exc_info.value)
+        assert response.status_code == 503
+        assert json.loads(response.body)["error"] == "DatabaseTimeoutError"
+
+    async def test_route_class_defaults_to_http_method(self):
+        assert get_route_class(make_request("GET")) == RouteClass.READ
+        assert get_route_class(make_request("POST")) == RouteClass.WRITE
+        assert get_route_class(make_request("DELETE")) == RouteClass.WRITE
+
+    async def test_bulk_admin_routes_use_admin_timeout(self):
+        request = make_request("DELETE", "/clients/1")
+        delete_route = next(
+            route for route in app.routes if route.path == "/clients/{client_id}" and "DELETE" in route.methods
+        )
+        for dependency in delete_route.dependant.dependencies:
+            if dependency.call.__name__ == "set_route_class":
+                dependency.call(request)
+
+        assert get_route_class(request) == RouteClass.ADMIN
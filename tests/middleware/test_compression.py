@@ -0,0 +1,115 @@
+import gzip
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from src.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+PAGE = {"tickets": [{"id": i, "title": f"Boiler {i} does not heat water", "status": "new"} for i in range(100)]}
+
+
+async def page(request: Request) -> JSONResponse:
+    return JSONResponse(PAGE, headers={"ETag": '"page-1"'})
+
+
+async def small(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "healthy"})
+
+
+async def image(request: Request) -> Response:
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def encoded(request: Request) -> Response:
+    return Response(gzip.compress(b"{}" * 1000), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+
+async def stream(request: Request) -> StreamingResponse:
+    async def rows():
+        for i in range(100):
+            yield f'{{"id": {i}, "title": "Boiler {i} does not heat water"}}\n'.encode()
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+
+routes = Starlette(
+    routes=[
+        Route("/page", page),
+        Route("/small", small),
+        Route("/image", image),
+        Route("/encoded", encoded),
+        Route("/stream", stream),
+    ]
+)
+
+
+async def get(path: str, accept_encoding: str = "gzip", **options) -> tuple[httpx.Response, bytes]:
+    app = CompressionMiddleware(routes, **{"minimum_size": 500, **options})
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response, raw
+
+
+class TestNegotiateEncoding:
+    def test_prefers_highest_weight(self):
+        assert negotiate_encoding("gzip, deflate, br", ("br", "gzip")) == "br"
+        assert negotiate_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+        assert negotiate_encoding("gzip;q=0, *;q=0.1", ("br", "gzip")) == "br"
+        assert negotiate_encoding("*", ("gzip",)) == "gzip"
+        assert negotiate_encoding("deflate", ("br", "gzip")) is None
+        assert negotiate_encoding("", ("gzip",)) is None
+        assert negotiate_encoding("gzip;q=bad", ("gzip",)) is None
+
+
+@pytest.mark.asyncio
+class TestCompressionMiddleware:
+    async def test_compresses_large_json(self):
+        response, raw = await get("/page")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-length"] == str(len(raw))
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == 'W/"page-1"'
+        assert len(raw) < len(JSONResponse(PAGE).body) / 4
+        assert gzip.decompress(raw) == JSONResponse(PAGE).body
+
+    async def test_compresses_in_a_thread_at_high_levels(self):
+        response, raw = await get("/page", gzip_level=9)
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw) == JSONResponse(PAGE).body
+
+    async def test_prefers_brotli(self):
+        brotli = pytest.importorskip("brotli")
+
+        response, raw = await get("/page", accept_encoding="gzip, br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(raw) == JSONResponse(PAGE).body
+
+    @pytest.mark.parametrize(
+        ("path", "accept_encoding"),
+        [
+            ("/page", "identity"),
+            ("/small", "gzip"),
+            ("/image", "gzip"),
+            ("/stream", "gzip"),
+        ],
+    )
+    async def test_passes_through(self, path: str, accept_encoding: str):
+        response, raw = await get(path, accept_encoding=accept_encoding)
+
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+        assert len(raw) > 0
+
+    async def test_keeps_encoded_responses(self):
+        response, raw = await get("/encoded")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw) == b"{}" * 1000
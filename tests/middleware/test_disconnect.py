@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from src.middleware.disconnect import CancelOnDisconnectMiddleware
+
+SCOPE = {"type": "http", "method": "GET", "path": "/tickets"}
+
+
+def client_messages(*messages: Message, delay: float = 0.05) -> Receive:
+    pending = list(messages)
+
+    async def receive() -> Message:
+        if len(pending) > 1:
+            return pending.pop(0)
+        await asyncio.sleep(delay)
+        return pending[0]
+
+    return receive
+
+
+async def discard(message: Message) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+class TestCancelOnDisconnect:
+    async def test_handler_is_cancelled_when_client_disconnects(self):
+        cancelled = asyncio.Event()
+
+        async def slow_app(scope: Scope, receive: Receive, send: Send) -> None:
+            await receive()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        middleware = CancelOnDisconnectMiddleware(slow_app)
+        receive = client_messages({"type": "http.request", "body": b""}, {"type": "http.disconnect"})
+
+        await asyncio.wait_for(middleware(SCOPE, receive, discard), timeout=1)
+
+        assert cancelled.is_set()
+
+    async def test_work_after_the_response_is_not_cancelled(self):
+        finished = asyncio.Event()
+
+        async def app_with_background_work(scope: Scope, receive: Receive, send: Send) -> None:
+            assert (await receive())["type"] == "http.request"
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+            await asyncio.sleep(0.2)
+            assert (await receive())["type"] == "http.disconnect"
+            finished.set()
+
+        middleware = CancelOnDisconnectMiddleware(app_with_background_work)
+        receive = client_messages({"type": "http.request", "body": b""}, {"type": "http.disconnect"})
+
+        await asyncio.wait_for(middleware(SCOPE, receive, discard), timeout=1)
+
+        assert finished.is_set()
@@ -0,0 +1,110 @@
+import logging
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Message
+
+from src.core.logging import RequestSampler
+from src.middleware.logging import LoggingMiddleware
+
+
+async def health(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "healthy"})
+
+
+async def missing(request: Request) -> JSONResponse:
+    return JSONResponse({"detail": "Not found"}, status_code=404)
+
+
+async def stream(request: Request) -> StreamingResponse:
+    async def chunks():
+        for chunk in (b"first,", b"second"):
+            yield chunk
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+routes = Starlette(routes=[Route("/health", health), Route("/missing", missing), Route("/stream", stream)])
+
+
+async def call(path: str, query_string: bytes = b"", sample_rate: float = 1) -> list[Message]:
+    app = LoggingMiddleware(routes, sampler=RequestSampler(sample_rate, slow_seconds=60, rng=lambda: 0.5))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query_string,
+        "headers": [],
+        "client": ("10.0.0.1", 5000),
+        "server": ("test", 80),
+    }
+    sent = []
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+class TestLoggingMiddleware:
+    async def test_process_time_header(self):
+        start, body = await call("/health")
+
+        headers = dict(start["headers"])
+        assert start["status"] == 200
+        assert float(headers[b"x-process-time"]) >= 0
+        assert body["body"] == b'{"status":"healthy"}'
+
+    async def test_streaming_responses_pass_through(self):
+        messages = await call("/stream")
+
+        assert [message.get("body") for message in messages[1:] if message.get("body")] == [b"first,", b"second"]
+        assert b"x-process-time" in dict(messages[0]["headers"])
+
+    async def test_requests_are_logged_once_completed(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="src.middleware.logging"):
+            await call("/health", query_string=b"page=2")
+
+        (completed,) = caplog.records
+        assert completed.getMessage().startswith("Request completed: GET /health 200 in ")
+        assert (completed.query_params, completed.client_host) == ("page=2", "10.0.0.1")
+        assert completed.status_code == 200
+        assert completed.process_time >= 0
+
+    async def test_fast_successful_requests_are_sampled(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="src.middleware.logging"):
+            await call("/health", sample_rate=0.4)
+            await call("/health", sample_rate=0.6)
+            await call("/missing", sample_rate=0)
+
+        assert [record.status_code for record in caplog.records] == [200, 404]
+
+    async def test_nothing_is_formatted_when_info_is_disabled(
+        self, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail(*args, **kwargs):
+            raise AssertionError("log record built while INFO is disabled")
+
+        monkeypatch.setattr(logging.Logger, "_log", fail)
+        with caplog.at_level(logging.WARNING, logger="src.middleware.logging"):
+            start, _ = await call("/health")
+
+        assert start["status"] == 200
+        assert not caplog.records
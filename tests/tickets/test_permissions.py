@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.utils import hash_password
+from src.clients.models import Client
+from src.tickets.exceptions import TicketAccessDeniedError
+from src.tickets.models import Ticket
+from src.tickets.permissions import (
+    can_modify_ticket,
+    can_modify_ticket_clause,
+    can_view_ticket,
+    can_view_ticket_clause,
+)
+from src.tickets.service import TicketService
+from src.users.models import User, UserRole
+
+
+@pytest.fixture
+async def tickets(db_session: AsyncSession, worker_user: User) -> list[Ticket]:
+    client = Client(full_name="Permission Client", email="permissions@test.com", phone="+1234567890")
+    db_session.add(client)
+    await db_session.flush()
+
+    tickets = [
+        Ticket(title=f"Repair {i}", description="Permissions", client_id=client.id, assigned_worker_id=worker_id)
+        for i, worker_id in enumerate([worker_user.id, None, worker_user.id])
+    ]
+    db_session.add_all(tickets)
+    await db_session.commit()
+    return tickets
+
+
+@pytest.fixture
+async def other_worker(db_session: AsyncSession) -> User:
+    user = User(
+        email="other-worker@test.com",
+        password=hash_password("worker123"),
+        full_name="Other Worker",
+        role=UserRole.WORKER,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.mark.asyncio
+class TestTicketPermissions:
+    async def test_predicates_match_boolean_checks(
+        self,
+        db_session: AsyncSession,
+        tickets: list[Ticket],
+        admin_user: User,
+        worker_user: User,
+        other_worker: User,
+    ):
+        ticket_ids = [ticket.id for ticket in tickets]
+
+        for user in (admin_user, worker_user, other_worker):
+            for check, clause in (
+                (can_view_ticket, can_view_ticket_clause),
+                (can_modify_ticket, can_modify_ticket_clause),
+            ):
+                selected = set(
+                    await db_session.scalars(select(Ticket.id).where(Ticket.id.in_(ticket_ids), clause(user)))
+                )
+                assert selected == {ticket.id for ticket in tickets if check(user, ticket)}
+
+    async def test_denied_ticket_is_not_loaded(
+        self, db_session: AsyncSession, tickets: list[Ticket], other_worker: User
+    ):
+        db_session.expunge_all()
+
+        with pytest.raises(TicketAccessDeniedError):
+            await TicketService(db_session).get_ticket(tickets[0].id, other_worker)
+
+        assert not any(isinstance(instance, Ticket) for instance in db_session.identity_map.values())
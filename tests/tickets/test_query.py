@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.tickets.exceptions import InvalidTicketQueryError
+from src.tickets.query import Term, get_query_plan, normalize, parse
+from src.users.models import User
+
+
+def render(plan_clauses: list) -> list[str]:
+    dialect = postgresql.dialect()
+    return [str(clause.compile(dialect=dialect, compile_kwargs={"literal_binds": True})) for clause in plan_clauses]
+
+
+class TestTicketQueryParser:
+    def test_parse_terms(self):
+        terms = parse('status:new,in_progress -worker:none created:>2026-01-01 client:"Acme, Inc" boiler')
+
+        assert terms == [
+            Term("status", ("new", "in_progress")),
+            Term("worker", ("none",), negated=True),
+            Term("created", (">2026-01-01",)),
+            Term("client", ("Acme, Inc",)),
+            Term("title", ("boiler",)),
+        ]
+
+    def test_normalize_is_order_and_case_insensitive(self):
+        first = normalize(parse('status:new,in_progress  client:"ACME" boiler'))
+        second = normalize(parse("Boiler client:acme status:in_progress,new status:new,in_progress"))
+
+        assert first == second == "client:acme status:in_progress,new title:boiler"
+        assert normalize(parse(first)) == first
+
+    def test_equivalent_queries_share_a_plan(self):
+        assert get_query_plan("worker:me status:done") is get_query_plan("STATUS:done   worker:me")
+
+    @pytest.mark.parametrize(
+        "query",
+        ['status:"new', "status: new", "status:bogus", "colour:red", "created:>someday", "id:abc", "created:*..*"],
+    )
+    def test_invalid_queries(self, query: str):
+        with pytest.raises(InvalidTicketQueryError):
+            get_query_plan(query)
+
+
+class TestTicketQueryCompiler:
+    def test_indexed_predicates_come_first(self):
+        plan = get_query_plan("boiler updated:>2026-01-01 -worker:3 created:2026-01-01..2026-01-31 id:7 status:new")
+
+        assert plan.explain() == [
+            "seek  id:7",
+            "seek  status:new",
+            "seek  created:2026-01-01..2026-01-31",
+            "range updated:>2026-01-01",
+            "scan  -worker:3",
+            "scan  title:boiler",
+        ]
+
+    def test_tags_use_the_gin_index(self):
+        plan = get_query_plan("tag:device:boiler,device:sink -tag:urgency:low")
+
+        assert plan.explain() == ["seek  tag:device:boiler,device:sink", "scan  -tag:urgency:low"]
+
+    def test_negated_status_becomes_complementary_list(self):
+        (clause,) = render(get_query_plan("-status:done").where(User(id=1)))
+
+        assert clause == "tickets.status IN ('in_progress', 'new')"
+
+    def test_worker_me_uses_current_user(self):
+        plan = get_query_plan("worker:me,none")
+
+        assert render(plan.where(User(id=5))) == [
+            "tickets.assigned_worker_id IS NULL OR tickets.assigned_worker_id IN (5)"
+        ]
+        assert render(plan.where(User(id=6))) == [
+            "tickets.assigned_worker_id IS NULL OR tickets.assigned_worker_id IN (6)"
+        ]
+
+    def test_names_and_titles_use_ilike(self):
+        client_clause, title_clause = render(get_query_plan('client:"acme" boiler').where(User(id=1)))
+
+        assert "clients.full_name ILIKE '%%acme%%'" in client_clause
+        assert "tickets.title ILIKE '%%boiler%%'" in title_clause
+        assert "lower(" not in client_clause + title_clause
+
+    def test_date_bounds_cover_whole_days(self):
+        (clause,) = get_query_plan("created:<=2026-01-31").where(User(id=1))
+
+        assert clause.right.value == datetime(2026, 2, 1)
+
+    def test_date_bounds_include_the_given_time(self):
+        (before,) = get_query_plan("created:<2026-01-01T10:00:00").where(User(id=1))
+        (through,) = get_query_plan("created:<=2026-01-01T10:00:00").where(User(id=1))
+
+        assert before.right.value == datetime(2026, 1, 1, 10)
+        assert through.right.value == datetime(2026, 1, 1, 10, 0, 0, 1)
+
+    def test_datetimes_keep_their_case(self):
+        (clause,) = get_query_plan("created:>=2026-01-01T10:00:00Z").where(User(id=1))
+
+        assert clause.right.value == datetime(2026, 1, 1, 10)
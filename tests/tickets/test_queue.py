@@ -0,0 +1,163 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.clients.models import Client
+from src.tickets.models import Ticket, TicketPriority, TicketStatus
+from src.tickets.repository import QUEUE_ORDER, TicketRepository
+from src.users.models import User
+
+
+@pytest.fixture
+async def test_client(db_session: AsyncSession) -> Client:
+    client = Client(full_name="Queue Client", email="queue@test.com", phone="+1234567890")
+    db_session.add(client)
+    await db_session.commit()
+    await db_session.refresh(client)
+    return client
+
+
+@pytest.mark.asyncio
+class TestWorkQueue:
+    async def test_queue_orders_by_priority_due_date_and_age(
+        self,
+        client: AsyncClient,
+        worker_headers: dict[str, str],
+        db_session: AsyncSession,
+        test_client: Client,
+        worker_user: User,
+    ):
+        now = datetime(2026, 3, 1)
+        tickets = [
+            ("normal, old", TicketPriority.NORMAL, None, now - timedelta(days=3)),
+            ("urgent", TicketPriority.URGENT, None, now),
+            ("normal, due later", TicketPriority.NORMAL, now + timedelta(days=5), now),
+            ("normal, due soon", TicketPriority.NORMAL, now + timedelta(days=1), now),
+            ("normal, new", TicketPriority.NORMAL, None, now - timedelta(days=1)),
+            ("low", TicketPriority.LOW, now, now),
+        ]
+        db_session.add_all(
+            Ticket(
+                title=title,
+                description="Queue test",
+                client_id=test_client.id,
+                assigned_worker_id=worker_user.id,
+                priority=priority,
+                due_at=due_at,
+                created_at=created_at,
+            )
+            for title, priority, due_at, created_at in tickets
+        )
+        await db_session.commit()
+
+        response = await client.get("/tickets", headers=worker_headers, params={"sort": "queue", "per_page": 4})
+
+        assert response.status_code == 200
+        assert [ticket["title"] for ticket in response.json()["tickets"]] == [
+            "urgent",
+            "normal, due soon",
+            "normal, due later",
+            "normal, old",
+        ]
+        assert response.json()["tickets"][0]["priority"] == TicketPriority.URGENT
+
+    async def test_priority_and_due_date_can_be_updated(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession, test_client: Client
+    ):
+        ticket = Ticket(title="Priority test", description="Queue test", client_id=test_client.id)
+        db_session.add(ticket)
+        await db_session.commit()
+
+        response = await client.patch(
+            f"/tickets/{ticket.id}",
+            headers=admin_headers,
+            json={"priority": 3, "due_at": "2026-03-01T12:00:00+02:00"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["priority"] == TicketPriority.HIGH
+        assert response.json()["due_at"] == "2026-03-01T10:00:00"
+
+        response = await client.patch(f"/tickets/{ticket.id}", headers=admin_headers, json={"priority": 7})
+        assert response.status_code == 422
+
+    async def test_worker_queue_is_read_in_index_order(self, db_session: AsyncSession, worker_user: User):
+        query = (
+            select(Ticket.id)
+            .where(Ticket.assigned_worker_id == worker_user.id, Ticket.deleted_at.is_(None))
+            .order_by(*QUEUE_ORDER)
+            .limit(20)
+        )
+        compiled = query.compile(db_session.bind, compile_kwargs={"literal_binds": True})
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+        plan = "\n".join(await db_session.scalars(text(f"EXPLAIN {compiled}")))
+
+        assert "ix_tickets_worker_queue" in plan
+        assert "Sort" not in plan
+
+    async def test_concurrent_claims_take_distinct_tickets(
+        self, test_engine: AsyncEngine, db_session: AsyncSession, test_client: Client, worker_user: User
+    ):
+        due_at = datetime(2000, 1, 1)
+        tickets = [
+            Ticket(
+                title=f"Claim {i}",
+                description="Claim test",
+                client_id=test_client.id,
+                priority=TicketPriority.URGENT,
+                due_at=due_at + timedelta(minutes=i),
+            )
+            for i in range(10)
+        ]
+        db_session.add_all(tickets)
+        await db_session.commit()
+
+        session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def claim() -> Ticket | None:
+            async with session_factory() as session:
+                return await TicketRepository(session).claim_next(worker_user.id)
+
+        claimed = await asyncio.gather(*(claim() for _ in range(len(tickets))))
+
+        assert sorted(ticket.id for ticket in claimed) == sorted(ticket.id for ticket in tickets)
+        assert all(ticket.assigned_worker_id == worker_user.id for ticket in claimed)
+        assert all(ticket.status == TicketStatus.IN_PROGRESS for ticket in claimed)
+
+    async def test_claim_endpoint(
+        self,
+        client: AsyncClient,
+        worker_headers: dict[str, str],
+        admin_headers: dict[str, str],
+        db_session: AsyncSession,
+        test_client: Client,
+    ):
+        ticket = Ticket(
+            title="Claim me",
+            description="Claim test",
+            client_id=test_client.id,
+            priority=TicketPriority.URGENT,
+            due_at=datetime(1999, 1, 1),
+        )
+        db_session.add(ticket)
+        await db_session.commit()
+
+        response = await client.post("/tickets/claim", headers=admin_headers)
+        assert response.status_code == 403
+
+        response = await client.post("/tickets/claim", headers=worker_headers)
+        assert response.status_code == 200
+        assert response.json()["id"] == ticket.id
+        assert response.json()["status"] == "in_progress"
+        assert response.json()["assigned_worker"]["email"] == "worker@test.com"
+
+        for _ in range(100):
+            response = await client.post("/tickets/claim", headers=worker_headers)
+            if response.status_code != 200:
+                break
+        assert response.status_code == 404
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -74,6 +76,116 @@ class TestTicketsRouter:
         for ticket in data["tickets"]:
             assert ticket["assigned_worker_full_name"] is not None
 
+    async def test_list_tickets_date_filters(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession, test_client: Client
+    ):
+        db_session.add_all(
+            Ticket(
+                title=f"Repair {day}",
+                description="Date filter test",
+                status=TicketStatus.NEW,
+                client_id=test_client.id,
+                created_at=datetime(2024, 3, day),
+                updated_at=datetime(2024, 3, day + 1),
+            )
+            for day in (1, 10, 20)
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            "/tickets",
+            headers=admin_headers,
+            params={"created_from": "2024-03-01T00:00:00", "created_to": "2024-03-20T00:00:00"},
+        )
+        assert response.status_code == 200
+        assert [t["title"] for t in response.json()["tickets"]] == ["Repair 10", "Repair 1"]
+
+        response = await client.get(
+            "/tickets", headers=admin_headers, params={"updated_since": "2024-03-11T02:00:00+02:00"}
+        )
+        assert response.status_code == 200
+        assert [t["title"] for t in response.json()["tickets"]] == ["Repair 20", "Repair 10"]
+
+    async def test_list_tickets_query_filter(
+        self,
+        client: AsyncClient,
+        admin_headers: dict[str, str],
+        db_session: AsyncSession,
+        test_client: Client,
+        worker_user: User,
+    ):
+        db_session.add_all(
+            [
+                Ticket(title="Boiler leak", description="Query", status=TicketStatus.NEW, client_id=test_client.id),
+                Ticket(
+                    title="Boiler service",
+                    description="Query",
+                    status=TicketStatus.DONE,
+                    client_id=test_client.id,
+                    assigned_worker_id=worker_user.id,
+                ),
+                Ticket(title="Sink", description="Query", status=TicketStatus.NEW, client_id=test_client.id),
+            ]
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            "/tickets", headers=admin_headers, params={"q": 'boiler -status:done worker:none client:"test client"'}
+        )
+        assert response.status_code == 200
+        assert [t["title"] for t in response.json()["tickets"]] == ["Boiler leak"]
+
+        response = await client.get("/tickets", headers=admin_headers, params={"q": "status:closed"})
+        assert response.status_code == 400
+        assert response.json()["error"] == "InvalidTicketQueryError"
+
+    async def test_tag_filters_and_facets(
+        self, client: AsyncClient, admin_headers: dict[str, str], db_session: AsyncSession, test_client: Client
+    ):
+        tickets = [
+            Ticket(title=title, description="Tag filter test", client_id=test_client.id, tags=tags)
+            for title, tags in [
+                ("Boiler leak", ["device:boiler", "urgency:high"]),
+                ("Boiler service", ["device:boiler"]),
+                ("Sink", []),
+            ]
+        ]
+        db_session.add_all(tickets)
+        await db_session.commit()
+
+        response = await client.patch(
+            f"/tickets/{tickets[2].id}", headers=admin_headers, json={"tags": [" Device:Sink", "urgency:high"]}
+        )
+        assert response.status_code == 200
+        assert response.json()["tags"] == ["device:sink", "urgency:high"]
+
+        response = await client.get(
+            "/tickets", headers=admin_headers, params={"tag": ["device:boiler", "urgency:high"]}
+        )
+        assert [t["title"] for t in response.json()["tickets"]] == ["Boiler leak"]
+        assert response.json()["tickets"][0]["tags"] == ["device:boiler", "urgency:high"]
+
+        response = await client.get(
+            "/tickets", headers=admin_headers, params={"tag": ["DEVICE:SINK", "urgency:high"], "tag_match": "any"}
+        )
+        assert sorted(t["title"] for t in response.json()["tickets"]) == ["Boiler leak", "Sink"]
+
+        response = await client.get(
+            "/tickets", headers=admin_headers, params={"q": "tag:device:boiler -tag:urgency:high"}
+        )
+        assert [t["title"] for t in response.json()["tickets"]] == ["Boiler service"]
+
+        response = await client.get("/tickets/facets", headers=admin_headers, params={"tag": "urgency:high"})
+        assert response.status_code == 200
+        assert response.json()["tags"] == [
+            {"tag": "urgency:high", "count": 2},
+            {"tag": "device:boiler", "count": 1},
+            {"tag": "device:sink", "count": 1},
+        ]
+
+        response = await client.get("/tickets", headers=admin_headers, params={"tag": "not a tag"})
+        assert response.status_code == 422
+
     async def test_get_ticket_success(self, client: AsyncClient, admin_headers: dict[str, str], test_ticket: Ticket):
         response = await client.get(f"/tickets/{test_ticket.id}", headers=admin_headers)
 
@@ -113,6 +225,68 @@ class TestTicketsRouter:
         data = response.json()
         assert data["status"] == "in_progress"
 
+    async def test_update_ticket_status_invalid_transition(
+        self, client: AsyncClient, worker_headers: dict[str, str], test_ticket: Ticket
+    ):
+        response = await client.patch(
+            f"/tickets/{test_ticket.id}/status",
+            headers=worker_headers,
+            json={"status": "done"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["error"] == "InvalidStatusTransitionError"
+
+    async def test_update_ticket_status_reopen(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_ticket: Ticket
+    ):
+        for status in ("in_progress", "done", "in_progress"):
+            response = await client.patch(
+                f"/tickets/{test_ticket.id}/status",
+                headers=admin_headers,
+                json={"status": status},
+            )
+            assert response.status_code == 200
+            assert response.json()["status"] == status
+
+    async def test_update_ticket_does_not_change_status(
+        self, client: AsyncClient, admin_headers: dict[str, str], test_ticket: Ticket
+    ):
+        response = await client.patch(
+            f"/tickets/{test_ticket.id}",
+            headers=admin_headers,
+            json={"title": "Renamed ticket", "status": "done"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed ticket"
+        assert response.json()["status"] == "new"
+
+    async def test_update_ticket_status_unassigned_worker_forbidden(
+        self, client: AsyncClient, worker_headers: dict[str, str], db_session: AsyncSession, test_client: Client
+    ):
+        ticket = Ticket(
+            title="Someone Else's Ticket",
+            description="Description",
+            status=TicketStatus.NEW,
+            client_id=test_client.id,
+        )
+        db_session.add(ticket)
+        await db_session.commit()
+
+        response = await client.patch(
+            f"/tickets/{ticket.id}/status",
+            headers=worker_headers,
+            json={"status": "in_progress"},
+        )
+
+        assert response.status_code == 403
+
+    async def test_update_ticket_status_not_found(self, client: AsyncClient, admin_headers: dict[str, str]):
+        response = await client.patch("/tickets/99999/status", headers=admin_headers, json={"status": "in_progress"})
+
+        assert response.status_code == 404
+
     async def test_assign_ticket_admin(
         self,
         client: AsyncClient,
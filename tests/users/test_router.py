@@ -1,6 +1,10 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.clients.models import Client
+from src.tickets.models import Ticket, TicketStatus
 from src.users.models import User
 
 
@@ -90,3 +94,29 @@ class TestUsersRouter:
 
         get_response = await client.get(f"/users/{worker_user.id}", headers=admin_headers)
         assert get_response.status_code == 404
+
+    async def test_delete_worker_unassigns_tickets(
+        self, client: AsyncClient, admin_headers: dict[str, str], worker_user: User, db_session: AsyncSession
+    ):
+        repair_client = Client(full_name="Ticket Owner", email="owner@test.com", phone="+1234567890")
+        db_session.add(repair_client)
+        await db_session.flush()
+        ticket = Ticket(
+            title="Assigned Repair",
+            description="Assigned to the deleted worker",
+            status=TicketStatus.IN_PROGRESS,
+            client_id=repair_client.id,
+            assigned_worker_id=worker_user.id,
+        )
+        db_session.add(ticket)
+        await db_session.commit()
+
+        response = await client.delete(f"/users/{worker_user.id}", headers=admin_headers)
+
+        assert response.status_code == 204
+
+        remaining = await db_session.scalar(
+            select(Ticket).where(Ticket.id == ticket.id).execution_options(populate_existing=True)
+        )
+        assert remaining is not None
+        assert remaining.assigned_worker_id is None